@@ -1,238 +1,389 @@
-"""
-LayoutController
-Handle furniture layout prediction and file uploads
-"""
-from flask import request, jsonify, send_from_directory
-from werkzeug.utils import secure_filename
-from datetime import datetime
-import os
-from config import Config
-
-
-class LayoutController:
-    """Controller untuk layout prediction dan upload"""
-    
-    @staticmethod
-    def allowed_file(filename):
-        """Check if file extension is allowed"""
-        return '.' in filename and \
-               filename.rsplit('.', 1)[1].lower() in Config.ALLOWED_EXTENSIONS
-    
-    @staticmethod
-    def predict_batch():
-        """
-        Predict furniture layout positions using ML model
-        POST /api/layout/predict
-        Body: {items: [], room_type: "", floor_data: {}}
-        """
-        try:
-            # Check if ML dependencies are available
-            try:
-                from app.services.LayoutService import LayoutService
-            except ImportError as import_error:
-                return jsonify({
-                    "status": "error",
-                    "message": "ML prediction tidak tersedia di environment ini. Paket ML (numpy, pandas, scikit-learn) tidak terinstall.",
-                    "suggestion": "Gunakan endpoint /api/layout/auto-place untuk simple layout atau deploy ML service terpisah.",
-                    "available_endpoints": [
-                        "/api/layout/recommendations",
-                        "/api/layout/auto-place (SimpleLayoutService - tanpa ML)"
-                    ]
-                }), 503
-            
-            data = request.get_json()
-            items = data.get("items", [])
-            room_type = data.get("room_type", "living_room")
-            floor_data = data.get("floor_data", None)
-            
-            if not items:
-                return jsonify({
-                    "status": "error",
-                    "message": "No items provided"
-                }), 400
-            
-            # Initialize layout service (will load ML model)
-            layout_service = LayoutService()
-            
-            # Predict positions using ML + collision detection
-            results = layout_service.predict_batch(items, room_type, floor_data)
-            
-            return jsonify({
-                "status": "success",
-                "data": results,
-                "room_type": room_type,
-                "total_placed": len(results),
-                "model_used": layout_service.model is not None
-            })
-            
-        except Exception as e:
-            import traceback
-            print(f"Predict batch error: {e}")
-            print(traceback.format_exc())
-            return jsonify({
-                "status": "error",
-                "message": str(e)
-            }), 500
-    
-    @staticmethod
-    def get_floor_recommendations():
-        """
-        Get furniture recommendations for a floor
-        POST /api/layout/recommendations
-        Body: {floor: 1, floor_data: {}}
-        """
-        try:
-            data = request.get_json()
-            floor_number = data.get("floor", 1)
-            
-            # Default recommendations per floor
-            recommendations_map = {
-                1: [
-                    {"name": "Sofa", "category": "seating"},
-                    {"name": "Coffee Table", "category": "tables"},
-                    {"name": "TV Stand", "category": "storage"},
-                ],
-                2: [
-                    {"name": "Bed", "category": "bedroom"},
-                    {"name": "Wardrobe", "category": "storage"},
-                    {"name": "Nightstand", "category": "tables"},
-                ],
-                3: [
-                    {"name": "Dining Table", "category": "tables"},
-                    {"name": "Dining Chair", "category": "seating"},
-                ]
-            }
-            
-            recommendations = recommendations_map.get(floor_number, [])
-            
-            return jsonify({
-                "status": "success",
-                "data": recommendations
-            })
-            
-        except Exception as e:
-            return jsonify({
-                "status": "error",
-                "message": str(e)
-            }), 500
-    
-    @staticmethod
-    def reset_layout():
-        """
-        Reset layout
-        POST /api/layout/reset
-        """
-        return jsonify({
-            "status": "success",
-            "message": "Layout reset"
-        })
-    
-    @staticmethod
-    def auto_place_furniture():
-        """
-        Automatically place all furniture with optimal positioning
-        LIMITED MODE: Max 4-5 items with size and floor constraints
-        POST /api/layout/auto-place
-        Body: {room_width: 17.0, room_height: 11.0, use_ai: true, max_items: 5}
-        """
-        try:
-            # AutoLayoutService only needs numpy (not full ML stack)
-            try:
-                from app.services.AutoLayoutService import AutoLayoutService
-            except ImportError:
-                # Fallback to SimpleLayoutService (no ML dependencies)
-                from app.services.SimpleLayoutService import SimpleLayoutService
-                
-                data = request.get_json() or {}
-                room_width = data.get("room_width", 17.0)
-                room_height = data.get("room_height", 11.0)
-                
-                result = SimpleLayoutService.auto_place_all_furniture(room_width, room_height)
-                result["algorithm"] = "SimpleLayoutService (No ML - Fallback)"
-                result["model_used"] = False
-                
-                return jsonify(result)
-            
-            data = request.get_json() or {}
-            room_width = data.get("room_width", 17.0)
-            room_height = data.get("room_height", 11.0)
-            use_ai = data.get("use_ai", False)  # Default: use Simple (deterministic)
-            max_items = data.get("max_items", 5)  # Max items limit from frontend
-            
-            print(f"\n🔧 Auto Place Request - Limited Mode")
-            print(f"   Room: {room_width}m × {room_height}m")
-            print(f"   Max Items: {max_items}")
-            print(f"   Use AI: {use_ai}")
-            
-            # Use AutoLayoutService (has built-in limits)
-            result = AutoLayoutService.auto_place_all_furniture(room_width, room_height)
-            
-            # Add algorithm info
-            result["algorithm"] = "AutoLayoutService (Limited Mode)"
-            result["model_used"] = False
-            
-            return jsonify(result)
-            
-        except Exception as e:
-            import traceback
-            print(f"Auto place error: {e}")
-            print(traceback.format_exc())
-            return jsonify({
-                "status": "error",
-                "message": str(e)
-            }), 500
-    
-    @staticmethod
-    def upload_news_image():
-        """
-        Upload image for news
-        POST /api/news/upload-image
-        """
-        try:
-            if 'image' not in request.files:
-                return jsonify({
-                    "status": "error",
-                    "message": "No file uploaded"
-                }), 400
-            
-            file = request.files['image']
-            
-            if file.filename == '':
-                return jsonify({
-                    "status": "error",
-                    "message": "No file selected"
-                }), 400
-            
-            if file and LayoutController.allowed_file(file.filename):
-                filename = secure_filename(file.filename)
-                # Add timestamp to make filename unique
-                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-                filename = f"{timestamp}_{filename}"
-                filepath = os.path.join(Config.UPLOAD_FOLDER, filename)
-                file.save(filepath)
-                
-                # Return URL path
-                image_url = f"http://localhost:5000/static/uploads/news/{filename}"
-                return jsonify({
-                    "status": "success",
-                    "image_url": image_url
-                })
-            
-            return jsonify({
-                "status": "error",
-                "message": "Invalid file type. Allowed: png, jpg, jpeg, gif, webp"
-            }), 400
-            
-        except Exception as e:
-            return jsonify({
-                "status": "error",
-                "message": str(e)
-            }), 500
-    
-    @staticmethod
-    def serve_news_image(filename):
-        """
-        Serve uploaded news images
-        GET /static/uploads/news/<filename>
-        """
-        return send_from_directory(Config.UPLOAD_FOLDER, filename)
+"""
+LayoutController
+Handle furniture layout prediction and file uploads
+"""
+from flask import request, jsonify, send_from_directory
+from werkzeug.utils import secure_filename
+from datetime import datetime
+import os
+from config import Config
+
+
+class LayoutController:
+    """Controller untuk layout prediction dan upload"""
+    
+    @staticmethod
+    def allowed_file(filename):
+        """Check if file extension is allowed"""
+        return '.' in filename and \
+               filename.rsplit('.', 1)[1].lower() in Config.ALLOWED_EXTENSIONS
+    
+    @staticmethod
+    def predict_batch():
+        """
+        Predict furniture layout positions using ML model
+        POST /api/layout/predict
+        Body: {items: [], room_type: "", floor_data: {}}
+        """
+        try:
+            # Check if ML dependencies are available
+            try:
+                from app.services.LayoutService import LayoutService
+            except ImportError as import_error:
+                return jsonify({
+                    "status": "error",
+                    "message": "ML prediction tidak tersedia di environment ini. Paket ML (numpy, pandas, scikit-learn) tidak terinstall.",
+                    "suggestion": "Gunakan endpoint /api/layout/auto-place untuk simple layout atau deploy ML service terpisah.",
+                    "available_endpoints": [
+                        "/api/layout/recommendations",
+                        "/api/layout/auto-place (SimpleLayoutService - tanpa ML)"
+                    ]
+                }), 503
+            
+            data = request.get_json()
+            items = data.get("items", [])
+            room_type = data.get("room_type", "living_room")
+            floor_data = data.get("floor_data", None)
+            
+            if not items:
+                return jsonify({
+                    "status": "error",
+                    "message": "No items provided"
+                }), 400
+            
+            # Initialize layout service (will load ML model)
+            layout_service = LayoutService()
+            
+            # Predict positions using ML + collision detection
+            results = layout_service.predict_batch(items, room_type, floor_data)
+            
+            return jsonify({
+                "status": "success",
+                "data": results,
+                "room_type": room_type,
+                "total_placed": sum(1 for result in results if result.get("placed", True)),
+                "model_used": layout_service.model is not None
+            })
+            
+        except Exception as e:
+            import traceback
+            print(f"Predict batch error: {e}")
+            print(traceback.format_exc())
+            return jsonify({
+                "status": "error",
+                "message": str(e)
+            }), 500
+    
+    @staticmethod
+    def model_stats():
+        """
+        Loaded model artifacts (load time, memory size, hits)
+        GET /api/layout/models
+        """
+        try:
+            from app.services.ModelRegistry import ModelRegistry
+            
+            return jsonify({
+                "status": "success",
+                "data": ModelRegistry.stats()
+            })
+            
+        except Exception as e:
+            return jsonify({
+                "status": "error",
+                "message": str(e)
+            }), 500
+    
+    @staticmethod
+    def memory_stats():
+        """
+        Shared vs private bytes worker process ini (+ model artifact pages yang di-mmap)
+        GET /api/layout/memory
+        """
+        try:
+            from app.services.MemoryReport import MemoryReport
+            
+            return jsonify({
+                "status": "success",
+                "data": MemoryReport.report()
+            })
+            
+        except Exception as e:
+            return jsonify({
+                "status": "error",
+                "message": str(e)
+            }), 500
+    
+    @staticmethod
+    def cache_stats():
+        """
+        Auto-place result cache statistics (hit/miss)
+        GET /api/layout/cache
+        """
+        try:
+            from app.services.LayoutCache import LayoutCache
+            
+            return jsonify({
+                "status": "success",
+                "data": LayoutCache.stats()
+            })
+            
+        except Exception as e:
+            return jsonify({
+                "status": "error",
+                "message": str(e)
+            }), 500
+    
+    @staticmethod
+    def get_floor_recommendations():
+        """
+        Get furniture recommendations for a floor
+        POST /api/layout/recommendations
+        Body: {floor: 1, floor_data: {}}
+        """
+        try:
+            data = request.get_json()
+            floor_number = data.get("floor", 1)
+            
+            # Default recommendations per floor
+            recommendations_map = {
+                1: [
+                    {"name": "Sofa", "category": "seating"},
+                    {"name": "Coffee Table", "category": "tables"},
+                    {"name": "TV Stand", "category": "storage"},
+                ],
+                2: [
+                    {"name": "Bed", "category": "bedroom"},
+                    {"name": "Wardrobe", "category": "storage"},
+                    {"name": "Nightstand", "category": "tables"},
+                ],
+                3: [
+                    {"name": "Dining Table", "category": "tables"},
+                    {"name": "Dining Chair", "category": "seating"},
+                ]
+            }
+            
+            recommendations = recommendations_map.get(floor_number, [])
+            
+            return jsonify({
+                "status": "success",
+                "data": recommendations
+            })
+            
+        except Exception as e:
+            return jsonify({
+                "status": "error",
+                "message": str(e)
+            }), 500
+    
+    @staticmethod
+    def reset_layout():
+        """
+        Reset layout
+        POST /api/layout/reset
+        """
+        return jsonify({
+            "status": "success",
+            "message": "Layout reset"
+        })
+    
+    @staticmethod
+    def auto_place_furniture():
+        """
+        Automatically place all furniture with optimal positioning
+        LIMITED MODE: Max 4-5 items with size and floor constraints
+        POST /api/layout/auto-place
+        Body: {room_width: 17.0, room_height: 11.0, use_ai: true, max_items: 5,
+               multi_start: 8, seed: 0, optimize: false, max_ms: 200,
+               zone_engines: {"dining": "maxrects"}, solver: false, max_nodes: 20000,
+               composite_groups: false}
+        zone_engines -> placement engine per zone ("grid" default, "maxrects" untuk zone padat)
+        composite_groups -> meja + kursi ditempatkan sebagai satu set (fallback per item jika tidak muat)
+        solver -> backtracking constraint solver: layout lengkap di min spacing atau status
+                  "infeasible" / "budget_exhausted" (budget max_nodes + max_ms)
+        multi_start > 1 -> K placement paralel (process pool), return layout terbaik
+        optimize -> greedy + simulated annealing, return layout terbaik dalam max_ms
+        solver / optimize / multi_start tidak bisa digabung (400 jika lebih dari satu)
+        """
+        try:
+            # AutoLayoutService only needs numpy (not full ML stack)
+            try:
+                from app.services.AutoLayoutService import AutoLayoutService
+            except ImportError:
+                # Fallback to SimpleLayoutService (no ML dependencies)
+                from app.services.SimpleLayoutService import SimpleLayoutService
+                
+                data = request.get_json() or {}
+                room_width = data.get("room_width", 17.0)
+                room_height = data.get("room_height", 11.0)
+                
+                result = SimpleLayoutService.auto_place_all_furniture(room_width, room_height)
+                result["algorithm"] = "SimpleLayoutService (No ML - Fallback)"
+                result["model_used"] = False
+                
+                return jsonify(result)
+            
+            data = request.get_json() or {}
+            room_width = data.get("room_width", 17.0)
+            room_height = data.get("room_height", 11.0)
+            use_ai = data.get("use_ai", False)  # Default: use Simple (deterministic)
+            max_items = data.get("max_items", 5)  # Max items limit from frontend
+            
+            print(f"\n🔧 Auto Place Request - Limited Mode")
+            print(f"   Room: {room_width}m × {room_height}m")
+            print(f"   Max Items: {max_items}")
+            print(f"   Use AI: {use_ai}")
+            
+            # Parameter numerik divalidasi di depan: input salah -> 400, bukan 500 di tengah search
+            try:
+                multi_start = int(data.get("multi_start", 1) or 1)
+                seed = int(data.get("seed", 0) or 0)
+                max_nodes = int(data["max_nodes"]) if data.get("max_nodes") is not None else None
+                max_ms = float(data["max_ms"]) if data.get("max_ms") is not None else None
+            except (TypeError, ValueError):
+                return jsonify({
+                    "status": "error",
+                    "message": "multi_start, seed, max_nodes and max_ms must be numbers"
+                }), 400
+            if (max_nodes is not None and max_nodes < 0) or \
+                    (max_ms is not None and not 0 <= max_ms < float("inf")):
+                return jsonify({
+                    "status": "error",
+                    "message": "max_nodes and max_ms must be non-negative and finite"
+                }), 400
+            
+            # solver / optimize / multi_start adalah mode search yang berbeda, hanya satu per request
+            modes = [name for name, enabled in (
+                ("solver", data.get("solver")), ("optimize", data.get("optimize")),
+                ("multi_start", multi_start > 1)
+            ) if enabled]
+            if len(modes) > 1:
+                return jsonify({
+                    "status": "error",
+                    "message": f"Only one of solver, optimize, multi_start can be used per request (got: {modes})"
+                }), 400
+            
+            config = AutoLayoutService.DEFAULT_CONFIG
+            zone_engines = data.get("zone_engines")
+            if zone_engines is not None and not isinstance(zone_engines, dict):
+                return jsonify({
+                    "status": "error",
+                    "message": 'zone_engines must be an object, e.g. {"dining": "maxrects"}'
+                }), 400
+            if zone_engines:
+                invalid = {zone: engine for zone, engine in zone_engines.items()
+                           if engine not in AutoLayoutService.ZONE_ENGINES}
+                if invalid:
+                    return jsonify({
+                        "status": "error",
+                        "message": f"Unknown zone engine: {invalid}. Available: {list(AutoLayoutService.ZONE_ENGINES)}"
+                    }), 400
+                config = config.with_zone_engines(zone_engines)
+                print(f"   Zone engines: {zone_engines}")
+            
+            if data.get("composite_groups"):
+                config = config.with_composite_groups(True)
+                print("   Composite groups: on")
+            
+            if data.get("solver"):
+                from app.services.ConstraintSolver import ConstraintSolver
+                
+                max_nodes = ConstraintSolver.DEFAULT_MAX_NODES if max_nodes is None else max_nodes
+                max_ms = ConstraintSolver.DEFAULT_MAX_MS if max_ms is None else max_ms
+                print(f"   Solver: backtracking CSP, budget {max_nodes} nodes / {max_ms:.0f}ms")
+                result = ConstraintSolver.solve_layout(
+                    room_width, room_height, max_nodes=max_nodes, max_ms=max_ms, config=config
+                )
+                result["algorithm"] = "AutoLayoutService (Limited Mode, Constraint Solver)"
+            elif data.get("optimize"):
+                from app.services.AnnealingOptimizer import AnnealingOptimizer
+                
+                max_ms = AnnealingOptimizer.DEFAULT_MAX_MS if max_ms is None else max_ms
+                print(f"   Optimize: simulated annealing, budget {max_ms:.0f}ms")
+                result = AnnealingOptimizer.optimize_layout(
+                    room_width, room_height, max_ms=max_ms, seed=seed,
+                    config=config
+                )
+                result["algorithm"] = "AutoLayoutService (Limited Mode, Simulated Annealing)"
+            elif multi_start > 1:
+                from app.services.MultiStartLayout import MultiStartLayout
+                
+                print(f"   Multi-start: {multi_start} runs")
+                result = MultiStartLayout.run(
+                    room_width, room_height, runs=multi_start, seed=seed,
+                    config=config
+                )
+                result["algorithm"] = "AutoLayoutService (Limited Mode, Multi-start)"
+            else:
+                # Use AutoLayoutService (has built-in limits)
+                result = AutoLayoutService.auto_place_all_furniture(room_width, room_height, config=config)
+                result["algorithm"] = "AutoLayoutService (Limited Mode)"
+            
+            # Add algorithm info
+            result["model_used"] = False
+            
+            return jsonify(result)
+            
+        except Exception as e:
+            import traceback
+            print(f"Auto place error: {e}")
+            print(traceback.format_exc())
+            return jsonify({
+                "status": "error",
+                "message": str(e)
+            }), 500
+    
+    @staticmethod
+    def upload_news_image():
+        """
+        Upload image for news
+        POST /api/news/upload-image
+        """
+        try:
+            if 'image' not in request.files:
+                return jsonify({
+                    "status": "error",
+                    "message": "No file uploaded"
+                }), 400
+            
+            file = request.files['image']
+            
+            if file.filename == '':
+                return jsonify({
+                    "status": "error",
+                    "message": "No file selected"
+                }), 400
+            
+            if file and LayoutController.allowed_file(file.filename):
+                filename = secure_filename(file.filename)
+                # Add timestamp to make filename unique
+                timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+                filename = f"{timestamp}_{filename}"
+                filepath = os.path.join(Config.UPLOAD_FOLDER, filename)
+                file.save(filepath)
+                
+                # Return URL path
+                image_url = f"http://localhost:5000/static/uploads/news/{filename}"
+                return jsonify({
+                    "status": "success",
+                    "image_url": image_url
+                })
+            
+            return jsonify({
+                "status": "error",
+                "message": "Invalid file type. Allowed: png, jpg, jpeg, gif, webp"
+            }), 400
+            
+        except Exception as e:
+            return jsonify({
+                "status": "error",
+                "message": str(e)
+            }), 500
+    
+    @staticmethod
+    def serve_news_image(filename):
+        """
+        Serve uploaded news images
+        GET /static/uploads/news/<filename>
+        """
+        return send_from_directory(Config.UPLOAD_FOLDER, filename)
@@ -1,23 +1,23 @@
-"""
-Controllers Package
-Export all controllers
-"""
-from app.controllers.NewsController import NewsController
-from app.controllers.CMSController import CMSController
-from app.controllers.QuestionController import QuestionController
-from app.controllers.AuthController import AuthController
-from app.controllers.FurnitureController import FurnitureController
-from app.controllers.ContactController import ContactController
-from app.controllers.HouseLayoutController import HouseLayoutController
-from app.controllers.SocialMediaController import SocialMediaController
-
-__all__ = [
-    'NewsController',
-    'CMSController',
-    'QuestionController',
-    'AuthController',
-    'FurnitureController',
-    'ContactController',
-    'HouseLayoutController',
-    'SocialMediaController'
-]
+"""
+Controllers Package
+Export all controllers
+"""
+from app.controllers.NewsController import NewsController
+from app.controllers.CMSController import CMSController
+from app.controllers.QuestionController import QuestionController
+from app.controllers.AuthController import AuthController
+from app.controllers.FurnitureController import FurnitureController
+from app.controllers.ContactController import ContactController
+from app.controllers.HouseLayoutController import HouseLayoutController
+from app.controllers.SocialMediaController import SocialMediaController
+
+__all__ = [
+    'NewsController',
+    'CMSController',
+    'QuestionController',
+    'AuthController',
+    'FurnitureController',
+    'ContactController',
+    'HouseLayoutController',
+    'SocialMediaController'
+]
@@ -1,414 +1,480 @@
-"""
-AI-Powered Layout Service using Random Forest
-Load trained model untuk prediksi posisi optimal furniture
-"""
-
-import numpy as np
-import pickle
-from typing import Dict, List, Optional
-import os
-
-class AILayoutService:
-    """AI Layout Service dengan Random Forest model"""
-    
-    # Layout dimensions
-    ROOM_WIDTH = 17.0
-    ROOM_HEIGHT = 11.0
-    
-    # Zones
-    ZONES = {
-        "living": {"x_min": 1.0, "x_max": 7.5, "y_min": 1.0, "y_max": 5.5},
-        "dining": {"x_min": 9.0, "x_max": 15.5, "y_min": 1.0, "y_max": 5.5},
-        "outdoor": {"x_min": 1.5, "x_max": 15.5, "y_min": 7.0, "y_max": 9.5},
-        "decoration": {"x_min": 1.0, "x_max": 16.0, "y_min": 1.0, "y_max": 10.0}
-    }
-    
-    # Obstacles
-    OBSTACLES = [
-        {"name": "Tangga Up L1", "x": 12.4, "y": 1.6, "width": 1.6, "height": 2.8},
-        {"name": "Tangga Down L2", "x": 9.0, "y": 7.6, "width": 2.0, "height": 1.6},
-        {"name": "Tangga Up L2", "x": 11.6, "y": 7.6, "width": 2.0, "height": 1.6},
-        {"name": "Column 1", "x": 8.5, "y": 5.0, "width": 0.36, "height": 0.36},
-        {"name": "Column 2", "x": 15.0, "y": 5.0, "width": 0.36, "height": 0.36},
-        {"name": "Column 3", "x": 8.5, "y": 6.5, "width": 0.36, "height": 0.36},
-        {"name": "Column 4", "x": 15.0, "y": 6.5, "width": 0.36, "height": 0.36}
-    ]
-    
-    # Spacing (OPTIMIZED for safety and NO OVERLAP!)
-    MIN_SPACING = 0.8  # 80cm between furniture - AMAN & RAPIH
-    WALL_MARGIN = 0.5  # 50cm from walls - lebih aman
-    OBSTACLE_MARGIN = 0.7  # 70cm from obstacles - hindari tangga/kolom
-    
-    # Furniture catalog
-    FURNITURE_CATALOG = {
-        "SOFA 3 Seat": {"panjang": 2.6, "lebar": 1.0, "zone": "living", "quantity": 4, "priority": 1},
-        "SOFA 1 Seat": {"panjang": 1.14, "lebar": 1.0, "zone": "living", "quantity": 4, "priority": 2},
-        "Meja Makan": {"panjang": 2.4, "lebar": 1.0, "zone": "dining", "quantity": 2, "priority": 3},
-        "Kursi Makan": {"panjang": 0.46, "lebar": 0.75, "zone": "dining", "quantity": 8, "priority": 8},
-        "Lemari Piring": {"panjang": 1.2, "lebar": 0.6, "zone": "dining", "quantity": 2, "priority": 5},
-        "Lukisan Besar": {"panjang": 4.0, "lebar": 1.5, "zone": "decoration", "quantity": 1, "priority": 4},
-        "Lukisan Kecil": {"panjang": 0.6, "lebar": 0.6, "zone": "decoration", "quantity": 3, "priority": 9},
-        "Stand Lukisan": {"panjang": 0.6, "lebar": 0.75, "zone": "decoration", "quantity": 3, "priority": 10},
-        "Meja Teras": {"panjang": 2.4, "lebar": 1.0, "zone": "outdoor", "quantity": 2, "priority": 6},
-        "Kursi Teras": {"panjang": 0.46, "lebar": 0.75, "zone": "outdoor", "quantity": 4, "priority": 11},
-        "Rak Display": {"panjang": 2.0, "lebar": 0.5, "zone": "decoration", "quantity": 2, "priority": 7},
-        "Pot Bunga Small": {"panjang": 0.36, "lebar": 0.36, "zone": "decoration", "quantity": 4, "priority": 12},
-        "Pot Bunga Medium": {"panjang": 0.43, "lebar": 0.43, "zone": "decoration", "quantity": 3, "priority": 13},
-        "Pot Bunga Large": {"panjang": 0.6, "lebar": 0.6, "zone": "decoration", "quantity": 3, "priority": 14},
-        "Standing AC": {"panjang": 0.5, "lebar": 0.4, "zone": "living", "quantity": 2, "priority": 15}
-    }
-    
-    # Model instance (loaded once)
-    _model = None
-    _model_loaded = False
-    
-    @staticmethod
-    def load_model(model_path: str = None):
-        """Load trained Random Forest model"""
-        if AILayoutService._model_loaded:
-            return AILayoutService._model
-        
-        # Try multiple locations
-        if model_path is None:
-            possible_paths = [
-                os.path.join(os.path.dirname(__file__), "furniture_layout_model.pkl"),  # Same dir as service
-                "furniture_layout_model.pkl",  # Root directory
-                os.path.join("app", "services", "furniture_layout_model.pkl")  # Explicit path
-            ]
-        else:
-            possible_paths = [model_path]
-        
-        for path in possible_paths:
-            try:
-                if os.path.exists(path):
-                    with open(path, 'rb') as f:
-                        AILayoutService._model = pickle.load(f)
-                    AILayoutService._model_loaded = True
-                    print(f"✅ AI Model loaded from {path}")
-                    print(f"   Model: Random Forest with {AILayoutService._model.n_estimators} trees")
-                    print(f"   Accuracy: 99.87% (Test R² Score)")
-                    return AILayoutService._model
-            except Exception as e:
-                continue
-        
-        print(f"⚠️ AI Model not found. Checked locations:")
-        for path in possible_paths:
-            print(f"   - {path}")
-        print(f"   Run 'python app/services/AILayoutTrainer.py' to train the model")
-        return None
-    
-    @staticmethod
-    def check_collision(x1: float, y1: float, w1: float, h1: float,
-                       x2: float, y2: float, w2: float, h2: float,
-                       spacing: float = 0.8) -> bool:
-        """
-        AABB collision detection with spacing buffer
-        DOUBLE CHECK: actual overlap + spacing requirement
-        """
-        # Check 1: Actual AABB overlap (MUST NOT happen!)
-        actual_overlap = not (x1 + w1 <= x2 or x2 + w2 <= x1 or 
-                             y1 + h1 <= y2 or y2 + h2 <= y1)
-        
-        if actual_overlap:
-            return True  # DEFINITE collision!
-        
-        # Check 2: Spacing requirement
-        spacing_violation = not (x1 + w1 + spacing < x2 or 
-                                x2 + w2 + spacing < x1 or 
-                                y1 + h1 + spacing < y2 or 
-                                y2 + h2 + spacing < y1)
-        
-        return spacing_violation
-    
-    @staticmethod
-    def is_valid_position(x: float, y: float, panjang: float, lebar: float,
-                         zone_name: str, placed_items: List[Dict]) -> bool:
-        """Validate position (zone + obstacles + furniture)"""
-        zone = AILayoutService.ZONES.get(zone_name)
-        if not zone:
-            return False
-        
-        # Check zone boundaries
-        margin = AILayoutService.WALL_MARGIN
-        if not (x >= zone["x_min"] + margin and 
-                x + panjang <= zone["x_max"] - margin and
-                y >= zone["y_min"] + margin and 
-                y + lebar <= zone["y_max"] - margin):
-            return False
-        
-        # Check obstacles
-        for obstacle in AILayoutService.OBSTACLES:
-            if AILayoutService.check_collision(
-                x, y, panjang, lebar,
-                obstacle["x"], obstacle["y"], obstacle["width"], obstacle["height"],
-                spacing=AILayoutService.OBSTACLE_MARGIN
-            ):
-                return False
-        
-        # Check placed furniture
-        for item in placed_items:
-            if AILayoutService.check_collision(
-                x, y, panjang, lebar,
-                item["x"], item["y"], item["panjang"], item["lebar"],
-                spacing=AILayoutService.MIN_SPACING
-            ):
-                return False
-        
-        return True
-    
-    @staticmethod
-    def calculate_features(x: float, y: float, panjang: float, lebar: float,
-                          zone_name: str, placed_items: List[Dict],
-                          furniture_type: str) -> List[float]:
-        """Calculate features untuk model prediction"""
-        zone = AILayoutService.ZONES.get(zone_name)
-        
-        features = [
-            x, y, panjang, lebar,
-            x + panjang, y + lebar,
-            x + panjang/2, y + lebar/2,
-        ]
-        
-        zone_center_x = (zone["x_min"] + zone["x_max"]) / 2
-        zone_center_y = (zone["y_min"] + zone["y_max"]) / 2
-        features.extend([
-            abs(x - zone_center_x),
-            abs(y - zone_center_y),
-            zone["x_max"] - zone["x_min"],
-            zone["y_max"] - zone["y_min"],
-        ])
-        
-        min_obstacle_dist = 999
-        for obstacle in AILayoutService.OBSTACLES:
-            dist = np.sqrt((x - obstacle["x"])**2 + (y - obstacle["y"])**2)
-            min_obstacle_dist = min(min_obstacle_dist, dist)
-        features.append(min_obstacle_dist)
-        
-        min_furniture_dist = 999
-        if placed_items:
-            for item in placed_items:
-                dist = np.sqrt((x - item["x"])**2 + (y - item["y"])**2)
-                min_furniture_dist = min(min_furniture_dist, dist)
-        features.append(min_furniture_dist)
-        
-        nearby_count = sum(1 for item in placed_items 
-                          if np.sqrt((x - item["x"])**2 + (y - item["y"])**2) < 2.0)
-        features.append(nearby_count)
-        
-        furniture_types = list(AILayoutService.FURNITURE_CATALOG.keys())
-        type_index = furniture_types.index(furniture_type) if furniture_type in furniture_types else -1
-        features.append(type_index)
-        
-        zone_mapping = {"living": 0, "dining": 1, "outdoor": 2, "decoration": 3}
-        features.append(zone_mapping.get(zone_name, -1))
-        
-        return features
-    
-    @staticmethod
-    def find_best_position_ai(furniture_name: str, furniture_data: Dict,
-                             placed_items: List[Dict], 
-                             model) -> Optional[Dict]:
-        """Find best position using AI model prediction"""
-        zone = furniture_data["zone"]
-        panjang = furniture_data["panjang"]
-        lebar = furniture_data["lebar"]
-        
-        zone_data = AILayoutService.ZONES[zone]
-        
-        # Generate candidate positions (FINE GRID untuk posisi optimal)
-        candidates = []
-        grid_size = 0.2  # 20cm grid - balance between coverage & speed
-        
-        x = zone_data["x_min"] + AILayoutService.WALL_MARGIN
-        while x <= zone_data["x_max"] - panjang - AILayoutService.WALL_MARGIN:
-            y = zone_data["y_min"] + AILayoutService.WALL_MARGIN
-            while y <= zone_data["y_max"] - lebar - AILayoutService.WALL_MARGIN:
-                # Check if valid (all 3 checks)
-                if AILayoutService.is_valid_position(x, y, panjang, lebar, zone, placed_items):
-                    candidates.append((round(x, 2), round(y, 2)))
-                y += grid_size
-            x += grid_size
-        
-        if not candidates:
-            return None
-        
-        # Predict quality scores using AI model
-        if model:
-            features_list = []
-            for x, y in candidates:
-                features = AILayoutService.calculate_features(
-                    x, y, panjang, lebar, zone, placed_items, furniture_name
-                )
-                features_list.append(features)
-            
-            # Predict scores
-            X = np.array(features_list)
-            scores = model.predict(X)
-            
-            # Get best position
-            best_idx = np.argmax(scores)
-            best_x, best_y = candidates[best_idx]
-            best_score = scores[best_idx]
-        else:
-            # Fallback: use first valid position
-            best_x, best_y = candidates[0]
-            best_score = 0.5
-        
-        return {
-            "nama": furniture_name,
-            "x": round(best_x, 2),
-            "y": round(best_y, 2),
-            "panjang": panjang,
-            "lebar": lebar,
-            "zone": zone,
-            "score": float(best_score),
-            "color": AILayoutService.get_zone_color(zone)
-        }
-    
-    @staticmethod
-    def get_zone_color(zone: str) -> str:
-        """Get color by zone"""
-        colors = {
-            "living": "#4A90E2",
-            "dining": "#E27D60",
-            "outdoor": "#85C88A",
-            "decoration": "#F4A259"
-        }
-        return colors.get(zone, "#95A5A6")
-    
-    @staticmethod
-    def auto_place_all_furniture(room_width: float = 17.0,
-                                room_height: float = 11.0) -> Dict:
-        """Auto place all furniture using AI model"""
-        
-        # Load model
-        model = AILayoutService.load_model()
-        
-        # Fallback to simple algorithm if no model
-        if not model:
-            print("⚠️ AI model not available, using deterministic algorithm")
-            from app.services.SimpleLayoutService import SimpleLayoutService
-            return SimpleLayoutService.auto_place_all_furniture(room_width, room_height)
-        
-        placed_items = []
-        failed_items = []
-        
-        # Sort by priority
-        sorted_furniture = sorted(
-            AILayoutService.FURNITURE_CATALOG.items(),
-            key=lambda x: x[1]["priority"]
-        )
-        
-        total_items = sum(f[1]["quantity"] for f in sorted_furniture)
-        placed_count = 0
-        
-        print(f"\n🎯 Starting AI Auto Layout for {total_items} items...")
-        
-        for furniture_name, furniture_data in sorted_furniture:
-            quantity = furniture_data["quantity"]
-            
-            for i in range(quantity):
-                result = AILayoutService.find_best_position_ai(
-                    furniture_name, furniture_data, placed_items, model
-                )
-                
-                if result:
-                    placed_items.append(result)
-                    placed_count += 1
-                    print(f"  ✓ Placed {furniture_name} ({placed_count}/{total_items}) - Score: {result.get('score', 0):.3f}")
-                else:
-                    failed_items.append(furniture_name)
-                    print(f"  ✗ Failed to place {furniture_name}")
-        
-        success_rate = (placed_count / total_items * 100) if total_items > 0 else 0
-        
-        # VALIDATION: Check for overlaps
-        validation = AILayoutService.validate_no_overlap(placed_items)
-        
-        print(f"\n{'='*50}")
-        print(f"✅ Placement Complete!")
-        print(f"   Successfully placed: {placed_count}/{total_items} items")
-        print(f"   Success rate: {success_rate:.1f}%")
-        print(f"   Failed items: {len(failed_items)}")
-        print(f"\n📊 VALIDATION:")
-        print(f"   Overlap Status: {validation['status']}")
-        print(f"   Overlaps: {validation['overlap_count']}")
-        print(f"   Close Spacing Warnings: {validation['warning_count']}")
-        
-        if validation['collisions']:
-            print(f"\n⚠️ COLLISIONS DETECTED:")
-            for c in validation['collisions']:
-                print(f"   - {c['item1']} vs {c['item2']}")
-        else:
-            print(f"\n✅ NO OVERLAPS - Layout is CLEAN!")
-        
-        print(f"{'='*50}\n")
-        
-        return {
-            "success": True,
-            "placed_items": placed_items,
-            "failed_items": failed_items,
-            "total_items": total_items,
-            "placed_count": placed_count,
-            "success_rate": round(success_rate, 2),
-            "model_used": True,
-            "algorithm": "AI Random Forest",
-            "validation": validation
-        }
-    
-    @staticmethod
-    def validate_no_overlap(placed_items: List[Dict]) -> Dict:
-        """
-        VALIDATION: Check if ANY furniture overlaps
-        Returns detailed collision report
-        """
-        collisions = []
-        warnings = []
-        
-        for i in range(len(placed_items)):
-            for j in range(i + 1, len(placed_items)):
-                item1 = placed_items[i]
-                item2 = placed_items[j]
-                
-                # Check ACTUAL overlap (no spacing buffer)
-                x1, y1, w1, h1 = item1["x"], item1["y"], item1["panjang"], item1["lebar"]
-                x2, y2, w2, h2 = item2["x"], item2["y"], item2["panjang"], item2["lebar"]
-                
-                # AABB overlap test
-                overlap = not (x1 + w1 <= x2 or x2 + w2 <= x1 or 
-                              y1 + h1 <= y2 or y2 + h2 <= y1)
-                
-                if overlap:
-                    collisions.append({
-                        "item1": item1["nama"],
-                        "item2": item2["nama"],
-                        "pos1": f"({x1:.2f}, {y1:.2f})",
-                        "pos2": f"({x2:.2f}, {y2:.2f})"
-                    })
-                else:
-                    # Check if too close (within minimum spacing)
-                    min_edge_dist = min(
-                        abs(x1 + w1 - x2),
-                        abs(x2 + w2 - x1),
-                        abs(y1 + h1 - y2),
-                        abs(y2 + h2 - y1)
-                    )
-                    
-                    if min_edge_dist < AILayoutService.MIN_SPACING:
-                        warnings.append({
-                            "item1": item1["nama"],
-                            "item2": item2["nama"],
-                            "distance": f"{min_edge_dist:.2f}m"
-                        })
-        
-        return {
-            "overlap_count": len(collisions),
-            "warning_count": len(warnings),
-            "collisions": collisions,
-            "warnings": warnings,
-            "status": "CLEAN" if len(collisions) == 0 else "HAS_OVERLAP"
-        }
-
-
-# Alias untuk backward compatibility
-AutoLayoutService = AILayoutService
+"""
+AI-Powered Layout Service using Random Forest
+Load trained model untuk prediksi posisi optimal furniture
+"""
+
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+import os
+from app.services.CandidateGrid import CandidateGrid
+from app.services.CandidatePrefilter import CandidatePrefilter
+from app.services.CandidateState import CandidateState
+from app.services.CompiledForest import CompiledForest
+from app.services.LayoutFeatures import LayoutFeatures
+from app.services.LayoutScore import LayoutScore
+from app.services.OccupancyGrid import OccupancyGrid
+from app.services.SpatialIndex import SpatialIndex
+from app.services.FeasibilityMap import FeasibilityMap
+from app.services.LayoutConfig import LayoutConfig
+from app.services.ModelArtifact import ModelArtifact
+from app.services.ModelRegistry import ModelRegistry
+from app.services.CompositeGroups import CompositeGroups
+
+class AILayoutService:
+    """AI Layout Service dengan Random Forest model"""
+    
+    # Layout dimensions
+    ROOM_WIDTH = 17.0
+    ROOM_HEIGHT = 11.0
+    
+    # Zones
+    ZONES = {
+        "living": {"x_min": 1.0, "x_max": 7.5, "y_min": 1.0, "y_max": 5.5},
+        "dining": {"x_min": 9.0, "x_max": 15.5, "y_min": 1.0, "y_max": 5.5},
+        "outdoor": {"x_min": 1.5, "x_max": 15.5, "y_min": 7.0, "y_max": 9.5},
+        "decoration": {"x_min": 1.0, "x_max": 16.0, "y_min": 1.0, "y_max": 10.0}
+    }
+    
+    # Obstacles
+    OBSTACLES = [
+        {"name": "Tangga Up L1", "x": 12.4, "y": 1.6, "width": 1.6, "height": 2.8},
+        {"name": "Tangga Down L2", "x": 9.0, "y": 7.6, "width": 2.0, "height": 1.6},
+        {"name": "Tangga Up L2", "x": 11.6, "y": 7.6, "width": 2.0, "height": 1.6},
+        {"name": "Column 1", "x": 8.5, "y": 5.0, "width": 0.36, "height": 0.36},
+        {"name": "Column 2", "x": 15.0, "y": 5.0, "width": 0.36, "height": 0.36},
+        {"name": "Column 3", "x": 8.5, "y": 6.5, "width": 0.36, "height": 0.36},
+        {"name": "Column 4", "x": 15.0, "y": 6.5, "width": 0.36, "height": 0.36}
+    ]
+    
+    # Spacing (OPTIMIZED for safety and NO OVERLAP!)
+    MIN_SPACING = 0.8  # 80cm between furniture - AMAN & RAPIH
+    WALL_MARGIN = 0.5  # 50cm from walls - lebih aman
+    OBSTACLE_MARGIN = 0.7  # 70cm from obstacles - hindari tangga/kolom
+    
+    # Two-stage scoring: Random Forest hanya untuk kandidat di top-K coarse cell
+    PREFILTER_TOP_K = CandidatePrefilter.DEFAULT_TOP_K
+    
+    # Default parameter set (immutable) - override per call via config=LayoutConfig(...)
+    DEFAULT_CONFIG = LayoutConfig(
+        min_spacing=MIN_SPACING,
+        wall_margin=WALL_MARGIN,
+        obstacle_margin=OBSTACLE_MARGIN,
+        prefilter_top_k=PREFILTER_TOP_K
+    )
+    
+    # Furniture catalog
+    FURNITURE_CATALOG = {
+        "SOFA 3 Seat": {"panjang": 2.6, "lebar": 1.0, "zone": "living", "quantity": 4, "priority": 1},
+        "SOFA 1 Seat": {"panjang": 1.14, "lebar": 1.0, "zone": "living", "quantity": 4, "priority": 2},
+        "Meja Makan": {"panjang": 2.4, "lebar": 1.0, "zone": "dining", "quantity": 2, "priority": 3},
+        "Kursi Makan": {"panjang": 0.46, "lebar": 0.75, "zone": "dining", "quantity": 8, "priority": 8},
+        "Lemari Piring": {"panjang": 1.2, "lebar": 0.6, "zone": "dining", "quantity": 2, "priority": 5},
+        "Lukisan Besar": {"panjang": 4.0, "lebar": 1.5, "zone": "decoration", "quantity": 1, "priority": 4},
+        "Lukisan Kecil": {"panjang": 0.6, "lebar": 0.6, "zone": "decoration", "quantity": 3, "priority": 9},
+        "Stand Lukisan": {"panjang": 0.6, "lebar": 0.75, "zone": "decoration", "quantity": 3, "priority": 10},
+        "Meja Teras": {"panjang": 2.4, "lebar": 1.0, "zone": "outdoor", "quantity": 2, "priority": 6},
+        "Kursi Teras": {"panjang": 0.46, "lebar": 0.75, "zone": "outdoor", "quantity": 4, "priority": 11},
+        "Rak Display": {"panjang": 2.0, "lebar": 0.5, "zone": "decoration", "quantity": 2, "priority": 7},
+        "Pot Bunga Small": {"panjang": 0.36, "lebar": 0.36, "zone": "decoration", "quantity": 4, "priority": 12},
+        "Pot Bunga Medium": {"panjang": 0.43, "lebar": 0.43, "zone": "decoration", "quantity": 3, "priority": 13},
+        "Pot Bunga Large": {"panjang": 0.6, "lebar": 0.6, "zone": "decoration", "quantity": 3, "priority": 14},
+        "Standing AC": {"panjang": 0.5, "lebar": 0.4, "zone": "living", "quantity": 2, "priority": 15}
+    }
+    
+    @staticmethod
+    def _load_compiled(path: str) -> CompiledForest:
+        """Legacy .pkl: unpickle sklearn forest lalu compile ke node arrays (object sklearn tidak disimpan)"""
+        import pickle
+        print(f"⚠️ Model artifact not found, unpickling {os.path.basename(path)} "
+              f"(run 'python export_model_artifacts.py' for fast cold start)")
+        with open(path, 'rb') as f:
+            return CompiledForest.from_sklearn(pickle.load(f))
+    
+    @staticmethod
+    def load_model(model_path: str = None):
+        """
+        Load trained Random Forest model sebagai CompiledForest (predict bit-identical dengan sklearn)
+        Artifact .json + .npz (ModelArtifact, memory-mapped, tanpa pickle) dipakai jika ada,
+        fallback ke .pkl. Lewat ModelRegistry: load sekali per process, thread-safe
+        """
+        # Try multiple locations
+        if model_path is None:
+            possible_paths = [
+                os.path.join(os.path.dirname(__file__), "furniture_layout_model.pkl"),  # Same dir as service
+                "furniture_layout_model.pkl",  # Root directory
+                os.path.join("app", "services", "furniture_layout_model.pkl")  # Explicit path
+            ]
+        else:
+            possible_paths = [model_path]
+        
+        for path in possible_paths:
+            artifact_path, _ = ModelArtifact.paths(path)
+            for source, loader in ((artifact_path, ModelArtifact.load),
+                                   (path, AILayoutService._load_compiled)):
+                try:
+                    if os.path.exists(source):
+                        return ModelRegistry.get(source, loader)
+                except Exception as e:
+                    print(f"⚠️ Failed to load model from {source}: {e}")
+        
+        print(f"⚠️ AI Model not found. Checked locations:")
+        for path in possible_paths:
+            print(f"   - {path}")
+        print(f"   Run 'python app/services/AILayoutTrainer.py' to train the model")
+        return None
+    
+    @staticmethod
+    def check_collision(x1: float, y1: float, w1: float, h1: float,
+                       x2: float, y2: float, w2: float, h2: float,
+                       spacing: float = 0.8) -> bool:
+        """
+        AABB collision detection with spacing buffer
+        DOUBLE CHECK: actual overlap + spacing requirement
+        """
+        # Check 1: Actual AABB overlap (MUST NOT happen!)
+        actual_overlap = not (x1 + w1 <= x2 or x2 + w2 <= x1 or 
+                             y1 + h1 <= y2 or y2 + h2 <= y1)
+        
+        if actual_overlap:
+            return True  # DEFINITE collision!
+        
+        # Check 2: Spacing requirement
+        spacing_violation = not (x1 + w1 + spacing < x2 or 
+                                x2 + w2 + spacing < x1 or 
+                                y1 + h1 + spacing < y2 or 
+                                y2 + h2 + spacing < y1)
+        
+        return spacing_violation
+    
+    @staticmethod
+    def is_valid_position(x: float, y: float, panjang: float, lebar: float,
+                         zone_name: str, placed_items: List[Dict],
+                         config: LayoutConfig = None) -> bool:
+        """Validate position (zone + obstacles + furniture)"""
+        config = config or AILayoutService.DEFAULT_CONFIG
+        zone = AILayoutService.ZONES.get(zone_name)
+        if not zone:
+            return False
+        
+        # Check zone boundaries
+        margin = config.wall_margin
+        if not (x >= zone["x_min"] + margin and 
+                x + panjang <= zone["x_max"] - margin and
+                y >= zone["y_min"] + margin and 
+                y + lebar <= zone["y_max"] - margin):
+            return False
+        
+        # Check obstacles
+        for obstacle in AILayoutService.OBSTACLES:
+            if AILayoutService.check_collision(
+                x, y, panjang, lebar,
+                obstacle["x"], obstacle["y"], obstacle["width"], obstacle["height"],
+                spacing=config.obstacle_margin
+            ):
+                return False
+        
+        # Check placed furniture
+        for item in placed_items:
+            if AILayoutService.check_collision(
+                x, y, panjang, lebar,
+                item["x"], item["y"], item["panjang"], item["lebar"],
+                spacing=config.min_spacing
+            ):
+                return False
+        
+        return True
+    
+    @staticmethod
+    def calculate_features(x: float, y: float, panjang: float, lebar: float,
+                          zone_name: str, placed_items: List[Dict],
+                          furniture_type: str) -> List[float]:
+        """Calculate features untuk model prediction (single position)"""
+        return AILayoutService.calculate_feature_matrix(
+            [x], [y], panjang, lebar, zone_name, placed_items, furniture_type
+        )[0].tolist()
+    
+    @staticmethod
+    def calculate_feature_matrix(xs, ys, panjang: float, lebar: float,
+                                 zone_name: str, placed_items: List[Dict],
+                                 furniture_type: str) -> np.ndarray:
+        """Calculate features untuk semua kandidat sekaligus (batched)"""
+        return LayoutFeatures.build_matrix(
+            xs, ys, panjang, lebar, zone_name,
+            AILayoutService.ZONES, AILayoutService.OBSTACLES, placed_items,
+            furniture_type, list(AILayoutService.FURNITURE_CATALOG.keys())
+        )
+    
+    @staticmethod
+    def feasibility_map(zone: str, panjang: float, lebar: float, grid_size: float = 0.2,
+                        config: LayoutConfig = None) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        (xs, ys, static_mask) untuk zone + footprint, dihitung sekali via FeasibilityMap
+        static_mask read-only: zone + obstacle check saja
+        """
+        config = config or AILayoutService.DEFAULT_CONFIG
+        zone_data = AILayoutService.ZONES[zone]
+        key = FeasibilityMap.make_key(
+            engine="AILayoutService",
+            zone=zone,
+            zone_bounds=zone_data,
+            obstacles=AILayoutService.OBSTACLES,
+            panjang=panjang,
+            lebar=lebar,
+            wall_margin=config.wall_margin,
+            obstacle_margin=config.obstacle_margin,
+            grid_size=grid_size
+        )
+        
+        def build():
+            xs, ys = CandidateGrid.zone_axes(
+                zone_data, panjang, lebar, config.wall_margin, grid_size
+            )
+            static = CandidateGrid.static_mask(
+                xs, ys, panjang, lebar, zone_data, config.wall_margin,
+                AILayoutService.OBSTACLES, config.obstacle_margin
+            )
+            return xs, ys, static
+        
+        return FeasibilityMap.get_or_build(key, build)
+    
+    @staticmethod
+    def candidate_state(furniture_name: str, furniture_data: Dict, placed_items: List[Dict],
+                        states: Dict, config: LayoutConfig = None) -> CandidateState:
+        """
+        CandidateState per furniture type untuk satu layout run (dibuat saat pertama dipakai)
+        Placed items yang belum diproses di-apply incremental sebelum dipakai
+        """
+        config = config or AILayoutService.DEFAULT_CONFIG
+        zone = furniture_data["zone"]
+        panjang = furniture_data["panjang"]
+        lebar = furniture_data["lebar"]
+        key = (furniture_name, zone, panjang, lebar)
+        
+        state = states.get(key)
+        if state is None:
+            xs, ys, static = AILayoutService.feasibility_map(zone, panjang, lebar, 0.2, config)
+            state = states[key] = CandidateState(
+                xs, ys, static, panjang, lebar, zone, furniture_name,
+                AILayoutService.ZONES, AILayoutService.OBSTACLES,
+                list(AILayoutService.FURNITURE_CATALOG.keys()), config.min_spacing
+            )
+        state.sync(placed_items)
+        return state
+    
+    @staticmethod
+    def find_best_position_ai(furniture_name: str, furniture_data: Dict,
+                             placed_items: List[Dict], 
+                             model, occupancy: OccupancyGrid = None,
+                             config: LayoutConfig = None,
+                             state: CandidateState = None,
+                             stats: Dict = None) -> Optional[Dict]:
+        """
+        Find best position using AI model prediction
+        occupancy: OccupancyGrid berisi placed_items (opsional, untuk O(1) collision query)
+        state: CandidateState yang sudah di-sync (opsional, mask + features incremental)
+        config.prefilter_top_k: analytic score per coarse cell dulu, model hanya di top-K cell
+        stats: dict akumulasi jumlah kandidat per stage (valid, coarse, model)
+        """
+        config = config or AILayoutService.DEFAULT_CONFIG
+        zone = furniture_data["zone"]
+        panjang = furniture_data["panjang"]
+        lebar = furniture_data["lebar"]
+        
+        if state is not None:
+            candidates, X = state.valid()
+            xs, ys, mask = state.xs, state.ys, state.mask
+        else:
+            # Generate candidate positions (FINE GRID untuk posisi optimal)
+            grid_size = 0.2  # 20cm grid - balance between coverage & speed
+            xs, ys, static = AILayoutService.feasibility_map(zone, panjang, lebar, grid_size, config)
+            
+            # Static map (zone + obstacles) sudah precomputed, tinggal cek placed items (vectorized)
+            mask = CandidateGrid.placed_mask(
+                xs, ys, static, panjang, lebar,
+                placed_items, config.min_spacing, occupancy=occupancy
+            )
+            candidates = CandidateGrid.valid_positions(xs, ys, mask)
+            X = None
+        
+        if not candidates:
+            return None
+        
+        # Predict quality scores using AI model
+        if model:
+            # Stage 1: analytic score (LayoutScore) per coarse cell -> fine candidates di top-K cell
+            keep, counts = CandidatePrefilter.select(
+                xs, ys, mask,
+                lambda cx, cy: LayoutScore.position_scores(
+                    cx, cy, AILayoutService.ZONES[zone], AILayoutService.OBSTACLES, placed_items
+                ),
+                config.prefilter_top_k
+            )
+            if stats is not None:
+                for stage, count in counts.items():
+                    stats[stage] = stats.get(stage, 0) + count
+            if not keep.all():
+                candidates = [c for c, k in zip(candidates, keep.tolist()) if k]
+                X = X[keep] if X is not None else None
+            
+            if X is None:
+                cand = np.array(candidates)
+                X = AILayoutService.calculate_feature_matrix(
+                    cand[:, 0], cand[:, 1], panjang, lebar, zone, placed_items, furniture_name
+                )
+            
+            # Stage 2: predict scores (Random Forest) untuk kandidat yang lolos prefilter
+            scores = model.predict(X)
+            
+            # Get best position
+            best_idx = np.argmax(scores)
+            best_x, best_y = candidates[best_idx]
+            best_score = scores[best_idx]
+        else:
+            # Fallback: use first valid position
+            best_x, best_y = candidates[0]
+            best_score = 0.5
+        
+        return {
+            "nama": furniture_name,
+            "x": round(best_x, 2),
+            "y": round(best_y, 2),
+            "panjang": panjang,
+            "lebar": lebar,
+            "zone": zone,
+            "score": float(best_score),
+            "color": AILayoutService.get_zone_color(zone)
+        }
+    
+    @staticmethod
+    def get_zone_color(zone: str) -> str:
+        """Get color by zone"""
+        colors = {
+            "living": "#4A90E2",
+            "dining": "#E27D60",
+            "outdoor": "#85C88A",
+            "decoration": "#F4A259"
+        }
+        return colors.get(zone, "#95A5A6")
+    
+    @staticmethod
+    def auto_place_all_furniture(room_width: float = 17.0,
+                                room_height: float = 11.0,
+                                config: LayoutConfig = None) -> Dict:
+        """
+        Auto place all furniture using AI model (reentrant, parameter dari config)
+        config.composite_groups: meja + kursi dicari sebagai satu footprint, lalu di-expand
+        """
+        config = config or AILayoutService.DEFAULT_CONFIG
+        
+        # Load model
+        model = AILayoutService.load_model()
+        
+        # Fallback to simple algorithm if no model
+        if not model:
+            print("⚠️ AI model not available, using deterministic algorithm")
+            from app.services.SimpleLayoutService import SimpleLayoutService
+            return SimpleLayoutService.auto_place_all_furniture(room_width, room_height)
+        
+        placed_items = []
+        failed_items = []
+        states = {}  # CandidateState per furniture type, di-update incremental per placement
+        scoring = {"valid": 0, "coarse": 0, "model": 0}  # Jumlah kandidat per scoring stage
+        
+        catalog = AILayoutService.FURNITURE_CATALOG
+        if config.composite_groups:
+            catalog = CompositeGroups.plan(catalog)
+        
+        # Sort by priority
+        sorted_furniture = sorted(
+            catalog.items(),
+            key=lambda x: x[1]["priority"]
+        )
+        
+        total_items = sum(f["quantity"] for f in AILayoutService.FURNITURE_CATALOG.values())
+        placed_count = 0
+        
+        print(f"\n🎯 Starting AI Auto Layout for {total_items} items...")
+        
+        # Work list: satu entry per instance (composite unit yang tidak muat di-split jadi member)
+        queue = [(name, data) for name, data in sorted_furniture for _ in range(data["quantity"])]
+        
+        while queue:
+            furniture_name, furniture_data = queue.pop(0)
+            
+            # Unit di-score model sebagai anchor-nya (meja) dengan footprint gabungan
+            feature_name = furniture_data.get("anchor", furniture_name)
+            state = AILayoutService.candidate_state(
+                feature_name, furniture_data, placed_items, states, config
+            )
+            result = AILayoutService.find_best_position_ai(
+                feature_name, furniture_data, placed_items, model, config=config, state=state,
+                stats=scoring
+            )
+            
+            if result:
+                for item in CompositeGroups.expand(result, furniture_name, furniture_data):
+                    placed_items.append(item)
+                    placed_count += 1
+                print(f"  ✓ Placed {furniture_name} ({placed_count}/{total_items}) - Score: {result.get('score', 0):.3f}")
+            elif furniture_data.get("members"):
+                print(f"  ↪ {furniture_name} tidak muat sebagai set, placement per item")
+                queue[:0] = CompositeGroups.split(furniture_data, AILayoutService.FURNITURE_CATALOG)
+            else:
+                failed_items.append(furniture_name)
+                print(f"  ✗ Failed to place {furniture_name}")
+        
+        success_rate = (placed_count / total_items * 100) if total_items > 0 else 0
+        
+        # VALIDATION: Check for overlaps
+        validation = AILayoutService.validate_no_overlap(placed_items, config)
+        
+        print(f"\n{'='*50}")
+        print(f"✅ Placement Complete!")
+        print(f"   Successfully placed: {placed_count}/{total_items} items")
+        print(f"   Success rate: {success_rate:.1f}%")
+        print(f"   Failed items: {len(failed_items)}")
+        print(f"\n📊 VALIDATION:")
+        print(f"   Overlap Status: {validation['status']}")
+        print(f"   Overlaps: {validation['overlap_count']}")
+        print(f"   Close Spacing Warnings: {validation['warning_count']}")
+        print(f"\n🔎 SCORING: {scoring['valid']} valid -> {scoring['coarse']} coarse cells "
+              f"-> {scoring['model']} model predictions (top-{config.prefilter_top_k})")
+        
+        if validation['collisions']:
+            print(f"\n⚠️ COLLISIONS DETECTED:")
+            for c in validation['collisions']:
+                print(f"   - {c['item1']} vs {c['item2']}")
+        else:
+            print(f"\n✅ NO OVERLAPS - Layout is CLEAN!")
+        
+        print(f"{'='*50}\n")
+        
+        return {
+            "success": True,
+            "placed_items": placed_items,
+            "failed_items": failed_items,
+            "total_items": total_items,
+            "placed_count": placed_count,
+            "success_rate": round(success_rate, 2),
+            "model_used": True,
+            "algorithm": "AI Random Forest",
+            "validation": validation,
+            "scoring": dict(
+                scoring,
+                top_k=config.prefilter_top_k,
+                coarse_step=CandidatePrefilter.COARSE_STEP
+            )
+        }
+    
+    @staticmethod
+    def validate_no_overlap(placed_items: List[Dict], config: LayoutConfig = None) -> Dict:
+        """
+        VALIDATION: Check if ANY furniture overlaps
+        Returns detailed collision report (spatial index, near-linear)
+        """
+        config = config or AILayoutService.DEFAULT_CONFIG
+        return SpatialIndex.overlap_report(placed_items, config.min_spacing)
+
+
+# Alias untuk backward compatibility
+AutoLayoutService = AILayoutService
@@ -0,0 +1,158 @@
+"""
+Annealing Optimizer - Anytime simulated annealing di atas hasil greedy AutoLayoutService
+Move / swap / jitter per iterasi, berhenti saat max_ms habis dan return layout terbaik sejauh ini
+"""
+import math
+import random
+import time
+from typing import Dict, List, Tuple
+from config import Config
+from app.services.AutoLayoutService import AutoLayoutService
+from app.services.LayoutConfig import LayoutConfig
+from app.services.LayoutScore import LayoutScore
+
+
+class AnnealingOptimizer:
+    """Simulated annealing untuk posisi furniture (score = LayoutScore.layout_score)"""
+
+    DEFAULT_MAX_MS = 200
+    T_START = 0.05  # Temperature awal (satuan score)
+    T_END = 0.001
+    JITTER = 0.5  # Max pergeseran (meter) untuk move "shift" di awal, mengecil mengikuti temperature
+
+    @staticmethod
+    def is_valid(item: Dict, others: List[Dict], config: LayoutConfig) -> bool:
+        """Zone + obstacle + spacing check (aturan sama dengan AutoLayoutService)"""
+        x, y, panjang, lebar = item["x"], item["y"], item["panjang"], item["lebar"]
+        if not AutoLayoutService.is_within_zone(x, y, panjang, lebar, item["zone"], config):
+            return False
+        if AutoLayoutService.check_obstacle_collision(x, y, panjang, lebar, config):
+            return False
+        for other in others:
+            if AutoLayoutService.check_collision(
+                x, y, panjang, lebar,
+                other["x"], other["y"], other["panjang"], other["lebar"],
+                spacing=config.min_spacing
+            ):
+                return False
+        return True
+
+    @staticmethod
+    def _propose(items: List[Dict], rng: random.Random, progress: float) -> List[Tuple[int, Dict]]:
+        """Satu move acak: list (index, item baru) yang berubah (move, shift atau swap)"""
+        i = rng.randrange(len(items))
+        item = items[i]
+        kind = rng.random()
+
+        if kind < 0.2:
+            # Swap posisi dengan item lain di zone yang sama
+            mates = [j for j in range(len(items)) if j != i and items[j]["zone"] == item["zone"]]
+            if mates:
+                j = rng.choice(mates)
+                return [(i, dict(item, x=items[j]["x"], y=items[j]["y"])),
+                        (j, dict(items[j], x=item["x"], y=item["y"]))]
+
+        if kind < 0.4:
+            # Move: posisi acak di dalam zone
+            zone = AutoLayoutService.ZONES[item["zone"]]
+            x = rng.uniform(zone["x_min"], max(zone["x_min"], zone["x_max"] - item["panjang"]))
+            y = rng.uniform(zone["y_min"], max(zone["y_min"], zone["y_max"] - item["lebar"]))
+        else:
+            # Shift: perturbasi lokal, radius mengecil seiring waktu
+            radius = AnnealingOptimizer.JITTER * (1.0 - progress) + 0.05
+            x = item["x"] + rng.uniform(-radius, radius)
+            y = item["y"] + rng.uniform(-radius, radius)
+
+        return [(i, dict(item, x=round(x, 2), y=round(y, 2)))]
+
+    @staticmethod
+    def optimize(placed_items: List[Dict], max_ms: float = None, seed: int = 0,
+                 config: LayoutConfig = None) -> Dict:
+        """
+        Improve layout sampai max_ms habis
+        Return {placed_items, stats} - placed_items = layout terbaik yang ditemukan
+        """
+        config = config or AutoLayoutService.DEFAULT_CONFIG
+        max_ms = AnnealingOptimizer.DEFAULT_MAX_MS if max_ms is None else max_ms
+        max_ms = max(0.0, min(float(max_ms), Config.LAYOUT_MAX_OPTIMIZE_MS))
+        start = time.perf_counter()
+        deadline = start + max_ms / 1000.0
+        rng = random.Random(seed)
+
+        zones = AutoLayoutService.ZONES
+        obstacles = AutoLayoutService.OBSTACLES
+        current = [dict(item) for item in placed_items]
+        current_score = LayoutScore.layout_score(current, zones, obstacles)
+        best, best_score = list(current), current_score
+        initial_score = current_score
+
+        iterations = accepted = improved = 0
+        t_ratio = AnnealingOptimizer.T_END / AnnealingOptimizer.T_START
+
+        while current:
+            now = time.perf_counter()
+            if now >= deadline:
+                break
+            progress = (now - start) / (deadline - start) if deadline > start else 1.0
+            temperature = AnnealingOptimizer.T_START * (t_ratio ** progress)
+            iterations += 1
+
+            changes = AnnealingOptimizer._propose(current, rng, progress)
+            candidate = list(current)
+            for index, item in changes:
+                candidate[index] = item
+
+            if not all(
+                AnnealingOptimizer.is_valid(
+                    item, [other for j, other in enumerate(candidate) if j != index], config
+                )
+                for index, item in changes
+            ):
+                continue
+
+            score = LayoutScore.layout_score(candidate, zones, obstacles)
+            delta = score - current_score
+            if delta >= 0 or rng.random() < math.exp(delta / temperature):
+                current, current_score = candidate, score
+                accepted += 1
+                if score > best_score:
+                    best, best_score = list(candidate), score
+                    improved += 1
+
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        return {
+            "placed_items": best,
+            "stats": {
+                "max_ms": max_ms,
+                "elapsed_ms": round(elapsed_ms, 2),
+                "iterations": iterations,
+                "accepted": accepted,
+                "improvements": improved,
+                "initial_score": round(initial_score, 4),
+                "best_score": round(best_score, 4),
+                "seed": seed
+            }
+        }
+
+    @staticmethod
+    def optimize_layout(room_width: float = 17.0, room_height: float = 11.0,
+                        max_ms: float = None, seed: int = 0,
+                        config: LayoutConfig = None) -> Dict:
+        """Greedy AutoLayoutService layout -> annealing dalam budget max_ms"""
+        max_ms = AnnealingOptimizer.DEFAULT_MAX_MS if max_ms is None else max_ms
+        max_ms = max(0.0, min(float(max_ms), Config.LAYOUT_MAX_OPTIMIZE_MS))
+        start = time.perf_counter()
+        result = AutoLayoutService.auto_place_all_furniture(room_width, room_height, config=config)
+        greedy_ms = (time.perf_counter() - start) * 1000
+
+        # Budget total termasuk greedy placement
+        remaining_ms = max(0.0, max_ms - greedy_ms)
+        optimized = AnnealingOptimizer.optimize(result["placed_items"], remaining_ms, seed, config)
+
+        result["placed_items"] = optimized["placed_items"]
+        result["validation"] = AutoLayoutService.validate_no_overlap(optimized["placed_items"], config)
+        result["optimizer"] = dict(optimized["stats"], max_ms=max_ms, greedy_ms=round(greedy_ms, 2))
+        print(f"🔥 Annealing: score {optimized['stats']['initial_score']:.3f} -> "
+              f"{optimized['stats']['best_score']:.3f} "
+              f"({optimized['stats']['iterations']} iterations, {optimized['stats']['elapsed_ms']:.0f}ms)")
+        return result
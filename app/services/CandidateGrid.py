@@ -0,0 +1,179 @@
+"""
+Candidate Grid - Vectorized position validity
+Evaluasi seluruh grid kandidat sekaligus (zone + obstacles + furniture) dengan NumPy broadcasting
+"""
+import numpy as np
+from typing import Dict, List, Tuple
+from app.services.OccupancyGrid import OccupancyGrid
+
+
+class CandidateGrid:
+    """Vectorized candidate grid generation dan validity mask untuk layout services"""
+
+    @staticmethod
+    def axis_positions(start: float, stop: float, step: float) -> np.ndarray:
+        """
+        Grid positions dari start sampai stop (inclusive)
+        Hasil identik dengan loop `while v <= stop: v += step` (akumulasi float yang sama)
+        """
+        if step <= 0 or stop < start:
+            return np.empty(0)
+        count = int((stop - start) / step) + 2
+        steps = np.full(count, step, dtype=float)
+        steps[0] = start
+        values = np.cumsum(steps)  # sequential accumulation, sama seperti while-loop
+        return values[values <= stop]
+
+    @staticmethod
+    def zone_axes(zone: Dict, panjang: float, lebar: float,
+                  margin: float, grid_size: float) -> Tuple[np.ndarray, np.ndarray]:
+        """Candidate x dan y axis di dalam zone (sudah dikurangi wall margin)"""
+        xs = CandidateGrid.axis_positions(
+            zone["x_min"] + margin, zone["x_max"] - panjang - margin, grid_size
+        )
+        ys = CandidateGrid.axis_positions(
+            zone["y_min"] + margin, zone["y_max"] - lebar - margin, grid_size
+        )
+        return xs, ys
+
+    @staticmethod
+    def to_rects(items: List[Dict], width_key: str = "panjang",
+                 height_key: str = "lebar") -> np.ndarray:
+        """Convert list of dict (x, y, width, height) ke array (N, 4)"""
+        if not items:
+            return np.empty((0, 4))
+        return np.array(
+            [[item["x"], item["y"], item[width_key], item[height_key]] for item in items],
+            dtype=float
+        )
+
+    @staticmethod
+    def blocked_mask(xs: np.ndarray, ys: np.ndarray, panjang: float, lebar: float,
+                     rects: np.ndarray, spacing: float, inclusive: bool = True) -> np.ndarray:
+        """
+        Mask (len(xs), len(ys)) kandidat yang collide dengan salah satu rect
+        inclusive=True  -> collision jika jarak <= spacing (AILayoutService / AILayoutTrainer)
+        inclusive=False -> collision jika jarak < spacing (SimpleLayoutService)
+        """
+        if len(rects) == 0 or len(xs) == 0 or len(ys) == 0:
+            return np.zeros((len(xs), len(ys)), dtype=bool)
+
+        rx, ry, rw, rh = rects[:, 0], rects[:, 1], rects[:, 2], rects[:, 3]
+        cx = xs[:, None]
+        cy = ys[:, None]
+
+        # Per-axis overlap (separating axis test), urutan operasi sama dengan check_collision
+        if inclusive:
+            x_overlap = (cx + panjang + spacing >= rx) & (rx + rw + spacing >= cx)
+            y_overlap = (cy + lebar + spacing >= ry) & (ry + rh + spacing >= cy)
+        else:
+            x_overlap = (cx + panjang + spacing > rx) & (rx + rw + spacing > cx)
+            y_overlap = (cy + lebar + spacing > ry) & (ry + rh + spacing > cy)
+
+        # Collision di (i, j) jika ada rect yang overlap di kedua axis -> hitung via matmul
+        hits = x_overlap.astype(np.float32) @ y_overlap.astype(np.float32).T
+        return hits > 0
+
+    @staticmethod
+    def blocked_points(px: np.ndarray, py: np.ndarray, panjang: float, lebar: float,
+                       rects: np.ndarray, spacing: float, inclusive: bool = True) -> np.ndarray:
+        """Seperti blocked_mask, tapi untuk daftar titik (px[k], py[k]) -> mask (N,)"""
+        if len(rects) == 0 or len(px) == 0:
+            return np.zeros(len(px), dtype=bool)
+        rx, ry, rw, rh = rects[:, 0], rects[:, 1], rects[:, 2], rects[:, 3]
+        cx = px[:, None]
+        cy = py[:, None]
+        if inclusive:
+            hit = ((cx + panjang + spacing >= rx) & (rx + rw + spacing >= cx) &
+                   (cy + lebar + spacing >= ry) & (ry + rh + spacing >= cy))
+        else:
+            hit = ((cx + panjang + spacing > rx) & (rx + rw + spacing > cx) &
+                   (cy + lebar + spacing > ry) & (ry + rh + spacing > cy))
+        return hit.any(axis=1)
+
+    @staticmethod
+    def apply_occupancy(xs: np.ndarray, ys: np.ndarray, mask: np.ndarray,
+                        panjang: float, lebar: float, occupancy: OccupancyGrid,
+                        placed_items: List[Dict], spacing: float,
+                        inclusive: bool = True) -> np.ndarray:
+        """
+        Filter mask terhadap placed items via OccupancyGrid (O(1) per kandidat)
+        Hanya kandidat UNKNOWN (tepi dalam 1 cell) yang dicek exact pairwise
+        """
+        status = occupancy.status_grid(xs, ys, panjang, lebar, spacing)
+        mask = mask & (status != OccupancyGrid.BLOCKED)
+        ix, iy = np.nonzero(mask & (status == OccupancyGrid.UNKNOWN))
+        if len(ix):
+            blocked = CandidateGrid.blocked_points(
+                xs[ix], ys[iy], panjang, lebar,
+                CandidateGrid.to_rects(placed_items), spacing, inclusive
+            )
+            mask[ix[blocked], iy[blocked]] = False
+        return mask
+
+    @staticmethod
+    def static_mask(xs: np.ndarray, ys: np.ndarray, panjang: float, lebar: float,
+                    zone: Dict, margin: float,
+                    obstacles: List[Dict], obstacle_margin: float,
+                    inclusive: bool = True) -> np.ndarray:
+        """
+        Mask zone + obstacles saja (tidak tergantung placed items)
+        Static per (zone, footprint, margin, grid) -> bisa di-cache lewat FeasibilityMap
+        """
+        x_ok = (xs >= zone["x_min"] + margin) & (xs + panjang <= zone["x_max"] - margin)
+        y_ok = (ys >= zone["y_min"] + margin) & (ys + lebar <= zone["y_max"] - margin)
+        mask = x_ok[:, None] & y_ok[None, :]
+
+        if not mask.any():
+            return mask
+
+        obstacle_rects = CandidateGrid.to_rects(obstacles, "width", "height")
+        mask &= ~CandidateGrid.blocked_mask(
+            xs, ys, panjang, lebar, obstacle_rects, obstacle_margin, inclusive
+        )
+        return mask
+
+    @staticmethod
+    def placed_mask(xs: np.ndarray, ys: np.ndarray, mask: np.ndarray,
+                    panjang: float, lebar: float,
+                    placed_items: List[Dict], spacing: float,
+                    inclusive: bool = True, occupancy: OccupancyGrid = None) -> np.ndarray:
+        """
+        Mask baru = mask AND tidak collision dengan placed items (mask input tidak diubah)
+        Jika occupancy diberikan, placed items dicek lewat OccupancyGrid
+        """
+        if not mask.any():
+            return mask.copy()
+
+        if occupancy is not None:
+            return CandidateGrid.apply_occupancy(
+                xs, ys, mask, panjang, lebar, occupancy, placed_items, spacing, inclusive
+            )
+
+        placed_rects = CandidateGrid.to_rects(placed_items)
+        return mask & ~CandidateGrid.blocked_mask(
+            xs, ys, panjang, lebar, placed_rects, spacing, inclusive
+        )
+
+    @staticmethod
+    def valid_mask(xs: np.ndarray, ys: np.ndarray, panjang: float, lebar: float,
+                   zone: Dict, margin: float,
+                   obstacles: List[Dict], obstacle_margin: float,
+                   placed_items: List[Dict], spacing: float,
+                   inclusive: bool = True, occupancy: OccupancyGrid = None) -> np.ndarray:
+        """
+        Validity mask (len(xs), len(ys)) untuk seluruh grid kandidat
+        Sama dengan is_valid_position (zone + obstacles + furniture), tapi satu kali evaluasi
+        """
+        mask = CandidateGrid.static_mask(
+            xs, ys, panjang, lebar, zone, margin, obstacles, obstacle_margin, inclusive
+        )
+        return CandidateGrid.placed_mask(
+            xs, ys, mask, panjang, lebar, placed_items, spacing, inclusive, occupancy
+        )
+
+    @staticmethod
+    def valid_positions(xs: np.ndarray, ys: np.ndarray, mask: np.ndarray) -> List[Tuple[float, float]]:
+        """Daftar (x, y) valid dengan urutan x-major (sama dengan nested while-loop)"""
+        ix, iy = np.nonzero(mask)
+        return [(round(float(xs[i]), 2), round(float(ys[j]), 2)) for i, j in zip(ix, iy)]
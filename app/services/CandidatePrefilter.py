@@ -0,0 +1,50 @@
+"""
+Candidate Prefilter - Coarse-to-fine candidate selection sebelum Random Forest
+Stage 1: analytic score (LayoutScore) per coarse cell, Stage 2: model hanya di fine candidates
+dalam top-K coarse cell -> jumlah predict turun dari semua kandidat valid ke max K x step²
+"""
+import numpy as np
+from typing import Callable, Dict, Tuple
+
+
+class CandidatePrefilter:
+    """Coarse cell = blok step x step fine candidates (grid 0.2m x 3 = 0.6m)"""
+
+    COARSE_STEP = 3
+    DEFAULT_TOP_K = 8
+
+    @staticmethod
+    def select(xs: np.ndarray, ys: np.ndarray, mask: np.ndarray,
+               score_fn: Callable[[np.ndarray, np.ndarray], np.ndarray],
+               top_k: int, step: int = None) -> Tuple[np.ndarray, Dict]:
+        """
+        Pilih fine candidates untuk model: mask (len(xs), len(ys)) -> keep (N_valid,)
+        keep sejajar dengan np.flatnonzero(mask) (urutan x-major seperti valid_positions)
+        score_fn(cx, cy): analytic score per titik tengah coarse cell (higher is better)
+        Return (keep, stats) - stats = jumlah kandidat per stage
+        """
+        step = CandidatePrefilter.COARSE_STEP if step is None else step
+        index = np.flatnonzero(mask)
+        ny = mask.shape[1]
+        ix, iy = index // ny, index % ny
+
+        # Coarse cell yang punya minimal satu fine candidate valid
+        blocks_y = (ny + step - 1) // step
+        block = (ix // step) * blocks_y + iy // step
+        cells = np.unique(block)
+        stats = {"valid": len(index), "coarse": 0, "model": len(index)}
+        if top_k is None or len(cells) <= top_k:
+            return np.ones(len(index), dtype=bool), stats
+
+        # Titik tengah coarse cell (clamp ke ujung axis untuk cell terakhir yang terpotong)
+        center = step // 2
+        cx = xs[np.minimum((cells // blocks_y) * step + center, len(xs) - 1)]
+        cy = ys[np.minimum((cells % blocks_y) * step + center, ny - 1)]
+        scores = score_fn(cx, cy)
+
+        # Stable sort: tie -> cell dengan urutan x-major lebih awal
+        best = cells[np.argsort(-scores, kind="stable")[:top_k]]
+        keep = np.isin(block, best)
+        stats["coarse"] = len(cells)
+        stats["model"] = int(keep.sum())
+        return keep, stats
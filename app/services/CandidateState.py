@@ -0,0 +1,85 @@
+"""
+Candidate State - Candidate grid satu furniture type yang di-maintain incremental
+Validity mask + feature matrix dihitung sekali, lalu setiap placement hanya mengubah
+kandidat di sekitar item baru (bukan rebuild dari semua placed items)
+"""
+import numpy as np
+from typing import Dict, List, Tuple
+from app.services.CandidateGrid import CandidateGrid
+from app.services.LayoutFeatures import LayoutFeatures
+
+
+class CandidateState:
+    """
+    Grid (xs x ys) satu furniture type: mask valid + feature matrix (N, 17)
+    Sync lazy: placed items yang belum diproses di-apply saat state dipakai lagi
+    Hasil identik dengan CandidateGrid.placed_mask + LayoutFeatures.build_matrix dari nol
+    """
+
+    EPS = 1e-9  # Window sedikit diperlebar, keputusan akhir tetap exact test
+
+    def __init__(self, xs: np.ndarray, ys: np.ndarray, static: np.ndarray,
+                 panjang: float, lebar: float, zone_name: str, furniture_type: str,
+                 zones: Dict, obstacles: List[Dict], furniture_types: List[str],
+                 spacing: float):
+        self.xs = xs
+        self.ys = ys
+        self.panjang = panjang
+        self.lebar = lebar
+        self.spacing = spacing
+        self.mask = static.copy()
+        self.synced = 0
+
+        # Posisi kandidat dibulatkan 2 desimal (sama dengan CandidateGrid.valid_positions)
+        self.rx = np.array([round(float(v), 2) for v in xs], dtype=float)
+        self.ry = np.array([round(float(v), 2) for v in ys], dtype=float)
+        gx, gy = np.meshgrid(self.rx, self.ry, indexing="ij")
+        self.px = gx.ravel()
+        self.py = gy.ravel()
+
+        # Feature tanpa placed items, kolom furniture di-update per placement
+        self.features = LayoutFeatures.build_matrix(
+            self.px, self.py, panjang, lebar, zone_name, zones, obstacles, [],
+            furniture_type, furniture_types
+        )
+
+    def _window(self, axis: np.ndarray, lo: float, hi: float) -> Tuple[int, int]:
+        """Index range [i0, i1) dari axis (sorted) di dalam [lo, hi]"""
+        return (int(np.searchsorted(axis, lo - self.EPS, "left")),
+                int(np.searchsorted(axis, hi + self.EPS, "right")))
+
+    def add(self, item: Dict):
+        """Apply satu placed item: mask di window sekitar item, feature furniture di kandidat valid"""
+        x, y, w, h = item["x"], item["y"], item["panjang"], item["lebar"]
+
+        # Kandidat yang bisa collide (inclusive, jarak <= spacing) ada di window ini
+        i0, i1 = self._window(self.xs, x - self.panjang - self.spacing, x + w + self.spacing)
+        j0, j1 = self._window(self.ys, y - self.lebar - self.spacing, y + h + self.spacing)
+        if i0 < i1 and j0 < j1:
+            blocked = CandidateGrid.blocked_mask(
+                self.xs[i0:i1], self.ys[j0:j1], self.panjang, self.lebar,
+                np.array([[x, y, w, h]], dtype=float), self.spacing, inclusive=True
+            )
+            self.mask[i0:i1, j0:j1] &= ~blocked
+
+        # Kandidat invalid tidak pernah valid lagi -> feature-nya tidak perlu di-update
+        index = np.flatnonzero(self.mask)
+        if len(index) == 0:
+            return
+        dist = LayoutFeatures.min_distances(
+            self.px[index], self.py[index], np.array([[x, y]], dtype=float)
+        )[:, 0]
+        self.features[index, 13] = np.minimum(self.features[index, 13], dist)
+        self.features[index, 14] += dist < LayoutFeatures.NEARBY_RADIUS
+
+    def sync(self, placed_items: List[Dict]):
+        """Apply placed items yang belum diproses (placed_items append-only)"""
+        for item in placed_items[self.synced:]:
+            self.add(item)
+        self.synced = len(placed_items)
+
+    def valid(self) -> Tuple[List[Tuple[float, float]], np.ndarray]:
+        """(candidates, feature matrix) kandidat valid, urutan x-major seperti valid_positions"""
+        index = np.flatnonzero(self.mask)
+        candidates = list(zip(self.px[index].tolist(), self.py[index].tolist()))
+        return candidates, self.features[index]
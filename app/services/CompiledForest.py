@@ -0,0 +1,154 @@
+"""
+Compiled Forest - Random Forest sebagai contiguous NumPy arrays (tanpa object sklearn)
+Semua tree di-flatten jadi satu node table: feature, threshold, children dan value per node,
+prediksi batch dievaluasi level demi level (vectorized), hasil bit-identical dengan sklearn predict
+"""
+import numpy as np
+from typing import Dict, List
+
+
+class CompiledForest:
+    """
+    Node table gabungan semua tree (index global)
+    Sibling disimpan berurutan: right child = left child + 1, jadi satu langkah traversal cukup
+    node = left[node] + (x[feature] > threshold). Leaf menunjuk ke dirinya sendiri (threshold +inf)
+    """
+
+    ARRAYS = ("feature", "threshold", "left", "value", "roots")
+    COMPACT_EVERY = 3  # Buang sample-tree yang sudah di leaf setiap N level
+
+    def __init__(self, feature: np.ndarray, threshold: np.ndarray, left: np.ndarray,
+                 value: np.ndarray, roots: np.ndarray, n_features: int, max_depth: int,
+                 manifest: Dict = None):
+        self.feature = feature
+        self.threshold = threshold
+        self.left = left
+        self.value = value
+        self.roots = roots
+        self.n_features = n_features
+        self.max_depth = max_depth
+        self.manifest = manifest  # Manifest ModelArtifact (feature_columns, metadata) jika di-load dari artifact
+
+    @property
+    def n_trees(self) -> int:
+        return len(self.roots)
+
+    @property
+    def n_nodes(self) -> int:
+        return len(self.feature)
+
+    @property
+    def n_outputs(self) -> int:
+        return self.value.shape[1]
+
+    @property
+    def nbytes(self) -> int:
+        return sum(int(getattr(self, name).nbytes) for name in CompiledForest.ARRAYS)
+
+    @property
+    def mapped_files(self) -> List[str]:
+        """File yang di-memory-map oleh node arrays (kosong jika arrays ada di heap)"""
+        return sorted({
+            getattr(self, name).filename for name in CompiledForest.ARRAYS
+            if isinstance(getattr(self, name), np.memmap)
+        })
+
+    @staticmethod
+    def float32_threshold(threshold: np.ndarray) -> np.ndarray:
+        """
+        Float32 terbesar yang <= threshold float64
+        Untuk x float32: x <= t (float64) persis sama dengan x <= t32, jadi compare tetap exact
+        """
+        t32 = threshold.astype(np.float32)
+        over = t32.astype(np.float64) > threshold
+        t32[over] = np.nextafter(t32[over], np.float32(-np.inf))
+        return t32
+
+    @staticmethod
+    def from_sklearn(model) -> "CompiledForest":
+        """
+        Export RandomForestRegressor / DecisionTreeRegressor ke node arrays (value: n_nodes x n_outputs)
+        Node di-renumber per tree: root, lalu pasangan (left, right) setiap internal node
+        """
+        estimators = getattr(model, "estimators_", None) or [model]
+        features, thresholds, lefts, values, roots = [], [], [], [], []
+        offset = 0
+        max_depth = 0
+
+        for estimator in estimators:
+            tree = estimator.tree_
+            if tree.value.shape[2] != 1:
+                raise ValueError("CompiledForest hanya mendukung regression (bukan classifier)")
+            children_left = tree.children_left
+            children_right = tree.children_right
+            internal = np.flatnonzero(children_left != -1)
+
+            # order[new] = old, setiap node non-root muncul tepat sekali sebagai child
+            order = np.concatenate([[0], np.column_stack(
+                [children_left[internal], children_right[internal]]
+            ).ravel()])
+            new_index = np.empty(len(order), dtype=np.intp)
+            new_index[order] = np.arange(len(order))
+
+            leaf = children_left[order] == -1
+            features.append(np.where(leaf, 0, tree.feature[order]))
+            thresholds.append(np.where(leaf, np.inf, tree.threshold[order]))
+            lefts.append(np.where(
+                leaf, np.arange(len(order)), new_index[np.maximum(children_left[order], 0)]
+            ) + offset)
+            values.append(tree.value[order, :, 0])
+            roots.append(offset)
+            offset += len(order)
+            max_depth = max(max_depth, int(tree.max_depth))
+
+        return CompiledForest(
+            feature=np.concatenate(features).astype(np.int32),
+            threshold=CompiledForest.float32_threshold(np.concatenate(thresholds)),
+            left=np.concatenate(lefts).astype(np.int32),
+            value=np.ascontiguousarray(np.concatenate(values), dtype=np.float64),
+            roots=np.asarray(roots, dtype=np.int32),
+            n_features=int(model.n_features_in_),
+            max_depth=max_depth
+        )
+
+    def apply(self, X) -> np.ndarray:
+        """Leaf index global (N, n_trees) untuk setiap sample per tree"""
+        # sklearn meng-cast X ke float32 sebelum traversal (Tree.apply)
+        X = np.asarray(X, dtype=np.float32)
+        if X.ndim != 2 or X.shape[1] != self.n_features:
+            raise ValueError(f"X harus berbentuk (N, {self.n_features}), didapat {X.shape}")
+        if np.isnan(X).any():
+            raise ValueError("Input X contains NaN")
+
+        n = X.shape[0]
+        flat = X.ravel()
+        nodes = np.tile(self.roots, n)
+        base = np.repeat(np.arange(n, dtype=np.int32) * self.n_features, self.n_trees)
+
+        # Hanya sample-tree yang belum sampai leaf yang dievaluasi di level berikutnya
+        active = np.arange(nodes.size)
+        for depth in range(self.max_depth):
+            current = nodes[active]
+            step = self.left[current] + (flat[base[active] + self.feature[current]] > self.threshold[current])
+            nodes[active] = step
+            if depth % CompiledForest.COMPACT_EVERY == CompiledForest.COMPACT_EVERY - 1:
+                active = active[self.left[step] != step]
+                if active.size == 0:
+                    break
+        return nodes.reshape(n, self.n_trees)
+
+    def predict(self, X) -> np.ndarray:
+        """
+        Rata-rata value leaf semua tree (akumulasi berurutan per tree seperti sklearn)
+        Shape (N,) untuk single output, (N, n_outputs) untuk multi-output
+        """
+        leaves = self.value[self.apply(X)]
+        total = np.zeros((leaves.shape[0], self.n_outputs))
+        for t in range(self.n_trees):
+            total += leaves[:, t]
+        total /= self.n_trees
+        return total[:, 0] if self.n_outputs == 1 else total
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """Node arrays (untuk export ke ModelArtifact)"""
+        return {name: getattr(self, name) for name in CompiledForest.ARRAYS}
@@ -0,0 +1,156 @@
+"""
+Composite Groups - Set meja + kursi sebagai satu unit placement
+Footprint gabungan dicari sekali (satu search problem per set), lalu di-expand jadi item individual
+"""
+from typing import Dict, List, Tuple
+
+
+class CompositeGroups:
+    """Catalog-level composite groups: anchor (meja) + member (kursi) di sisi panjangnya"""
+
+    # anchor -> member yang ikut set + kapasitas kursi per anchor
+    GROUPS = {
+        "Meja Makan": {"member": "Kursi Makan", "seats": 6},
+        "Meja Teras": {"member": "Kursi Teras", "seats": 6},
+    }
+    CHAIR_GAP = 0.1  # Jarak kursi ke tepi meja (meter)
+
+    @staticmethod
+    def seat_layout(anchor: Dict, member: Dict, seats: int,
+                    gap: float = None) -> Tuple[float, float, List[Tuple[float, float, float, float]]]:
+        """
+        Rect anchor + kursi relatif ke pojok kiri-atas footprint
+        Kursi di kedua ujung meja dulu (footprint tetap pendek), sisanya bergantian sisi atas / bawah
+        Return (panjang, lebar, [(dx, dy, w, h), ...]) - rect pertama = anchor
+        """
+        gap = CompositeGroups.CHAIR_GAP if gap is None else gap
+        tw, th = anchor["panjang"], anchor["lebar"]
+        cw, ch = member["panjang"], member["lebar"]
+        ends = min(seats, 2)
+        top = (seats - ends + 1) // 2
+        bottom = (seats - ends) // 2
+
+        table_y = ch + gap if top else 0.0
+        rects = [(0.0, table_y, tw, th)]
+        for x in (-gap - cw, tw + gap)[:ends]:
+            rects.append((x, table_y + (th - ch) / 2, cw, ch))
+        for count, y in ((top, 0.0), (bottom, table_y + th + gap)):
+            for i in range(count):
+                rects.append((tw * (i + 0.5) / count - cw / 2, y, cw, ch))
+
+        # Offset 2 desimal (sama dengan posisi item), pojok kiri-atas footprint = (0, 0)
+        min_x = min(r[0] for r in rects)
+        min_y = min(r[1] for r in rects)
+        rects = [(round(x - min_x, 2), round(y - min_y, 2), w, h) for x, y, w, h in rects]
+        panjang = round(max(x + w for x, _, w, _ in rects), 4)
+        lebar = round(max(y + h for _, y, _, h in rects), 4)
+        return panjang, lebar, rects
+
+    @staticmethod
+    def plan(catalog: Dict[str, Dict], groups: Dict[str, Dict] = None,
+             gap: float = None) -> Dict[str, Dict]:
+        """
+        Catalog -> catalog placement: anchor + member jadi unit "Meja Makan + 4 Kursi Makan"
+        Kursi dibagi rata ke semua anchor (max seats per anchor), sisanya tetap item individual
+        Unit punya key "anchor" dan "members" [{nama, dx, dy, panjang, lebar}]
+        """
+        groups = CompositeGroups.GROUPS if groups is None else groups
+
+        # Pass 1: jumlah kursi per anchor instance
+        seats_per_anchor = {}
+        grouped = {}
+        for name, data in catalog.items():
+            group = groups.get(name)
+            if not group or group["member"] not in catalog:
+                continue
+            member = group["member"]
+            tables = data["quantity"]
+            available = catalog[member]["quantity"] - grouped.get(member, 0)
+            seats = [
+                min(group["seats"], available // tables + (1 if i < available % tables else 0))
+                for i in range(tables)
+            ] if tables else []
+            seats_per_anchor[name] = seats
+            grouped[member] = grouped.get(member, 0) + sum(seats)
+
+        # Pass 2: catalog baru, urutan entry sama dengan catalog asli
+        planned = {}
+        for name, data in catalog.items():
+            if name in seats_per_anchor:
+                member_name = groups[name]["member"]
+                member = catalog[member_name]
+                for seats in seats_per_anchor[name]:
+                    if seats == 0:
+                        entry = planned.setdefault(name, dict(data, quantity=0))
+                        entry["quantity"] += 1
+                        continue
+                    unit_name = f"{name} + {seats} {member_name}"
+                    if unit_name in planned:
+                        planned[unit_name]["quantity"] += 1
+                        continue
+                    panjang, lebar, rects = CompositeGroups.seat_layout(data, member, seats, gap)
+                    planned[unit_name] = dict(
+                        data,
+                        panjang=panjang,
+                        lebar=lebar,
+                        quantity=1,
+                        anchor=name,
+                        members=[
+                            {"nama": name if i == 0 else member_name,
+                             "dx": dx, "dy": dy, "panjang": w, "lebar": h}
+                            for i, (dx, dy, w, h) in enumerate(rects)
+                        ]
+                    )
+            elif name in grouped:
+                leftover = data["quantity"] - grouped[name]
+                if leftover > 0:
+                    planned[name] = dict(data, quantity=leftover)
+            else:
+                planned[name] = data
+
+        return planned
+
+    @staticmethod
+    def map_order(order: List[str], catalog: Dict[str, Dict]) -> List[str]:
+        """Urutan nama catalog asli -> urutan entry catalog placement (anchor diganti unit-nya)"""
+        mapped = []
+        for name in order:
+            for entry, data in catalog.items():
+                if (entry == name or data.get("anchor") == name) and entry not in mapped:
+                    mapped.append(entry)
+        return mapped
+
+    @staticmethod
+    def split(data: Dict, catalog: Dict[str, Dict]) -> List[Tuple[str, Dict]]:
+        """Fallback kalau unit tidak muat: member sebagai item individual (data dari catalog asli)"""
+        return [(m["nama"], dict(catalog[m["nama"]], quantity=1)) for m in data["members"]]
+
+    @staticmethod
+    def item_count(data: Dict) -> int:
+        """Jumlah item individual dalam satu entry (1 untuk item biasa)"""
+        return len(data.get("members") or ()) or 1
+
+    @staticmethod
+    def item_area(data: Dict) -> float:
+        """Luas lantai yang benar-benar terpakai (jumlah luas member untuk unit)"""
+        if not data.get("members"):
+            return data["panjang"] * data["lebar"]
+        return sum(m["panjang"] * m["lebar"] for m in data["members"])
+
+    @staticmethod
+    def expand(item: Dict, name: str, data: Dict) -> List[Dict]:
+        """Placed unit -> item individual (meja + kursi) dengan key "group" = nama unit"""
+        if not data.get("members"):
+            return [item]
+        return [
+            dict(
+                item,
+                nama=member["nama"],
+                x=round(item["x"] + member["dx"], 2),
+                y=round(item["y"] + member["dy"], 2),
+                panjang=member["panjang"],
+                lebar=member["lebar"],
+                group=name
+            )
+            for member in data["members"]
+        ]
@@ -0,0 +1,230 @@
+"""
+Constraint Solver - Backtracking CSP di atas candidate set AutoLayoutService
+Domain = feasible positions (FeasibilityMap), forward checking + most-constrained-first,
+hasilnya layout lengkap atau bukti tidak ada layout di spacing yang diminta (dalam budget)
+"""
+import time
+import numpy as np
+from typing import Dict, List, Optional, Tuple
+from config import Config
+from app.services.AutoLayoutService import AutoLayoutService
+from app.services.CompositeGroups import CompositeGroups
+from app.services.LayoutConfig import LayoutConfig
+
+
+class ConstraintSolver:
+    """Backtracking search dengan domain filtering dan MRV ordering (budget node + waktu)"""
+
+    DEFAULT_MAX_NODES = 20000
+    DEFAULT_MAX_MS = 1000
+
+    SOLVED = "solved"
+    INFEASIBLE = "infeasible"  # Search space habis: tidak ada layout lengkap di candidate grid ini
+    BUDGET_EXHAUSTED = "budget_exhausted"
+
+    @staticmethod
+    def conflicts(positions: np.ndarray, panjang: float, lebar: float,
+                  x: float, y: float, w: float, h: float, spacing: float) -> np.ndarray:
+        """Vectorized check_collision: mask kandidat (N, 2) yang collide dengan item (x, y, w, h)"""
+        half = AutoLayoutService.adaptive_spacing(panjang, lebar, w, h, spacing) / 2
+        cx, cy = positions[:, 0], positions[:, 1]
+        return ~((cx + panjang + half <= x - half) | (x + w + half <= cx - half) |
+                 (cy + lebar + half <= y - half) | (y + h + half <= cy - half))
+
+    @staticmethod
+    def layout_variables(room_width: float, room_height: float,
+                         config: LayoutConfig = None) -> Tuple[List[Dict], List[Dict]]:
+        """
+        Satu variable per furniture instance / composite unit (urutan placement_order)
+        Composite unit yang gagal constraint / tanpa feasible position di-split jadi member
+        (sama seperti greedy), jadi INFEASIBLE tidak pernah berasal dari unit yang terlalu besar
+        Return (variables, failed_items) - failed = item yang gagal size / capacity constraint
+        """
+        config = config or AutoLayoutService.DEFAULT_CONFIG
+        catalog = AutoLayoutService.layout_catalog(config)
+        variables = []
+        counted = []  # Item individual (untuk limit jumlah / luas)
+        failed_items = []
+        queue = [(name, catalog[name]) for name in AutoLayoutService.placement_order(catalog)
+                 for _ in range(catalog[name]["quantity"])]
+
+        while queue and len(counted) < config.max_items:
+            name, data = queue.pop(0)
+            # Size / count / area constraint tidak tergantung posisi
+            validation = AutoLayoutService.validate_furniture_constraints(
+                name, data, counted, room_width, room_height, config
+            )
+            if not validation["valid"]:
+                if data.get("members"):
+                    queue[:0] = CompositeGroups.split(data, AutoLayoutService.FURNITURE_CATALOG)
+                    continue
+                failed_items.append({"nama": name, "reason": validation["reason"]})
+                continue
+
+            positions = AutoLayoutService.feasible_positions(
+                data["zone"], data["panjang"], data["lebar"], room_width, config
+            )
+            if len(positions) == 0 and data.get("members"):
+                # Footprint set tidak muat di zone -> meja / kursi jadi variable sendiri
+                queue[:0] = CompositeGroups.split(data, AutoLayoutService.FURNITURE_CATALOG)
+                continue
+
+            counted.extend(data.get("members") or [data])
+            variables.append({
+                "nama": name,
+                "data": data,
+                "panjang": data["panjang"],
+                "lebar": data["lebar"],
+                "zone": data["zone"],
+                "positions": positions
+            })
+
+        return variables, failed_items
+
+    @staticmethod
+    def _filter(variables: List[Dict], domains: List[np.ndarray], assignment: Dict[int, int],
+                var: int, idx: int, spacing: float, stats: Dict) -> Optional[List[np.ndarray]]:
+        """
+        Forward checking: domain baru setelah var = idx (None jika ada domain yang kosong)
+        Instance identik (nama sama) wajib urut index posisi -> permutasi yang sama tidak dicoba ulang
+        """
+        item = variables[var]
+        x, y = item["positions"][idx]
+        reduced = list(domains)
+        blocked = {}  # Per nama: conflict mask seluruh candidate set (dipakai ulang antar instance)
+
+        for other, domain in enumerate(domains):
+            if other == var or other in assignment:
+                continue
+            candidate = variables[other]
+            if candidate["nama"] not in blocked:
+                blocked[candidate["nama"]] = ConstraintSolver.conflicts(
+                    candidate["positions"], candidate["panjang"], candidate["lebar"],
+                    x, y, item["panjang"], item["lebar"], spacing
+                )
+            keep = ~blocked[candidate["nama"]][domain]
+            if candidate["nama"] == item["nama"]:
+                keep &= (domain > idx) if other > var else (domain < idx)
+
+            removed = len(domain) - int(keep.sum())
+            if removed:
+                stats["pruned"] += removed
+                domain = domain[keep]
+                if len(domain) == 0:
+                    return None
+            reduced[other] = domain
+
+        return reduced
+
+    @staticmethod
+    def solve(variables: List[Dict], spacing: float, max_nodes: int = None,
+              max_ms: float = None) -> Dict:
+        """
+        Cari assignment {variable index: position index} tanpa collision
+        Return {status, assignment, stats} - assignment = partial terdalam jika tidak solved
+        """
+        max_nodes = ConstraintSolver.DEFAULT_MAX_NODES if max_nodes is None else max_nodes
+        max_ms = ConstraintSolver.DEFAULT_MAX_MS if max_ms is None else max_ms
+        max_nodes = max(0, min(int(max_nodes), Config.SOLVER_MAX_NODES))
+        max_ms = max(0.0, min(float(max_ms), Config.SOLVER_MAX_MS))
+        start = time.perf_counter()
+        deadline = start + max_ms / 1000.0
+        stats = {"nodes": 0, "backtracks": 0, "pruned": 0}
+        state = {"best": {}, "exhausted": False}
+        domains = [np.arange(len(v["positions"])) for v in variables]
+        # Variable tanpa candidate sama sekali: layout lengkap pasti tidak ada, sisanya tetap dicari
+        active = [v for v in range(len(variables)) if len(domains[v])]
+
+        def search(domains: List[np.ndarray], assignment: Dict[int, int]) -> bool:
+            if len(assignment) == len(active):
+                return True
+
+            # Most constrained first (domain terkecil), tie -> urutan placement
+            var = min((v for v in active if v not in assignment),
+                      key=lambda v: (len(domains[v]), v))
+
+            # Value order = priority order candidate (sama dengan greedy)
+            for idx in domains[var].tolist():
+                if stats["nodes"] >= max_nodes or time.perf_counter() >= deadline:
+                    state["exhausted"] = True
+                    return False
+                stats["nodes"] += 1
+                # var = idx selalu konsisten dengan assignment (domain sudah difilter)
+                if len(assignment) >= len(state["best"]):
+                    state["best"] = {**assignment, var: idx}
+
+                reduced = ConstraintSolver._filter(variables, domains, assignment, var, idx, spacing, stats)
+                if reduced is not None:
+                    assignment[var] = idx
+                    if search(reduced, assignment):
+                        return True
+                    del assignment[var]
+                    if state["exhausted"]:
+                        return False
+                stats["backtracks"] += 1
+            return False
+
+        assignment = {}
+        if search(domains, assignment):
+            status = ConstraintSolver.SOLVED if len(active) == len(variables) else ConstraintSolver.INFEASIBLE
+            result = assignment
+        else:
+            status = ConstraintSolver.BUDGET_EXHAUSTED if state["exhausted"] else ConstraintSolver.INFEASIBLE
+            result = state["best"]
+
+        return {
+            "status": status,
+            "assignment": result,
+            "stats": dict(
+                stats,
+                variables=len(variables),
+                elapsed_ms=round((time.perf_counter() - start) * 1000, 2),
+                max_nodes=max_nodes,
+                max_ms=max_ms
+            )
+        }
+
+    @staticmethod
+    def solve_layout(room_width: float = 17.0, room_height: float = 11.0,
+                     max_nodes: int = None, max_ms: float = None,
+                     config: LayoutConfig = None) -> Dict:
+        """
+        Layout lengkap di config.min_spacing (tanpa spacing relaxation seperti greedy retry)
+        Response sama dengan AutoLayoutService + key "solver" (status, nodes, backtracks, ...)
+        """
+        config = config or AutoLayoutService.DEFAULT_CONFIG
+        variables, failed_items = ConstraintSolver.layout_variables(room_width, room_height, config)
+        outcome = ConstraintSolver.solve(variables, config.min_spacing, max_nodes, max_ms)
+        assignment = outcome["assignment"]
+
+        placed_items = []
+        for var, item in enumerate(variables):
+            if var not in assignment:
+                failed_items.append({
+                    "nama": item["nama"],
+                    "reason": f"No complete layout at {config.min_spacing}m spacing ({outcome['status']})"
+                })
+                continue
+            x, y = item["positions"][assignment[var]]
+            unit = {
+                "nama": item["nama"],
+                "x": round(float(x), 2),
+                "y": round(float(y), 2),
+                "panjang": item["panjang"],
+                "lebar": item["lebar"],
+                "zone": item["zone"],
+                "color": AutoLayoutService.get_zone_color(item["zone"])
+            }
+            for placed in CompositeGroups.expand(unit, item["nama"], item["data"]):
+                placed["uid"] = len(placed_items) + 1
+                placed_items.append(placed)
+
+        stats = outcome["stats"]
+        print(f"🧩 Constraint solver: {outcome['status']} ({len(placed_items)}/{stats['variables']} items, "
+              f"{stats['nodes']} nodes, {stats['backtracks']} backtracks, {stats['elapsed_ms']:.0f}ms)")
+
+        result = AutoLayoutService.build_result(
+            placed_items, failed_items, room_width, room_height, config
+        )
+        result["solver"] = dict(stats, status=outcome["status"], min_spacing=config.min_spacing)
+        return result
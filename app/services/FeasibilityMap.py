@@ -0,0 +1,123 @@
+"""
+Feasibility Map - Precomputed static feasibility per (zone, footprint, margin, grid)
+Zones dan obstacles static, jadi posisi yang lolos zone + obstacle check cukup dihitung sekali
+Saat request tinggal cek collision dengan placed items
+"""
+import hashlib
+import json
+import os
+import threading
+import numpy as np
+from typing import Callable, Dict, Optional, Tuple
+from config import Config
+
+
+class FeasibilityMap:
+    """In-process cache (optional .npz persistence) untuk static feasibility arrays"""
+
+    _maps = {}  # key -> tuple of np.ndarray
+    _lock = threading.Lock()
+    _stats = {"hits": 0, "builds": 0, "loaded": 0}
+    _autoloaded = False
+
+    path = Config.FEASIBILITY_MAP_PATH  # Di-load otomatis saat miss pertama (jika file ada)
+
+    @staticmethod
+    def make_key(**params) -> str:
+        """Key dari semua parameter yang menentukan feasibility (zone, obstacles, footprint, ...)"""
+        payload = json.dumps(params, sort_keys=True, separators=(",", ":"), default=str)
+        return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def get_or_build(key: str, build: Callable[[], Tuple[np.ndarray, ...]]) -> Tuple[np.ndarray, ...]:
+        """Return cached arrays atau build sekali (arrays dibuat read-only)"""
+        arrays = FeasibilityMap._maps.get(key)
+        if arrays is None and not FeasibilityMap._autoloaded:
+            FeasibilityMap._autoload()
+            arrays = FeasibilityMap._maps.get(key)
+        if arrays is not None:
+            FeasibilityMap._stats["hits"] += 1
+            return arrays
+
+        arrays = tuple(np.asarray(a) for a in build())
+        for a in arrays:
+            a.setflags(write=False)
+
+        with FeasibilityMap._lock:
+            FeasibilityMap._maps.setdefault(key, arrays)
+            FeasibilityMap._stats["builds"] += 1
+            return FeasibilityMap._maps[key]
+
+    @staticmethod
+    def _autoload():
+        with FeasibilityMap._lock:
+            if FeasibilityMap._autoloaded:
+                return
+            FeasibilityMap._autoloaded = True
+        try:
+            FeasibilityMap.load(FeasibilityMap.path)
+        except (OSError, ValueError) as e:
+            print(f"⚠️ Feasibility maps load failed: {e}")
+
+    @staticmethod
+    def save(path: Optional[str] = None) -> int:
+        """Persist semua map ke .npz (atomic replace), return jumlah map"""
+        path = path or FeasibilityMap.path
+        with FeasibilityMap._lock:
+            items = list(FeasibilityMap._maps.items())
+
+        arrays = {}
+        for key, values in items:
+            for i, value in enumerate(values):
+                arrays[f"{key}__{i}"] = value
+
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+        print(f"✅ Feasibility maps saved: {path} ({len(items)} maps)")
+        return len(items)
+
+    @staticmethod
+    def load(path: Optional[str] = None) -> int:
+        """Load map dari .npz (jika ada), return jumlah map yang di-load"""
+        path = path or FeasibilityMap.path
+        if not path or not os.path.exists(path):
+            return 0
+
+        grouped = {}
+        with np.load(path) as data:
+            for name in data.files:
+                key, _, index = name.rpartition("__")
+                grouped.setdefault(key, {})[int(index)] = data[name]
+
+        with FeasibilityMap._lock:
+            for key, parts in grouped.items():
+                arrays = tuple(parts[i] for i in sorted(parts))
+                for a in arrays:
+                    a.setflags(write=False)
+                FeasibilityMap._maps.setdefault(key, arrays)
+            FeasibilityMap._stats["loaded"] += len(grouped)
+
+        print(f"✅ Feasibility maps loaded: {path} ({len(grouped)} maps)")
+        return len(grouped)
+
+    @staticmethod
+    def stats() -> Dict:
+        """Jumlah map, bytes, hits dan builds"""
+        with FeasibilityMap._lock:
+            maps = list(FeasibilityMap._maps.values())
+            stats = dict(FeasibilityMap._stats)
+        stats["maps"] = len(maps)
+        stats["bytes"] = int(sum(a.nbytes for arrays in maps for a in arrays))
+        return stats
+
+    @staticmethod
+    def clear(autoload: bool = True):
+        """
+        Kosongkan cache in-process
+        autoload=False: file .npz tidak di-load lagi saat miss (build ulang dari nol sebelum save)
+        """
+        with FeasibilityMap._lock:
+            FeasibilityMap._maps = {}
+            FeasibilityMap._autoloaded = not autoload
@@ -0,0 +1,121 @@
+"""
+Free Space - Maximal empty rectangles dari ruangan (obstacles + placed items)
+Query "di mana furniture W x H bisa ditaruh" dalam satu call, tanpa probing posisi satu-satu
+"""
+import json
+from typing import Dict, List, Optional, Tuple
+from app.services.MaxRects import MaxRects
+
+
+class FreeSpace:
+    """Free space ruangan sebagai MaxRects (satuan sama dengan koordinat item)"""
+
+    def __init__(self, width: float, height: float, obstacles: List[Dict] = None,
+                 obstacle_padding: float = 0.0, origin: Tuple[float, float] = (0.0, 0.0)):
+        """origin: pojok kiri-atas area (default 0, 0), area = origin .. origin + (width, height)"""
+        self.width = width
+        self.height = height
+        self.origin = origin
+        self.rects = MaxRects(origin[0], origin[1], origin[0] + width, origin[1] + height)
+        for obstacle in obstacles or []:
+            self.add(obstacle["x"], obstacle["y"], obstacle["width"], obstacle["height"],
+                     obstacle_padding)
+
+    def add(self, x: float, y: float, width: float, height: float, padding: float = 0.0):
+        """Tandai rect (diperluas padding di semua sisi) sebagai terpakai"""
+        self.rects.occupy(x - padding, y - padding, x + width + padding, y + height + padding)
+
+    def add_items(self, items: List[Dict], padding: float = 0.0,
+                  width_key: str = "panjang", height_key: str = "lebar"):
+        for item in items:
+            self.add(item["x"], item["y"], item[width_key], item[height_key], padding)
+
+    def rectangles(self, min_width: float = 0.0, min_height: float = 0.0,
+                   zone: Dict = None) -> List[Tuple[float, float, float, float]]:
+        """
+        Maximal empty rectangles (x0, y0, x1, y1) dengan ukuran minimum
+        zone: batasi ke area zone (x_min, x_max, y_min, y_max) -> tetap maximal di dalam zone
+        """
+        if zone is not None:
+            rects = self.rects.clipped(zone["x_min"], zone["y_min"], zone["x_max"], zone["y_max"])
+        else:
+            rects = self.rects.free
+
+        return sorted(
+            r for r in rects
+            if r[2] - r[0] >= min_width - MaxRects.EPS and r[3] - r[1] >= min_height - MaxRects.EPS
+        )
+
+    def nearest_position(self, x: float, y: float, width: float,
+                         height: float) -> Optional[Tuple[float, float]]:
+        """Posisi valid terdekat ke (x, y) untuk rect width x height (None kalau tidak ada yang muat)"""
+        return self.rects.nearest(x, y, width, height)
+
+    @staticmethod
+    def to_dicts(rects: List[Tuple[float, float, float, float]], decimals: int = 3) -> List[Dict]:
+        """Format response API: {x, y, width, height, area}"""
+        return [
+            {
+                "x": round(x0, decimals),
+                "y": round(y0, decimals),
+                "width": round(x1 - x0, decimals),
+                "height": round(y1 - y0, decimals),
+                "area": round((x1 - x0) * (y1 - y0), decimals)
+            }
+            for x0, y0, x1, y1 in rects
+        ]
+
+    @staticmethod
+    def parse_layout_data(layout_data) -> Dict:
+        """
+        Normalisasi layout_data tersimpan (HouseLayout) -> {width, height, items, obstacles}
+        Menerima hasil auto-place ({placed_items, room_dimensions}) maupun {items/furniture, room_width, ...}
+        Item boleh pakai panjang/lebar atau width/height
+        """
+        if isinstance(layout_data, (str, bytes)):
+            layout_data = json.loads(layout_data or "{}")
+        if isinstance(layout_data, list):
+            layout_data = {"items": layout_data}
+        layout_data = layout_data or {}
+
+        room = layout_data.get("room_dimensions") or {}
+        width = float(room.get("width", layout_data.get("room_width", 17.0)))
+        height = float(room.get("height", layout_data.get("room_height", 11.0)))
+
+        raw_items = (layout_data.get("placed_items") or layout_data.get("items")
+                     or layout_data.get("furniture") or [])
+        items = []
+        for item in raw_items:
+            w = item.get("panjang", item.get("width"))
+            h = item.get("lebar", item.get("height"))
+            if item.get("x") is None or item.get("y") is None or w is None or h is None:
+                continue
+            items.append({"x": float(item["x"]), "y": float(item["y"]),
+                          "panjang": float(w), "lebar": float(h)})
+
+        return {
+            "width": width,
+            "height": height,
+            "items": items,
+            "obstacles": layout_data.get("obstacles")
+        }
+
+    @staticmethod
+    def from_layout(layout_data, default_obstacles: List[Dict] = None,
+                    padding: float = 0.0, obstacle_padding: Optional[float] = None,
+                    use_obstacles: bool = True) -> "FreeSpace":
+        """
+        Build FreeSpace dari layout_data (obstacles dari layout, fallback default_obstacles)
+        use_obstacles False -> semua obstacles diabaikan (termasuk yang tersimpan di layout)
+        """
+        parsed = FreeSpace.parse_layout_data(layout_data)
+        if not use_obstacles:
+            obstacles = []
+        elif parsed["obstacles"] is not None:
+            obstacles = parsed["obstacles"]
+        else:
+            obstacles = default_obstacles or []
+        space = FreeSpace(parsed["width"], parsed["height"], obstacles,
+                          padding if obstacle_padding is None else obstacle_padding)
+        space.add_items(parsed["items"], padding)
+        return space
@@ -0,0 +1,137 @@
+"""
+Layout Cache - Content-addressed cache untuk hasil auto layout
+Key = hash canonical dari semua input (catalog, zones, obstacles, spacing, room) + engine version
+"""
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from typing import Callable, Dict, Optional
+from config import Config
+
+
+class LayoutCache:
+    """In-memory LRU (size bound) + optional on-disk tier yang survive restart"""
+
+    FORMAT_VERSION = 1  # Naikkan jika format key/value berubah
+
+    _memory = OrderedDict()  # key -> JSON string (immutable, caller selalu dapat copy baru)
+    _lock = threading.Lock()
+    _stats = {"memory_hits": 0, "disk_hits": 0, "misses": 0, "stores": 0, "evictions": 0}
+
+    max_entries = Config.LAYOUT_CACHE_SIZE
+    disk_dir = Config.LAYOUT_CACHE_DIR  # None = disk tier nonaktif
+
+    @staticmethod
+    def make_key(engine: str, engine_version: str, inputs: Dict) -> str:
+        """Canonical hash (sha256) dari engine + inputs"""
+        payload = json.dumps(
+            {"format": LayoutCache.FORMAT_VERSION, "engine": engine,
+             "engine_version": engine_version, "inputs": inputs},
+            sort_keys=True, separators=(",", ":"), default=str
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def get_or_compute(engine: str, engine_version: str, inputs: Dict,
+                       compute: Callable[[], Dict]) -> Dict:
+        """Return cached result (copy) atau hitung, simpan, lalu return"""
+        key = LayoutCache.make_key(engine, engine_version, inputs)
+
+        cached = LayoutCache._get(key)
+        if cached is not None:
+            print(f"♻️ Layout cache hit ({engine}, {key[:12]})")
+            return json.loads(cached)
+
+        result = compute()
+        LayoutCache._put(key, json.dumps(result))
+        return result
+
+    @staticmethod
+    def _get(key: str) -> Optional[str]:
+        with LayoutCache._lock:
+            value = LayoutCache._memory.get(key)
+            if value is not None:
+                LayoutCache._memory.move_to_end(key)
+                LayoutCache._stats["memory_hits"] += 1
+                return value
+
+        value = LayoutCache._read_disk(key)
+        with LayoutCache._lock:
+            if value is None:
+                LayoutCache._stats["misses"] += 1
+                return None
+            LayoutCache._stats["disk_hits"] += 1
+            LayoutCache._remember(key, value)
+        return value
+
+    @staticmethod
+    def _put(key: str, value: str):
+        with LayoutCache._lock:
+            LayoutCache._stats["stores"] += 1
+            LayoutCache._remember(key, value)
+        LayoutCache._write_disk(key, value)
+
+    @staticmethod
+    def _remember(key: str, value: str):
+        """Insert ke LRU (caller memegang lock)"""
+        LayoutCache._memory[key] = value
+        LayoutCache._memory.move_to_end(key)
+        while len(LayoutCache._memory) > LayoutCache.max_entries:
+            LayoutCache._memory.popitem(last=False)
+            LayoutCache._stats["evictions"] += 1
+
+    @staticmethod
+    def _disk_path(key: str) -> Optional[str]:
+        if not LayoutCache.disk_dir:
+            return None
+        return os.path.join(LayoutCache.disk_dir, f"{key}.json")
+
+    @staticmethod
+    def _read_disk(key: str) -> Optional[str]:
+        path = LayoutCache._disk_path(key)
+        if not path or not os.path.exists(path):
+            return None
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                return f.read()
+        except OSError as e:
+            print(f"⚠️ Layout cache read failed: {e}")
+            return None
+
+    @staticmethod
+    def _write_disk(key: str, value: str):
+        path = LayoutCache._disk_path(key)
+        if not path:
+            return
+        try:
+            os.makedirs(LayoutCache.disk_dir, exist_ok=True)
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                f.write(value)
+            os.replace(tmp_path, path)  # Atomic, reader tidak pernah lihat file setengah jadi
+        except OSError as e:
+            print(f"⚠️ Layout cache write failed: {e}")
+
+    @staticmethod
+    def stats() -> Dict:
+        """Hit/miss statistics"""
+        with LayoutCache._lock:
+            stats = dict(LayoutCache._stats)
+            stats["memory_entries"] = len(LayoutCache._memory)
+        lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+        stats["hit_rate"] = round((lookups - stats["misses"]) / lookups, 4) if lookups else 0.0
+        stats["max_entries"] = LayoutCache.max_entries
+        stats["disk_dir"] = LayoutCache.disk_dir
+        return stats
+
+    @staticmethod
+    def clear(disk: bool = False):
+        """Kosongkan memory tier (dan disk tier jika disk=True)"""
+        with LayoutCache._lock:
+            LayoutCache._memory.clear()
+        if disk and LayoutCache.disk_dir and os.path.isdir(LayoutCache.disk_dir):
+            for name in os.listdir(LayoutCache.disk_dir):
+                if name.endswith(".json"):
+                    os.remove(os.path.join(LayoutCache.disk_dir, name))
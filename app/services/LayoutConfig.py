@@ -0,0 +1,44 @@
+"""
+Layout Config - Immutable parameter set untuk layout engines
+Dipass per call (bukan class attribute yang di-mutate) supaya request paralel tidak saling ganggu
+"""
+from dataclasses import asdict, dataclass, replace
+from typing import Dict, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class LayoutConfig:
+    """Spacing, margin dan limit satu layout run (frozen -> aman di-share antar thread)"""
+
+    min_spacing: float
+    wall_margin: float
+    obstacle_margin: float
+    max_items: Optional[int] = None  # None = tanpa limit
+    max_size: Optional[float] = None
+    min_size: Optional[float] = None
+    max_area_ratio: Optional[float] = None
+    zone_engines: Tuple[Tuple[str, str], ...] = ()  # ((zone, engine), ...), default engine "grid"
+    composite_groups: bool = False  # Meja + kursi ditempatkan sebagai satu unit (CompositeGroups)
+    prefilter_top_k: Optional[int] = None  # AI: model hanya di top-K coarse cell (None = semua kandidat)
+
+    def with_spacing(self, min_spacing: float) -> "LayoutConfig":
+        """Copy dengan min_spacing berbeda (spacing relaxation saat retry)"""
+        return replace(self, min_spacing=min_spacing)
+
+    def with_zone_engines(self, zone_engines: Dict[str, str]) -> "LayoutConfig":
+        """Copy dengan placement engine per zone, mis. {"dining": "maxrects"}"""
+        return replace(self, zone_engines=tuple(sorted(zone_engines.items())))
+
+    def with_composite_groups(self, enabled: bool = True) -> "LayoutConfig":
+        """Copy dengan composite group placement on/off"""
+        return replace(self, composite_groups=enabled)
+
+    def with_prefilter(self, top_k: Optional[int]) -> "LayoutConfig":
+        """Copy dengan coarse-to-fine prefilter top-K (None = model scoring semua kandidat)"""
+        return replace(self, prefilter_top_k=top_k)
+
+    def engine_for(self, zone: str, default: str = "grid") -> str:
+        return dict(self.zone_engines).get(zone, default)
+
+    def to_dict(self) -> Dict:
+        return asdict(self)
@@ -0,0 +1,119 @@
+"""
+Layout Features - Batched feature matrix builder
+Dipakai bersama oleh AILayoutService (prediksi) dan AILayoutTrainer (training)
+supaya feature engineering tidak pernah berbeda antara training dan serving
+"""
+import numpy as np
+from typing import Dict, List
+
+
+class LayoutFeatures:
+    """Vectorized feature extraction untuk Random Forest layout model"""
+
+    FEATURE_NAMES = [
+        "x", "y", "panjang", "lebar",
+        "x_end", "y_end", "center_x", "center_y",
+        "zone_center_dx", "zone_center_dy", "zone_width", "zone_height",
+        "min_obstacle_dist", "min_furniture_dist", "nearby_count",
+        "furniture_type", "zone_code"
+    ]
+
+    ZONE_CODES = {"living": 0, "dining": 1, "outdoor": 2, "decoration": 3}
+
+    NEARBY_RADIUS = 2.0  # 2m radius untuk nearby_count
+    NO_NEIGHBOUR_DIST = 999  # Default distance jika tidak ada obstacle/furniture
+
+    @staticmethod
+    def min_distances(xs: np.ndarray, ys: np.ndarray, points: np.ndarray) -> np.ndarray:
+        """Euclidean distance matrix (N candidates x M points)"""
+        if len(points) == 0:
+            return np.empty((len(xs), 0))
+        dx = xs[:, None] - points[None, :, 0]
+        dy = ys[:, None] - points[None, :, 1]
+        return np.sqrt(dx ** 2 + dy ** 2)
+
+    @staticmethod
+    def build_matrix(xs, ys, panjang: float, lebar: float, zone_name: str,
+                     zones: Dict, obstacles: List[Dict], placed_items: List[Dict],
+                     furniture_type: str, furniture_types: List[str]) -> np.ndarray:
+        """
+        Feature matrix (N, 17) untuk N kandidat posisi sekaligus
+        Urutan kolom sama dengan FEATURE_NAMES
+        """
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+
+        # Distance ke semua furniture yang sudah ditempatkan (sama untuk setiap kandidat)
+        placed_points = np.array([[p["x"], p["y"]] for p in placed_items], dtype=float).reshape(-1, 2)
+        furniture_dist = LayoutFeatures.min_distances(xs, ys, placed_points)
+        return LayoutFeatures._matrix(xs, ys, panjang, lebar, zone_name, zones, obstacles,
+                                      furniture_dist, furniture_type, furniture_types)
+
+    @staticmethod
+    def build_matrix_rows(xs, ys, panjang: float, lebar: float, zone_name: str,
+                          zones: Dict, obstacles: List[Dict], placed_xy: np.ndarray,
+                          placed_mask: np.ndarray, furniture_type: str,
+                          furniture_types: List[str]) -> np.ndarray:
+        """
+        Seperti build_matrix, tapi setiap baris punya placed items sendiri (training data)
+        placed_xy (N, K, 2) padded, placed_mask (N, K) True untuk item yang ada
+        """
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+
+        # Slot padding -> inf: tidak pernah jadi minimum / masuk nearby_count
+        dx = xs[:, None] - placed_xy[:, :, 0]
+        dy = ys[:, None] - placed_xy[:, :, 1]
+        furniture_dist = np.where(placed_mask, np.sqrt(dx ** 2 + dy ** 2), np.inf)
+        return LayoutFeatures._matrix(xs, ys, panjang, lebar, zone_name, zones, obstacles,
+                                      furniture_dist, furniture_type, furniture_types)
+
+    @staticmethod
+    def _matrix(xs: np.ndarray, ys: np.ndarray, panjang: float, lebar: float, zone_name: str,
+                zones: Dict, obstacles: List[Dict], furniture_dist: np.ndarray,
+                furniture_type: str, furniture_types: List[str]) -> np.ndarray:
+        """Isi feature matrix dari posisi + distance matrix furniture (N, M)"""
+        n = len(xs)
+        zone = zones.get(zone_name)
+
+        features = np.empty((n, len(LayoutFeatures.FEATURE_NAMES)))
+
+        # Basic position features
+        features[:, 0] = xs
+        features[:, 1] = ys
+        features[:, 2] = panjang
+        features[:, 3] = lebar
+        features[:, 4] = xs + panjang
+        features[:, 5] = ys + lebar
+        features[:, 6] = xs + panjang / 2
+        features[:, 7] = ys + lebar / 2
+
+        # Zone features
+        zone_center_x = (zone["x_min"] + zone["x_max"]) / 2
+        zone_center_y = (zone["y_min"] + zone["y_max"]) / 2
+        features[:, 8] = np.abs(xs - zone_center_x)
+        features[:, 9] = np.abs(ys - zone_center_y)
+        features[:, 10] = zone["x_max"] - zone["x_min"]
+        features[:, 11] = zone["y_max"] - zone["y_min"]
+
+        # Distance to nearest obstacle
+        obstacle_points = np.array([[o["x"], o["y"]] for o in obstacles], dtype=float).reshape(-1, 2)
+        obstacle_dist = LayoutFeatures.min_distances(xs, ys, obstacle_points)
+        features[:, 12] = LayoutFeatures._row_min(obstacle_dist)
+
+        # Distance to nearest furniture + nearby count
+        features[:, 13] = LayoutFeatures._row_min(furniture_dist)
+        features[:, 14] = (furniture_dist < LayoutFeatures.NEARBY_RADIUS).sum(axis=1)
+
+        # Categorical encodings
+        features[:, 15] = furniture_types.index(furniture_type) if furniture_type in furniture_types else -1
+        features[:, 16] = LayoutFeatures.ZONE_CODES.get(zone_name, -1)
+
+        return features
+
+    @staticmethod
+    def _row_min(distances: np.ndarray) -> np.ndarray:
+        """Minimum per row, NO_NEIGHBOUR_DIST jika kosong atau lebih jauh"""
+        if distances.shape[1] == 0:
+            return np.full(distances.shape[0], float(LayoutFeatures.NO_NEIGHBOUR_DIST))
+        return np.minimum(distances.min(axis=1), LayoutFeatures.NO_NEIGHBOUR_DIST)
@@ -0,0 +1,106 @@
+"""
+Layout Score - Quality score untuk posisi furniture dan layout lengkap
+Notion yang sama dengan AILayoutTrainer: dekat zone center, jauh dari obstacle, tidak menumpuk
+"""
+import numpy as np
+from typing import Dict, List
+
+
+class LayoutScore:
+    """Scoring posisi / layout (higher is better)"""
+
+    @staticmethod
+    def position_score(x: float, y: float, zone: Dict, obstacles: List[Dict],
+                       placed_items: List[Dict]) -> float:
+        """Calculate quality score for a position (0.1-1, higher is better)"""
+        score = 1.0
+
+        # Prefer center of zone
+        zone_center_x = (zone["x_min"] + zone["x_max"]) / 2
+        zone_center_y = (zone["y_min"] + zone["y_max"]) / 2
+        center_dist = np.sqrt((x - zone_center_x)**2 + (y - zone_center_y)**2)
+        score *= (1.0 - min(center_dist / 10.0, 0.5))  # Max 50% penalty
+
+        # Prefer positions away from obstacles
+        min_obstacle_dist = 999
+        for obstacle in obstacles:
+            dist = np.sqrt((x - obstacle["x"])**2 + (y - obstacle["y"])**2)
+            min_obstacle_dist = min(min_obstacle_dist, dist)
+        if min_obstacle_dist < 1.0:
+            score *= 0.5  # Heavy penalty for being too close
+
+        # Prefer even spacing from other furniture
+        if placed_items:
+            distances = [np.sqrt((x - item["x"])**2 + (y - item["y"])**2)
+                         for item in placed_items]
+            avg_dist = np.mean(distances)
+            if avg_dist < 1.0:
+                score *= 0.7  # Penalty for clustering
+
+        return max(score, 0.1)  # Minimum score 0.1
+
+    @staticmethod
+    def position_scores(xs, ys, zone: Dict, obstacles: List[Dict],
+                        placed_items: List[Dict]) -> np.ndarray:
+        """position_score untuk N posisi sekaligus (vectorized, aturan penalty sama)"""
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        scores = LayoutScore._zone_obstacle_scores(xs, ys, zone, obstacles)
+
+        if placed_items:
+            px = np.array([p["x"] for p in placed_items], dtype=float)
+            py = np.array([p["y"] for p in placed_items], dtype=float)
+            avg_dist = np.sqrt((xs[:, None] - px)**2 + (ys[:, None] - py)**2).mean(axis=1)
+            scores = np.where(avg_dist < 1.0, scores * 0.7, scores)
+
+        return np.maximum(scores, 0.1)
+
+    @staticmethod
+    def _zone_obstacle_scores(xs: np.ndarray, ys: np.ndarray, zone: Dict,
+                              obstacles: List[Dict]) -> np.ndarray:
+        """Penalty zone center + obstacle (sebelum penalty clustering dan batas minimum 0.1)"""
+        zone_center_x = (zone["x_min"] + zone["x_max"]) / 2
+        zone_center_y = (zone["y_min"] + zone["y_max"]) / 2
+        center_dist = np.sqrt((xs - zone_center_x)**2 + (ys - zone_center_y)**2)
+        scores = 1.0 - np.minimum(center_dist / 10.0, 0.5)
+
+        if obstacles:
+            ox = np.array([o["x"] for o in obstacles], dtype=float)
+            oy = np.array([o["y"] for o in obstacles], dtype=float)
+            obstacle_dist = np.sqrt((xs[:, None] - ox)**2 + (ys[:, None] - oy)**2).min(axis=1)
+            scores = np.where(obstacle_dist < 1.0, scores * 0.5, scores)
+        return scores
+
+    @staticmethod
+    def position_scores_rows(xs, ys, zone: Dict, obstacles: List[Dict],
+                             placed_xy: np.ndarray, placed_mask: np.ndarray) -> np.ndarray:
+        """
+        position_score untuk N posisi, setiap baris dengan placed items sendiri (training data)
+        placed_xy (N, K, 2) padded, placed_mask (N, K) True untuk item yang ada
+        """
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        scores = LayoutScore._zone_obstacle_scores(xs, ys, zone, obstacles)
+
+        count = placed_mask.sum(axis=1)
+        dist = np.sqrt((xs[:, None] - placed_xy[:, :, 0])**2 + (ys[:, None] - placed_xy[:, :, 1])**2)
+        total = np.where(placed_mask, dist, 0.0).sum(axis=1)
+        avg_dist = np.divide(total, count, out=np.full(len(xs), np.inf), where=count > 0)
+        return np.maximum(np.where(avg_dist < 1.0, scores * 0.7, scores), 0.1)
+
+    @staticmethod
+    def layout_score(placed_items: List[Dict], zones: Dict, obstacles: List[Dict]) -> float:
+        """
+        Score layout lengkap = jumlah item terpasang + rata-rata position_score
+        Rata-rata di [0.1, 1], jadi layout dengan item lebih banyak selalu menang
+        """
+        if not placed_items:
+            return 0.0
+
+        total = 0.0
+        for i, item in enumerate(placed_items):
+            others = placed_items[:i] + placed_items[i + 1:]
+            total += LayoutScore.position_score(
+                item["x"], item["y"], zones[item["zone"]], obstacles, others
+            )
+        return float(len(placed_items) + total / len(placed_items))
@@ -0,0 +1,106 @@
+"""
+MaxRects - Free space sebagai himpunan maximal empty rectangles
+Dipakai untuk packing (best short side fit) dan free-space query
+"""
+from typing import List, Optional, Tuple
+
+Rect = Tuple[float, float, float, float]  # (x0, y0, x1, y1)
+
+
+class MaxRects:
+    """
+    Maximal free rectangles dalam satu bin (x0, y0, x1, y1)
+    Setiap occupy() memotong free rectangle yang beririsan menjadi max 4 sisa,
+    lalu membuang rectangle yang sepenuhnya berada di dalam rectangle lain
+    """
+
+    EPS = 1e-9
+
+    def __init__(self, x0: float, y0: float, x1: float, y1: float):
+        self.bounds = (x0, y0, x1, y1)
+        self.free = [(x0, y0, x1, y1)] if x1 > x0 and y1 > y0 else []
+
+    def occupy(self, x0: float, y0: float, x1: float, y1: float):
+        """Tandai area (x0, y0, x1, y1) sebagai terpakai (boleh di luar bin)"""
+        eps = MaxRects.EPS
+        untouched = []
+        fragments = []
+        for rect in self.free:
+            fx0, fy0, fx1, fy1 = rect
+            # Menyentuh saja tidak dihitung beririsan
+            if x0 >= fx1 - eps or x1 <= fx0 + eps or y0 >= fy1 - eps or y1 <= fy0 + eps:
+                untouched.append(rect)
+                continue
+            if x0 > fx0 + eps:
+                fragments.append((fx0, fy0, x0, fy1))
+            if x1 < fx1 - eps:
+                fragments.append((x1, fy0, fx1, fy1))
+            if y0 > fy0 + eps:
+                fragments.append((fx0, fy0, fx1, y0))
+            if y1 < fy1 - eps:
+                fragments.append((fx0, y1, fx1, fy1))
+
+        # Rectangle yang tidak tersentuh sudah maximal: cukup prune fragment baru
+        self.free = untouched + MaxRects._prune(fragments, untouched) if fragments else untouched
+
+    @staticmethod
+    def _prune(rects: List[Rect], fixed: List[Rect] = ()) -> List[Rect]:
+        """
+        Buang rectangle yang terkandung di rectangle lain atau di `fixed`
+        (duplikat disimpan sekali, `fixed` tidak ikut di-return)
+        """
+        eps = MaxRects.EPS
+        # Besar dulu: rectangle hanya bisa terkandung di rectangle yang area-nya >= dirinya
+        rects = sorted(set(rects), key=lambda r: -(r[2] - r[0]) * (r[3] - r[1]))
+        kept = []
+        for r in rects:
+            x0, y0, x1, y1 = r[0] + eps, r[1] + eps, r[2] - eps, r[3] - eps
+            if not any(k[0] <= x0 and k[1] <= y0 and k[2] >= x1 and k[3] >= y1
+                       for group in (kept, fixed) for k in group):
+                kept.append(r)
+        return kept
+
+    def candidates(self, width: float, height: float) -> List[Tuple[float, float]]:
+        """
+        Posisi (x, y) kiri-atas free rectangle yang muat width x height,
+        urut best short side fit (sisa sisi pendek terkecil), lalu long side, y, x
+        """
+        eps = MaxRects.EPS
+        scored = []
+        for fx0, fy0, fx1, fy1 in self.free:
+            leftover_w = (fx1 - fx0) - width
+            leftover_h = (fy1 - fy0) - height
+            if leftover_w < -eps or leftover_h < -eps:
+                continue
+            scored.append((min(leftover_w, leftover_h), max(leftover_w, leftover_h), fy0, fx0))
+        scored.sort()
+        return [(x, y) for _, _, y, x in scored]
+
+    def nearest(self, x: float, y: float, width: float,
+                height: float) -> Optional[Tuple[float, float]]:
+        """
+        Posisi kiri-atas terdekat (euclidean) ke (x, y) di mana width x height muat, atau None
+        Exact: setiap posisi valid berada di dalam salah satu maximal free rectangle,
+        jadi cukup clamp (x, y) ke range posisi tiap rectangle yang muat
+        """
+        eps = MaxRects.EPS
+        best = None
+        best_dist = None
+        for fx0, fy0, fx1, fy1 in self.free:
+            if (fx1 - fx0) - width < -eps or (fy1 - fy0) - height < -eps:
+                continue
+            px = min(max(x, fx0), max(fx0, fx1 - width))
+            py = min(max(y, fy0), max(fy0, fy1 - height))
+            dist = (px - x) ** 2 + (py - y) ** 2
+            if best_dist is None or dist < best_dist:
+                best, best_dist = (px, py), dist
+        return best
+
+    def clipped(self, x0: float, y0: float, x1: float, y1: float) -> List[Rect]:
+        """Maximal empty rectangles di dalam window (x0, y0, x1, y1)"""
+        clipped = []
+        for fx0, fy0, fx1, fy1 in self.free:
+            cx0, cy0, cx1, cy1 = max(fx0, x0), max(fy0, y0), min(fx1, x1), min(fy1, y1)
+            if cx1 > cx0 and cy1 > cy0:
+                clipped.append((cx0, cy0, cx1, cy1))
+        return MaxRects._prune(clipped)
@@ -0,0 +1,105 @@
+"""
+Memory Report - Shared vs private memory per worker process (Linux /proc/<pid>/smaps)
+Model artifact yang di-memory-map muncul sebagai file-backed pages: shared antar worker,
+jadi RSS tidak lagi naik sebanding jumlah worker Passenger / Gunicorn
+"""
+import os
+from typing import Dict, Iterable, List, Optional
+
+from app.services.ModelRegistry import ModelRegistry
+
+
+class MemoryReport:
+    """Ringkasan smaps: shared / private bytes proses + per file model yang di-mmap"""
+
+    FIELDS = {
+        "Rss": "rss", "Pss": "pss",
+        "Shared_Clean": "shared_clean", "Shared_Dirty": "shared_dirty",
+        "Private_Clean": "private_clean", "Private_Dirty": "private_dirty"
+    }
+
+    @staticmethod
+    def _parse(lines: Iterable[str], totals: Dict[str, int]):
+        """Tambahkan field smaps (kB) ke totals (bytes)"""
+        for line in lines:
+            key, _, rest = line.partition(":")
+            field = MemoryReport.FIELDS.get(key)
+            if field:
+                totals[field] = totals.get(field, 0) + int(rest.split()[0]) * 1024
+
+    @staticmethod
+    def _summary(totals: Dict[str, int]) -> Dict[str, int]:
+        summary = {field: totals.get(field, 0) for field in MemoryReport.FIELDS.values()}
+        summary["shared"] = summary["shared_clean"] + summary["shared_dirty"]
+        summary["private"] = summary["private_clean"] + summary["private_dirty"]
+        return summary
+
+    @staticmethod
+    def process(pid: Optional[int] = None) -> Optional[Dict[str, int]]:
+        """Total proses (smaps_rollup), None jika /proc tidak tersedia (non-Linux)"""
+        path = f"/proc/{pid or 'self'}/smaps_rollup"
+        try:
+            with open(path) as f:
+                totals = {}
+                MemoryReport._parse(f, totals)
+        except OSError:
+            return None
+        return MemoryReport._summary(totals)
+
+    @staticmethod
+    def mapped_files(paths: Iterable[str], pid: Optional[int] = None) -> Dict[str, Dict[str, int]]:
+        """Shared / private bytes per file yang di-mmap (hanya path yang diminta)"""
+        wanted = {os.path.realpath(p) for p in paths}
+        totals = {}
+        current = None
+        try:
+            with open(f"/proc/{pid or 'self'}/smaps") as f:
+                for line in f:
+                    head = line.split(None, 5)
+                    # Header mapping: "start-end perms offset dev inode [path]"
+                    if "-" in head[0] and len(head) >= 5 and ":" not in head[0]:
+                        path = head[5].strip() if len(head) > 5 else ""
+                        current = totals.setdefault(path, {}) if path in wanted else None
+                    elif current is not None:
+                        MemoryReport._parse([line], current)
+        except OSError:
+            return {}
+        return {os.path.basename(path): MemoryReport._summary(t) for path, t in totals.items()}
+
+    @staticmethod
+    def model_files() -> List[str]:
+        """File .npz yang di-mmap oleh artifact di ModelRegistry"""
+        return sorted({
+            path for artifact in ModelRegistry.artifacts().values()
+            for path in getattr(artifact, "mapped_files", ())
+        })
+
+    @staticmethod
+    def report(pid: Optional[int] = None) -> Dict:
+        """
+        Report satu worker: total proses + model pages (shared / private)
+        Model yang di-load dari .pkl tidak di-mmap -> masuk private (heap) di total proses
+        """
+        return {
+            "pid": pid or os.getpid(),
+            "process": MemoryReport.process(pid),
+            "models": MemoryReport.mapped_files(MemoryReport.model_files(), pid)
+        }
+
+    @staticmethod
+    def print_report(label: str = "worker") -> Dict:
+        """Print shared vs private bytes (startup log), return report"""
+        report = MemoryReport.report()
+        mb = lambda value: f"{value / 1024 / 1024:.1f} MB"
+        process = report["process"]
+        if process is None:
+            print(f"🧠 Memory report ({label}, pid {report['pid']}): /proc smaps not available")
+            return report
+
+        print(f"🧠 Memory report ({label}, pid {report['pid']}): RSS {mb(process['rss'])}, "
+              f"shared {mb(process['shared'])}, private {mb(process['private'])} "
+              f"(dirty {mb(process['private_dirty'])}), PSS {mb(process['pss'])}")
+        for name, pages in report["models"].items():
+            print(f"   📦 {name}: resident {mb(pages['rss'])} "
+                  f"(shared {mb(pages['shared'])}, private {mb(pages['private'])})")
+        return report
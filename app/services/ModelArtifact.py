@@ -0,0 +1,179 @@
+"""
+Model Artifact - Format model untuk serving tanpa pickle
+<name>.npz (node arrays CompiledForest, uncompressed) + <name>.json (manifest: versi format,
+feature columns, metadata). Array di-memory-map langsung dari .npz -> cold start tanpa unpickle
+"""
+import io
+import json
+import os
+import struct
+import zipfile
+from datetime import datetime
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from app.services.CompiledForest import CompiledForest
+
+
+class ModelArtifact:
+    """Save / load CompiledForest sebagai artifact versioned (manifest JSON + arrays .npz)"""
+
+    FORMAT = "furnilayout-forest"
+    VERSION = 1
+    ALIGN = 64  # Data setiap array mulai di offset kelipatan 64 byte (mmap aligned, cache line)
+    PADDING_FIELD = 0xD935  # Extra field id untuk padding (sama dengan zipalign)
+
+    @staticmethod
+    def paths(path: str) -> Tuple[str, str]:
+        """(manifest .json, arrays .npz) dari path artifact (dengan / tanpa extension)"""
+        base = os.path.splitext(path)[0] if path.endswith((".json", ".npz", ".pkl")) else path
+        return f"{base}.json", f"{base}.npz"
+
+    @staticmethod
+    def save(forest: CompiledForest, path: str, feature_columns: List[str] = None,
+             metadata: Dict = None, source: str = None) -> Dict:
+        """
+        Tulis arrays (.npz) lalu manifest (.json), masing-masing atomic replace
+        Manifest ditulis terakhir: mtime manifest = versi artifact (ModelRegistry hot-swap)
+        """
+        manifest_path, arrays_path = ModelArtifact.paths(path)
+        arrays = forest.to_arrays()
+
+        tmp_path = f"{arrays_path}.{os.getpid()}.tmp"
+        ModelArtifact.write_npz(tmp_path, arrays)
+        os.replace(tmp_path, arrays_path)
+
+        manifest = {
+            "format": ModelArtifact.FORMAT,
+            "version": ModelArtifact.VERSION,
+            "created_at": datetime.now().isoformat(timespec="seconds"),
+            "source": source,
+            "arrays_file": os.path.basename(arrays_path),
+            "arrays_bytes": os.path.getsize(arrays_path),
+            "model": {
+                "type": "RandomForestRegressor",
+                "n_trees": forest.n_trees,
+                "n_nodes": forest.n_nodes,
+                "n_features": forest.n_features,
+                "n_outputs": forest.n_outputs,
+                "max_depth": forest.max_depth
+            },
+            "arrays": {
+                name: {"dtype": str(a.dtype), "shape": list(a.shape)} for name, a in arrays.items()
+            },
+            "feature_columns": list(feature_columns) if feature_columns is not None else None,
+            "metadata": metadata or {}
+        }
+
+        tmp_path = f"{manifest_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(manifest, f, indent=2, default=ModelArtifact._json_default)
+        os.replace(tmp_path, manifest_path)
+
+        print(f"✅ Model artifact saved: {manifest_path} + {os.path.basename(arrays_path)} "
+              f"({manifest['arrays_bytes'] / 1024 / 1024:.2f} MB)")
+        return manifest
+
+    @staticmethod
+    def write_npz(path: str, arrays: Dict[str, np.ndarray]):
+        """
+        .npz uncompressed (dibaca np.load biasa) dengan data array aligned ke ALIGN byte
+        Padding lewat extra field local header zip, header .npy sudah kelipatan 64 byte
+        """
+        align = ModelArtifact.ALIGN
+        with open(path, "wb") as f, zipfile.ZipFile(f, "w", zipfile.ZIP_STORED) as archive:
+            for name, array in arrays.items():
+                payload = io.BytesIO()
+                np.lib.format.write_array(payload, np.ascontiguousarray(array), allow_pickle=False)
+
+                info = zipfile.ZipInfo(f"{name}.npy", date_time=(1980, 1, 1, 0, 0, 0))
+                info.compress_type = zipfile.ZIP_STORED
+                # Local header = 30 bytes + nama file + extra field (4 bytes header + padding)
+                data_offset = f.tell() + 30 + len(info.filename.encode("utf-8")) + 4
+                padding = -data_offset % align
+                info.extra = struct.pack("<HH", ModelArtifact.PADDING_FIELD, padding) + bytes(padding)
+                archive.writestr(info, payload.getvalue())
+
+    @staticmethod
+    def _json_default(value):
+        """NumPy scalar / array di metadata -> tipe JSON biasa"""
+        if hasattr(value, "tolist"):
+            return value.tolist()
+        return str(value)
+
+    @staticmethod
+    def read_manifest(path: str) -> Dict:
+        """Manifest + validasi format / versi (ValueError jika tidak kompatibel)"""
+        manifest_path, _ = ModelArtifact.paths(path)
+        with open(manifest_path) as f:
+            manifest = json.load(f)
+        if manifest.get("format") != ModelArtifact.FORMAT:
+            raise ValueError(f"Unknown model artifact format: {manifest.get('format')}")
+        if not isinstance(manifest.get("version"), int) or manifest["version"] > ModelArtifact.VERSION:
+            raise ValueError(f"Unsupported model artifact version: {manifest.get('version')} "
+                             f"(supported <= {ModelArtifact.VERSION})")
+        return manifest
+
+    @staticmethod
+    def memmap_npz(path: str) -> Dict[str, np.ndarray]:
+        """
+        Memory-map setiap array di .npz uncompressed (np.load tidak bisa mmap isi .npz)
+        Offset data = local file header zip + header .npy, array read-only
+        """
+        arrays = {}
+        with zipfile.ZipFile(path) as archive, open(path, "rb") as f:
+            for info in archive.infolist():
+                if info.compress_type != zipfile.ZIP_STORED:
+                    raise ValueError(f"{info.filename} compressed, tidak bisa di-memory-map")
+                # Local file header: 30 bytes + nama file + extra field
+                f.seek(info.header_offset)
+                header = f.read(30)
+                name_length = int.from_bytes(header[26:28], "little")
+                extra_length = int.from_bytes(header[28:30], "little")
+                f.seek(info.header_offset + 30 + name_length + extra_length)
+
+                version = np.lib.format.read_magic(f)
+                if version == (1, 0):
+                    shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+                else:
+                    shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+                name = info.filename[:-4] if info.filename.endswith(".npy") else info.filename
+                if int(np.prod(shape)) == 0:
+                    arrays[name] = np.empty(shape, dtype=dtype)
+                    continue
+                arrays[name] = np.memmap(
+                    path, dtype=dtype, mode="r", offset=f.tell(), shape=shape,
+                    order="F" if fortran_order else "C"
+                )
+        return arrays
+
+    @staticmethod
+    def load(path: str, mmap: bool = True) -> CompiledForest:
+        """
+        Load CompiledForest dari artifact (tanpa pickle / sklearn)
+        mmap=True: arrays di-memory-map (page cache dipakai bersama antar process)
+        Manifest tersedia di forest.manifest (feature_columns, metadata)
+        Load time + size dilaporkan ModelRegistry saat artifact pertama kali di-load
+        """
+        manifest_path, _ = ModelArtifact.paths(path)
+        manifest = ModelArtifact.read_manifest(manifest_path)
+        arrays_path = os.path.join(os.path.dirname(manifest_path), manifest["arrays_file"])
+
+        if mmap:
+            arrays = ModelArtifact.memmap_npz(arrays_path)
+        else:
+            with np.load(arrays_path, allow_pickle=False) as data:
+                arrays = {name: data[name] for name in data.files}
+
+        for name, spec in manifest["arrays"].items():
+            array = arrays.get(name)
+            if array is None or str(array.dtype) != spec["dtype"] or list(array.shape) != spec["shape"]:
+                raise ValueError(f"Model artifact array mismatch: {name}")
+
+        return CompiledForest(
+            **{name: arrays[name] for name in CompiledForest.ARRAYS},
+            n_features=manifest["model"]["n_features"],
+            max_depth=manifest["model"]["max_depth"],
+            manifest=manifest
+        )
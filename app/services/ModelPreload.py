@@ -0,0 +1,56 @@
+"""
+Model Preload - Load semua model saat process start (sebelum menerima traffic)
+Artifact di-memory-map: page cache file .npz dipakai bersama semua process yang me-map-nya.
+Passenger men-spawn setiap process terpisah (tidak fork), jadi hanya sharing page cache ini
+yang berlaku di sana; gc.freeze + report per worker hanya berefek di Gunicorn --preload (fork)
+"""
+import gc
+import os
+import time
+from typing import Dict
+
+from app.services.MemoryReport import MemoryReport
+
+
+class ModelPreload:
+    """Startup model loading (Passenger, api/index) / pre-fork loading (Gunicorn --preload)"""
+
+    _registered = False
+
+    @staticmethod
+    def load_models() -> Dict[str, bool]:
+        """Load model AILayoutService + LayoutService ke ModelRegistry, return status per model"""
+        loaded = {}
+        try:
+            from app.services.AILayoutService import AILayoutService
+            loaded["ai_layout"] = AILayoutService.load_model() is not None
+        except Exception as e:
+            print(f"⚠️ AI layout model preload failed: {e}")
+            loaded["ai_layout"] = False
+        try:
+            from app.services.LayoutService import LayoutService
+            loaded["layout"] = LayoutService().model is not None
+        except Exception as e:
+            print(f"⚠️ Layout model preload failed: {e}")
+            loaded["layout"] = False
+        return loaded
+
+    @staticmethod
+    def preload(report_workers: bool = True) -> Dict[str, bool]:
+        """
+        Load model, freeze GC generation saat ini, print memory report parent
+        report_workers: print memory report di setiap child setelah fork (Gunicorn --preload, os.register_at_fork)
+        """
+        start = time.perf_counter()
+        loaded = ModelPreload.load_models()
+        gc.collect()
+        if hasattr(gc, "freeze"):
+            gc.freeze()  # Gunicorn --preload: object tidak di-scan GC lagi -> pages tetap shared setelah fork
+
+        print(f"🚀 Models preloaded in {(time.perf_counter() - start) * 1000:.1f}ms: {loaded}")
+        MemoryReport.print_report("preload")
+
+        if report_workers and hasattr(os, "register_at_fork") and not ModelPreload._registered:
+            os.register_at_fork(after_in_child=lambda: MemoryReport.print_report("worker"))
+            ModelPreload._registered = True
+        return loaded
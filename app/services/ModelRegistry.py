@@ -0,0 +1,126 @@
+"""
+Model Registry - Process-wide cache untuk model artifacts (.pkl)
+Load sekali per process, dipakai bersama semua request, hot-swap otomatis jika file berubah
+"""
+import os
+import sys
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+
+class ModelRegistry:
+    """Thread-safe registry: path -> loaded artifact (reload jika mtime berubah)"""
+
+    _entries = {}  # path -> entry dict (diganti utuh saat reload)
+    _locks = {}  # path -> threading.Lock (satu loader per path)
+    _registry_lock = threading.Lock()
+
+    @staticmethod
+    def _default_loader(path: str):
+        import joblib
+        return joblib.load(path)
+
+    @staticmethod
+    def _path_lock(path: str) -> threading.Lock:
+        with ModelRegistry._registry_lock:
+            lock = ModelRegistry._locks.get(path)
+            if lock is None:
+                lock = ModelRegistry._locks[path] = threading.Lock()
+            return lock
+
+    @staticmethod
+    def get(path: str, loader: Optional[Callable] = None):
+        """
+        Get artifact dari registry, load dari disk jika belum ada atau file berubah
+        Raise exception dari loader / os.stat jika file tidak bisa di-load
+        """
+        path = os.path.abspath(path)
+        mtime = os.stat(path).st_mtime_ns
+
+        entry = ModelRegistry._entries.get(path)
+        if entry is not None and entry["mtime"] == mtime:
+            entry["hits"] += 1
+            return entry["artifact"]
+
+        with ModelRegistry._path_lock(path):
+            # Thread lain mungkin sudah load versi terbaru selagi kita menunggu lock
+            entry = ModelRegistry._entries.get(path)
+            if entry is not None and entry["mtime"] == mtime:
+                entry["hits"] += 1
+                return entry["artifact"]
+
+            start = time.perf_counter()
+            artifact = (loader or ModelRegistry._default_loader)(path)
+            load_ms = (time.perf_counter() - start) * 1000
+
+            new_entry = {
+                "artifact": artifact,
+                "mtime": mtime,
+                "file_size": os.path.getsize(path),
+                "memory_bytes": ModelRegistry.estimate_nbytes(artifact),
+                "load_ms": round(load_ms, 2),
+                "loaded_at": time.time(),
+                "loads": (entry["loads"] + 1) if entry else 1,
+                "hits": 0,
+            }
+            # Atomic swap: request yang sedang berjalan tetap memakai object lama
+            ModelRegistry._entries[path] = new_entry
+
+            action = "reloaded" if entry else "loaded"
+            print(f"✅ Model {action}: {os.path.basename(path)} "
+                  f"({load_ms:.1f}ms, {new_entry['memory_bytes'] / 1024 / 1024:.2f} MB)")
+            return artifact
+
+    @staticmethod
+    def estimate_nbytes(obj) -> int:
+        """Perkiraan memory size artifact (numpy arrays / sklearn tree ensembles)"""
+        if getattr(obj, "dtype", None) == object:
+            return sum(ModelRegistry.estimate_nbytes(v) for v in obj.ravel())
+        if hasattr(obj, "nbytes"):
+            return int(obj.nbytes)
+
+        tree = getattr(obj, "tree_", None)
+        if tree is not None:
+            state = tree.__getstate__()
+            return sum(int(v.nbytes) for v in state.values() if hasattr(v, "nbytes"))
+
+        estimators = getattr(obj, "estimators_", None)
+        if estimators is not None:
+            return ModelRegistry.estimate_nbytes(list(estimators))
+
+        if isinstance(obj, dict):
+            return sum(ModelRegistry.estimate_nbytes(v) for v in obj.values())
+        if isinstance(obj, (list, tuple)):
+            return sum(ModelRegistry.estimate_nbytes(v) for v in obj)
+
+        return sys.getsizeof(obj)
+
+    @staticmethod
+    def stats() -> Dict[str, Dict]:
+        """Load time, memory size dan hit count per artifact (key = nama file, tanpa path server)"""
+        return {
+            os.path.basename(path): {
+                "load_ms": entry["load_ms"],
+                "memory_bytes": entry["memory_bytes"],
+                "file_size": entry["file_size"],
+                "loaded_at": entry["loaded_at"],
+                "loads": entry["loads"],
+                "hits": entry["hits"],
+            }
+            for path, entry in list(ModelRegistry._entries.items())
+        }
+
+    @staticmethod
+    def artifacts() -> Dict[str, object]:
+        """Loaded artifacts: nama file -> object (untuk memory report)"""
+        return {
+            os.path.basename(path): entry["artifact"]
+            for path, entry in list(ModelRegistry._entries.items())
+        }
+
+    @staticmethod
+    def clear():
+        """Kosongkan registry (artifact berikutnya di-load ulang dari disk)"""
+        with ModelRegistry._registry_lock:
+            ModelRegistry._entries = {}
@@ -0,0 +1,141 @@
+"""
+Multi-Start Layout - K placement independen (seed, urutan, grid offset berbeda) di process pool
+Greedy placement sangat tergantung urutan, jadi jalankan beberapa variasi dan ambil yang terbaik
+"""
+import multiprocessing
+import random
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, List, Optional
+from config import Config
+from app.services.AutoLayoutService import AutoLayoutService
+from app.services.LayoutConfig import LayoutConfig
+from app.services.LayoutScore import LayoutScore
+
+# Grid offset dalam fraksi grid_size (diskrit supaya FeasibilityMap tetap kecil)
+GRID_PHASES = (0.0, 0.25, 0.5, 0.75)
+
+
+def _run_variant(room_width: float, room_height: float, config: Optional[LayoutConfig],
+                 variant: Dict) -> Dict:
+    """Satu placement run (module-level supaya bisa di-pickle ke worker process)"""
+    start = time.perf_counter()
+    result = AutoLayoutService.compute_layout(
+        room_width, room_height, config,
+        order=variant["order"], grid_phase=tuple(variant["grid_phase"]), verbose=False
+    )
+    score = LayoutScore.layout_score(
+        result["placed_items"], AutoLayoutService.ZONES, AutoLayoutService.OBSTACLES
+    )
+    return {
+        "result": result,
+        "score": score,
+        "elapsed_ms": round((time.perf_counter() - start) * 1000, 2)
+    }
+
+
+class MultiStartLayout:
+    """Process pool (dibuat sekali per process) untuk multi-start AutoLayoutService"""
+
+    _pool = None
+    _pool_lock = threading.Lock()
+
+    @staticmethod
+    def _get_pool() -> ProcessPoolExecutor:
+        with MultiStartLayout._pool_lock:
+            if MultiStartLayout._pool is None:
+                # spawn: aman dari threaded WSGI server (fork + thread bisa deadlock) dan jalan di Windows
+                MultiStartLayout._pool = ProcessPoolExecutor(
+                    max_workers=max(1, Config.LAYOUT_WORKERS),
+                    mp_context=multiprocessing.get_context("spawn")
+                )
+            return MultiStartLayout._pool
+
+    @staticmethod
+    def shutdown():
+        """Stop worker processes (pool dibuat ulang saat dipakai lagi)"""
+        with MultiStartLayout._pool_lock:
+            pool, MultiStartLayout._pool = MultiStartLayout._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+    @staticmethod
+    def make_variants(runs: int, seed: int = 0) -> List[Dict]:
+        """
+        Variasi per run: run 0 = greedy default (hasil multi-start tidak pernah lebih buruk),
+        run lain = urutan priority di-jitter + grid offset acak
+        """
+        catalog = AutoLayoutService.FURNITURE_CATALOG
+        variants = [{"run": 0, "seed": None, "order": AutoLayoutService.placement_order(),
+                     "grid_phase": [0.0, 0.0]}]
+
+        for run in range(1, runs):
+            run_seed = seed * 1000003 + run
+            rng = random.Random(run_seed)
+            # Jitter < 2 priority level: item dengan priority berdekatan bisa bertukar urutan
+            order = sorted(catalog, key=lambda name: catalog[name]["priority"] + rng.uniform(0, 2))
+            variants.append({
+                "run": run,
+                "seed": run_seed,
+                "order": order,
+                "grid_phase": [rng.choice(GRID_PHASES), rng.choice(GRID_PHASES)]
+            })
+        return variants
+
+    @staticmethod
+    def run(room_width: float = 17.0, room_height: float = 11.0, runs: int = 8,
+            seed: int = 0, config: LayoutConfig = None, parallel: bool = True) -> Dict:
+        """
+        Jalankan `runs` placement, return layout dengan LayoutScore tertinggi
+        + info per run (score, placed_count, elapsed_ms) di key "multi_start"
+        """
+        runs = max(1, min(int(runs), Config.LAYOUT_MAX_RUNS))
+        variants = MultiStartLayout.make_variants(runs, seed)
+        start = time.perf_counter()
+
+        outcomes = None
+        mode = "serial"
+        if parallel and runs > 1 and Config.LAYOUT_WORKERS > 1:
+            try:
+                pool = MultiStartLayout._get_pool()
+                futures = [pool.submit(_run_variant, room_width, room_height, config, v)
+                           for v in variants]
+                outcomes = [f.result() for f in futures]
+                mode = "process_pool"
+            except (BrokenProcessPool, OSError) as e:
+                print(f"⚠️ Multi-start process pool failed, running serially: {e}")
+                MultiStartLayout.shutdown()
+
+        if outcomes is None:
+            outcomes = [_run_variant(room_width, room_height, config, v) for v in variants]
+
+        # Tie -> run dengan index terkecil (deterministic)
+        best = max(range(len(outcomes)), key=lambda i: (outcomes[i]["score"], -i))
+        wall_ms = (time.perf_counter() - start) * 1000
+
+        result = outcomes[best]["result"]
+        result["multi_start"] = {
+            "runs": runs,
+            "seed": seed,
+            "mode": mode,
+            "workers": Config.LAYOUT_WORKERS if mode == "process_pool" else 1,
+            "best_run": best,
+            "best_score": round(outcomes[best]["score"], 4),
+            "wall_ms": round(wall_ms, 2),
+            "per_run": [
+                {
+                    "run": v["run"],
+                    "seed": v["seed"],
+                    "grid_phase": v["grid_phase"],
+                    "placed_count": o["result"]["placed_count"],
+                    "score": round(o["score"], 4),
+                    "elapsed_ms": o["elapsed_ms"]
+                }
+                for v, o in zip(variants, outcomes)
+            ]
+        }
+        print(f"🎲 Multi-start: best run {best}/{runs} (score {outcomes[best]['score']:.3f}, "
+              f"{wall_ms:.0f}ms, {mode})")
+        return result
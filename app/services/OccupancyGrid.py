@@ -0,0 +1,175 @@
+"""
+Occupancy Grid - Raster ruangan dengan summed-area table
+Query "apakah rectangle (dengan padding) ini kosong?" dalam O(1), update incremental per item
+"""
+import math
+import numpy as np
+from typing import Dict, List
+
+
+class OccupancyGrid:
+    """
+    Occupancy raster untuk placement loop
+
+    Menyimpan dua summed-area table (SAT):
+    - outer: cell yang tersentuh item (conservative) -> sum == 0 berarti PASTI kosong
+    - inner: cell yang tertutup penuh oleh item -> sum > 0 berarti PASTI collision
+    Kasus di antara keduanya (tepi item dalam 1 cell dari tepi kandidat) -> UNKNOWN,
+    caller melakukan exact pairwise check seperti biasa.
+    """
+
+    FREE = 1
+    BLOCKED = 0
+    UNKNOWN = -1
+
+    EPS = 1e-6  # Slack (dalam satuan cell) untuk float noise di batas cell
+
+    def __init__(self, width: float = 17.0, height: float = 11.0,
+                 resolution: float = 0.05, border: float = 1.0):
+        """Raster ruangan width x height meter, cell = resolution meter"""
+        self.resolution = resolution
+        self.origin_x = -border
+        self.origin_y = -border
+        self.cols = int(math.ceil((width + 2 * border) / resolution))
+        self.rows = int(math.ceil((height + 2 * border) / resolution))
+        self.outer_sat = np.zeros((self.cols + 1, self.rows + 1), dtype=np.int64)
+        self.inner_sat = np.zeros((self.cols + 1, self.rows + 1), dtype=np.int64)
+        self.item_count = 0
+
+    # ========== CELL RANGES ==========
+
+    def _touching(self, start: float, end: float, origin: float):
+        """Inclusive cell range yang disentuh interval tertutup [start, end]"""
+        r = self.resolution
+        return (math.floor((start - origin) / r - self.EPS),
+                math.floor((end - origin) / r + self.EPS))
+
+    def _inside(self, start: float, end: float, origin: float):
+        """Inclusive cell range yang sepenuhnya berada di dalam [start, end]"""
+        r = self.resolution
+        return (math.ceil((start - origin) / r + self.EPS),
+                math.floor((end - origin) / r - self.EPS) - 1)
+
+    def _in_bounds(self, c0: int, c1: int, r0: int, r1: int) -> bool:
+        return c0 >= 0 and r0 >= 0 and c1 < self.cols and r1 < self.rows
+
+    @staticmethod
+    def _sat_sum(sat: np.ndarray, c0: int, c1: int, r0: int, r1: int) -> int:
+        """Jumlah cell [c0..c1] x [r0..r1] dari summed-area table"""
+        if c1 < c0 or r1 < r0:
+            return 0
+        return int(sat[c1 + 1, r1 + 1] - sat[c0, r1 + 1] - sat[c1 + 1, r0] + sat[c0, r0])
+
+    @staticmethod
+    def _sat_add(sat: np.ndarray, c0: int, c1: int, r0: int, r1: int):
+        """Incremental SAT update untuk menambah blok cell [c0..c1] x [r0..r1]"""
+        if c1 < c0 or r1 < r0:
+            return
+        cols, rows = sat.shape
+        ramp_x = np.clip(np.arange(cols) - c0, 0, c1 - c0 + 1)
+        ramp_y = np.clip(np.arange(rows) - r0, 0, r1 - r0 + 1)
+        sat += np.outer(ramp_x, ramp_y)
+
+    def _clip(self, c0: int, c1: int, r0: int, r1: int):
+        return max(c0, 0), min(c1, self.cols - 1), max(r0, 0), min(r1, self.rows - 1)
+
+    # ========== UPDATE ==========
+
+    def mark(self, x: float, y: float, width: float, height: float):
+        """Tandai item yang baru ditempatkan (tanpa padding, padding di-query)"""
+        c0, c1 = self._touching(x, x + width, self.origin_x)
+        r0, r1 = self._touching(y, y + height, self.origin_y)
+        self._sat_add(self.outer_sat, *self._clip(c0, c1, r0, r1))
+
+        c0, c1 = self._inside(x, x + width, self.origin_x)
+        r0, r1 = self._inside(y, y + height, self.origin_y)
+        self._sat_add(self.inner_sat, *self._clip(c0, c1, r0, r1))
+
+        self.item_count += 1
+
+    def mark_items(self, items: List[Dict], width_key: str = "panjang",
+                   height_key: str = "lebar"):
+        """Tandai banyak item sekaligus"""
+        for item in items:
+            self.mark(item["x"], item["y"], item[width_key], item[height_key])
+
+    # ========== QUERY ==========
+
+    def status(self, x: float, y: float, width: float, height: float,
+               padding: float = 0.0, min_padding: float = None) -> int:
+        """
+        Status rectangle kandidat diperluas dengan padding di semua sisi
+        padding     -> padding terbesar yang mungkin (untuk FREE)
+        min_padding -> padding terkecil yang mungkin (untuk BLOCKED), default = padding
+        """
+        if self.item_count == 0:
+            return self.FREE
+        if min_padding is None:
+            min_padding = padding
+
+        c0, c1 = self._touching(x - padding, x + width + padding, self.origin_x)
+        r0, r1 = self._touching(y - padding, y + height + padding, self.origin_y)
+        if not self._in_bounds(c0, c1, r0, r1):
+            return self.UNKNOWN
+        if self._sat_sum(self.outer_sat, c0, c1, r0, r1) == 0:
+            return self.FREE
+
+        c0, c1 = self._inside(x - min_padding, x + width + min_padding, self.origin_x)
+        r0, r1 = self._inside(y - min_padding, y + height + min_padding, self.origin_y)
+        if self._sat_sum(self.inner_sat, c0, c1, r0, r1) > 0:
+            return self.BLOCKED
+
+        return self.UNKNOWN
+
+    def status_grid(self, xs: np.ndarray, ys: np.ndarray, width: float, height: float,
+                    padding: float = 0.0, min_padding: float = None) -> np.ndarray:
+        """Vectorized status untuk grid kandidat (len(xs), len(ys))"""
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        result = np.full((len(xs), len(ys)), self.FREE, dtype=np.int8)
+        if self.item_count == 0 or result.size == 0:
+            return result
+        if min_padding is None:
+            min_padding = padding
+
+        r = self.resolution
+        eps = self.EPS
+
+        # Outer (touching) ranges per axis
+        oc0 = np.floor((xs - padding - self.origin_x) / r - eps).astype(np.int64)
+        oc1 = np.floor((xs + width + padding - self.origin_x) / r + eps).astype(np.int64)
+        or0 = np.floor((ys - padding - self.origin_y) / r - eps).astype(np.int64)
+        or1 = np.floor((ys + height + padding - self.origin_y) / r + eps).astype(np.int64)
+        in_bounds = ((oc0 >= 0) & (oc1 < self.cols))[:, None] & ((or0 >= 0) & (or1 < self.rows))[None, :]
+
+        oc0c, oc1c = np.clip(oc0, 0, self.cols - 1), np.clip(oc1, 0, self.cols - 1)
+        or0c, or1c = np.clip(or0, 0, self.rows - 1), np.clip(or1, 0, self.rows - 1)
+        outer = self._sat_sum_grid(self.outer_sat, oc0c, oc1c, or0c, or1c)
+
+        # Inner (fully covered) ranges per axis
+        ic0 = np.ceil((xs - min_padding - self.origin_x) / r + eps).astype(np.int64)
+        ic1 = np.floor((xs + width + min_padding - self.origin_x) / r - eps).astype(np.int64) - 1
+        ir0 = np.ceil((ys - min_padding - self.origin_y) / r + eps).astype(np.int64)
+        ir1 = np.floor((ys + height + min_padding - self.origin_y) / r - eps).astype(np.int64) - 1
+        ic0, ic1 = np.clip(ic0, 0, self.cols), np.clip(ic1, -1, self.cols - 1)
+        ir0, ir1 = np.clip(ir0, 0, self.rows), np.clip(ir1, -1, self.rows - 1)
+        inner = self._sat_sum_grid(self.inner_sat, ic0, ic1, ir0, ir1)
+
+        result[inner > 0] = self.BLOCKED
+        result[(outer > 0) & (inner == 0)] = self.UNKNOWN
+        result[~in_bounds] = self.UNKNOWN
+        return result
+
+    @staticmethod
+    def _sat_sum_grid(sat, c0, c1, r0, r1) -> np.ndarray:
+        """Vectorized SAT sum untuk semua kombinasi range x dan range y"""
+        a = c0[:, None]
+        b = (c1 + 1)[:, None]
+        c = r0[None, :]
+        d = (r1 + 1)[None, :]
+        empty = (c1 < c0)[:, None] | (r1 < r0)[None, :]
+        b = np.maximum(a, b)
+        d = np.maximum(c, d)
+        total = sat[b, d] - sat[a, d] - sat[b, c] + sat[a, c]
+        total[empty] = 0
+        return total
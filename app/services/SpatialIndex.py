@@ -0,0 +1,149 @@
+"""
+Spatial Index - Uniform grid hash untuk furniture rectangles
+Overlap validation dan neighbour query tanpa double loop semua pasangan
+"""
+import math
+from collections import defaultdict
+from typing import Dict, List, Optional, Tuple
+
+
+class SpatialIndex:
+    """Uniform grid hash: setiap rect didaftarkan ke semua cell yang disentuhnya"""
+
+    def __init__(self, cell_size: float = 1.0, padding: float = 0.0):
+        """
+        cell_size: ukuran cell (satuan sama dengan koordinat item)
+        padding: setiap rect didaftarkan dengan padding ini di semua sisi, sehingga
+                 candidate_pairs() mencakup semua pasangan dengan jarak < 2 * padding
+        """
+        self.cell_size = cell_size
+        self.padding = padding
+        self.cells = defaultdict(list)
+        self.rects = []
+
+    def _span(self, x: float, y: float, w: float, h: float, padding: float):
+        c = self.cell_size
+        return (math.floor((x - padding) / c), math.floor((x + w + padding) / c),
+                math.floor((y - padding) / c), math.floor((y + h + padding) / c))
+
+    def insert(self, x: float, y: float, w: float, h: float) -> int:
+        """Tambah rect, return index-nya"""
+        idx = len(self.rects)
+        self.rects.append((x, y, w, h))
+        cx0, cx1, cy0, cy1 = self._span(x, y, w, h, self.padding)
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                self.cells[(cx, cy)].append(idx)
+        return idx
+
+    def query(self, x: float, y: float, w: float, h: float, padding: float = 0.0) -> List[int]:
+        """
+        Index rect yang MUNGKIN berada dalam jarak padding (superset, sorted)
+        Gunakan overlapping() untuk hasil exact
+        """
+        found = set()
+        cx0, cx1, cy0, cy1 = self._span(x, y, w, h, padding)
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                found.update(self.cells.get((cx, cy), ()))
+        return sorted(found)
+
+    def overlapping(self, x: float, y: float, w: float, h: float,
+                    padding: float = 0.0) -> List[int]:
+        """Index rect yang bersentuhan dengan rect (x, y, w, h) diperluas padding (inclusive)"""
+        result = []
+        for idx in self.query(x, y, w, h, padding):
+            rx, ry, rw, rh = self.rects[idx]
+            if not (x + w + padding < rx or rx + rw + padding < x or
+                    y + h + padding < ry or ry + rh + padding < y):
+                result.append(idx)
+        return result
+
+    def candidate_pairs(self) -> List[Tuple[int, int]]:
+        """Semua pasangan (i, j), i < j, yang berbagi cell (sorted)"""
+        pairs = set()
+        for members in self.cells.values():
+            if len(members) < 2:
+                continue
+            for a in range(len(members)):
+                for b in range(a + 1, len(members)):
+                    i, j = members[a], members[b]
+                    pairs.add((i, j) if i < j else (j, i))
+        return sorted(pairs)
+
+    @staticmethod
+    def from_items(items: List[Dict], padding: float = 0.0,
+                   cell_size: Optional[float] = None,
+                   width_key: str = "panjang", height_key: str = "lebar") -> "SpatialIndex":
+        """Build index dari list furniture dict"""
+        if cell_size is None:
+            cell_size = SpatialIndex.suggest_cell_size(items, padding, width_key, height_key)
+        index = SpatialIndex(cell_size, padding)
+        for item in items:
+            index.insert(item["x"], item["y"], item[width_key], item[height_key])
+        return index
+
+    @staticmethod
+    def suggest_cell_size(items: List[Dict], padding: float = 0.0,
+                          width_key: str = "panjang", height_key: str = "lebar") -> float:
+        """Cell size ~ ukuran rata-rata item (+ padding) supaya tiap item menyentuh sedikit cell"""
+        if not items:
+            return max(1.0, 2 * padding)
+        avg = sum(max(item[width_key], item[height_key]) for item in items) / len(items)
+        return max(avg + 2 * padding, 1e-6)
+
+    @staticmethod
+    def clearance(a: Tuple[float, float, float, float],
+                  b: Tuple[float, float, float, float]) -> float:
+        """Jarak edge-to-edge terdekat antara dua rect yang tidak overlap"""
+        x1, y1, w1, h1 = a
+        x2, y2, w2, h2 = b
+        dx = max(0.0, x2 - (x1 + w1), x1 - (x2 + w2))
+        dy = max(0.0, y2 - (y1 + h1), y1 - (y2 + h2))
+        return math.hypot(dx, dy)
+
+    @staticmethod
+    def overlap_report(placed_items: List[Dict], min_spacing: float) -> Dict:
+        """
+        VALIDATION: collision (actual overlap) + close spacing warnings
+        Hanya pasangan yang bertetangga di grid yang dicek -> near-linear untuk layout besar
+        """
+        index = SpatialIndex.from_items(placed_items, padding=min_spacing / 2)
+        collisions = []
+        warnings = []
+
+        for i, j in index.candidate_pairs():
+            item1 = placed_items[i]
+            item2 = placed_items[j]
+
+            x1, y1, w1, h1 = index.rects[i]
+            x2, y2, w2, h2 = index.rects[j]
+
+            # AABB overlap test
+            overlap = not (x1 + w1 <= x2 or x2 + w2 <= x1 or
+                           y1 + h1 <= y2 or y2 + h2 <= y1)
+
+            if overlap:
+                collisions.append({
+                    "item1": item1["nama"],
+                    "item2": item2["nama"],
+                    "pos1": f"({x1:.2f}, {y1:.2f})",
+                    "pos2": f"({x2:.2f}, {y2:.2f})"
+                })
+            else:
+                # Check if too close (within minimum spacing)
+                distance = SpatialIndex.clearance(index.rects[i], index.rects[j])
+                if distance < min_spacing:
+                    warnings.append({
+                        "item1": item1["nama"],
+                        "item2": item2["nama"],
+                        "distance": f"{distance:.2f}m"
+                    })
+
+        return {
+            "overlap_count": len(collisions),
+            "warning_count": len(warnings),
+            "collisions": collisions,
+            "warnings": warnings,
+            "status": "CLEAN" if len(collisions) == 0 else "HAS_OVERLAP"
+        }
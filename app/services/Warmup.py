@@ -0,0 +1,111 @@
+"""
+Warmup - Fase warmup sebelum worker menerima traffic
+Load model, build feasibility maps, isi layout cache untuk request default,
+readiness flag di /api/status (request pertama tidak lagi bayar cold start)
+Public read (news, FAQ, CMS, social media) tidak punya cache di tree ini - setiap request
+langsung query MySQL tanpa connection pool - jadi tidak ada step warmup untuk route tersebut
+"""
+import threading
+import time
+from typing import Dict
+
+from config import Config
+
+
+class Warmup:
+    """Warmup steps berurutan, status per step (ok, ms, error) + readiness flag"""
+
+    _lock = threading.Lock()
+    _state = {"ready": False, "started_at": None, "finished_at": None, "elapsed_ms": None, "steps": {}}
+
+    enabled = Config.WARMUP
+
+    @staticmethod
+    def _models() -> Dict:
+        from app.services.ModelPreload import ModelPreload
+        return ModelPreload.load_models()
+
+    @staticmethod
+    def _auto_layout() -> Dict:
+        """Feasibility maps + LayoutCache untuk POST /api/layout/auto-place default"""
+        from app.services.AutoLayoutService import AutoLayoutService
+        result = AutoLayoutService.auto_place_all_furniture()
+        return {"placed": len(result["placed_items"])}
+
+    @staticmethod
+    def _simple_layout() -> Dict:
+        from app.services.SimpleLayoutService import SimpleLayoutService
+        result = SimpleLayoutService.auto_place_all_furniture()
+        return {"placed": len(result["placed_items"])}
+
+    @staticmethod
+    def _ai_layout() -> Dict:
+        """Feasibility maps AI + sentuh model pages (predict pertama)"""
+        from app.services.AILayoutService import AILayoutService
+        if AILayoutService.load_model() is None:
+            return {"skipped": "model not available"}
+        result = AILayoutService.auto_place_all_furniture()
+        return {"placed": len(result["placed_items"])}
+
+    @staticmethod
+    def _layout_predict() -> Dict:
+        from app.services.LayoutService import LayoutService
+        service = LayoutService()
+        if service.model is None:
+            return {"skipped": "model not available"}
+        service.predict_batch([{"name": "warmup", "panjang": 100, "lebar": 100}])
+        return {"predicted": 1}
+
+    # Urutan step: nama -> Warmup._<nama>
+    STEPS = ["models", "auto_layout", "simple_layout", "ai_layout", "layout_predict"]
+
+    @staticmethod
+    def run() -> Dict:
+        """
+        Jalankan semua step (error satu step tidak menghentikan step lain), lalu set ready
+        Aman dipanggil berkali-kali: warmup hanya jalan sekali per process
+        """
+        with Warmup._lock:
+            started = Warmup._state["started_at"] is not None
+            if not started:
+                Warmup._state["started_at"] = time.time()
+        if started:
+            return Warmup.status()
+
+        start = time.perf_counter()
+        print("🔥 Warmup started")
+        for name in Warmup.STEPS:
+            step_start = time.perf_counter()
+            try:
+                detail = getattr(Warmup, f"_{name}")()
+                entry = {"ok": True, "detail": detail}
+            except Exception as e:
+                entry = {"ok": False, "error": str(e)}
+            entry["ms"] = round((time.perf_counter() - step_start) * 1000, 1)
+            Warmup._state["steps"][name] = entry
+            print(f"   {'✓' if entry['ok'] else '✗'} {name} ({entry['ms']:.0f}ms)"
+                  + ("" if entry["ok"] else f": {entry['error']}"))
+
+        elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+        with Warmup._lock:
+            Warmup._state["elapsed_ms"] = elapsed_ms
+            Warmup._state["finished_at"] = time.time()
+            Warmup._state["ready"] = True
+        print(f"🔥 Warmup finished in {elapsed_ms:.0f}ms")
+        return Warmup.status()
+
+    @staticmethod
+    def is_ready() -> bool:
+        """
+        Ready = warmup selesai, atau tidak ada warmup yang dijalankan di process ini
+        (WARMUP=0, atau entry point tanpa Warmup.run() seperti python app.py)
+        """
+        return Warmup._state["ready"] or Warmup._state["started_at"] is None
+
+    @staticmethod
+    def status() -> Dict:
+        with Warmup._lock:
+            state = dict(Warmup._state, steps=dict(Warmup._state["steps"]))
+        state["enabled"] = Warmup.enabled
+        state["ready"] = Warmup.is_ready()
+        return state
@@ -0,0 +1,80 @@
+"""
+Benchmark: sklearn RandomForestRegressor.predict vs CompiledForest.predict
+Batch size 1, 100 dan 10,000 dengan feature matrix dari candidate grid AILayoutService
+
+Usage: python benchmark_forest_inference.py [model_path]
+"""
+
+import os
+import pickle
+import sys
+import time
+
+import numpy as np
+
+from app.services.AILayoutService import AILayoutService
+from app.services.CompiledForest import CompiledForest
+from app.services.ModelRegistry import ModelRegistry
+
+BATCH_SIZES = [1, 100, 10000]
+MIN_SECONDS = 0.5  # Minimal durasi pengukuran per batch size
+
+
+def build_features(n: int) -> np.ndarray:
+    """Feature matrix realistis: semua kandidat valid tiap furniture type, diulang sampai n baris"""
+    rows = []
+    for name, data in AILayoutService.FURNITURE_CATALOG.items():
+        xs, ys, static = AILayoutService.feasibility_map(data["zone"], data["panjang"], data["lebar"])
+        ix, iy = np.nonzero(static)
+        if len(ix):
+            rows.append(AILayoutService.calculate_feature_matrix(
+                xs[ix], ys[iy], data["panjang"], data["lebar"], data["zone"], [], name
+            ))
+    X = np.vstack(rows)
+    return X[np.random.default_rng(42).permutation(np.resize(np.arange(len(X)), n))]
+
+
+def time_per_call(predict, X: np.ndarray) -> float:
+    """Rata-rata ms per predict call (diulang sampai MIN_SECONDS)"""
+    predict(X)  # warmup
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        predict(X)
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= MIN_SECONDS:
+            return elapsed / calls * 1000
+
+
+def main():
+    model_path = sys.argv[1] if len(sys.argv) > 1 else os.path.join(
+        "app", "services", "furniture_layout_model.pkl"
+    )
+    with open(model_path, "rb") as f:
+        model = pickle.load(f)
+
+    start = time.perf_counter()
+    compiled = CompiledForest.from_sklearn(model)
+    compile_ms = (time.perf_counter() - start) * 1000
+
+    print(f"\n🌲 Model: {model_path}")
+    print(f"   Trees: {compiled.n_trees}, nodes: {compiled.n_nodes}, max depth: {compiled.max_depth}")
+    print(f"   Compile: {compile_ms:.1f}ms")
+    print(f"   Memory: sklearn {ModelRegistry.estimate_nbytes(model) / 1024 / 1024:.2f} MB"
+          f" -> compiled {compiled.nbytes / 1024 / 1024:.2f} MB")
+
+    X_all = build_features(max(BATCH_SIZES))
+
+    print(f"\n{'batch':>8} {'sklearn':>12} {'compiled':>12} {'speedup':>9}  identical")
+    for n in BATCH_SIZES:
+        X = X_all[:n]
+        identical = np.array_equal(model.predict(X), compiled.predict(X))
+        sklearn_ms = time_per_call(model.predict, X)
+        compiled_ms = time_per_call(compiled.predict, X)
+        print(f"{n:>8} {sklearn_ms:>10.3f}ms {compiled_ms:>10.3f}ms "
+              f"{sklearn_ms / compiled_ms:>8.1f}x  {'✅' if identical else '❌'}")
+
+
+if __name__ == "__main__":
+    main()
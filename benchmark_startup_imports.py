@@ -0,0 +1,86 @@
+"""
+Benchmark: import time saat startup (python -X importtime) per entry point
+Route non-layout (news, CMS, FAQ, contact) tidak boleh meng-import NumPy / pandas / sklearn:
+stack ilmiah baru di-import saat endpoint /api/layout/* pertama kali dipakai
+
+Usage: python benchmark_startup_imports.py [--top N]
+Exit code 1 jika modul berat ter-import di entry point yang seharusnya ringan
+"""
+
+import json
+import os
+import subprocess
+import sys
+
+HEAVY_MODULES = ["numpy", "pandas", "sklearn", "scipy", "joblib"]
+TOP_N = 10
+
+# name -> (kode yang dijalankan, env tambahan, boleh import modul berat)
+SCENARIOS = {
+    "routes.api": ("import routes.api", {}, False),
+    "vercel /api/news": (
+        "import api.index; api.index.app.test_client().get('/api/news')",
+        {"VERCEL": "1", "WARMUP": "0"}, False
+    ),
+    "layout services": (
+        "import app.services.AILayoutService, app.services.LayoutService", {}, True
+    ),
+}
+
+
+def parse_importtime(stderr: str):
+    """Baris 'import time: self | cumulative | module' -> list (module, depth, self_us, cumulative_us)"""
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, module = line[len("import time:"):].split("|", 2)
+        depth = (len(module) - len(module.lstrip()) - 1) // 2  # Indent 2 spasi per level nested import
+        rows.append((module.strip(), depth, int(self_us), int(cumulative_us)))
+    return rows
+
+
+def profile(code: str, env: dict):
+    """Jalankan code di interpreter baru, return (rows importtime, modul berat yang ter-load)"""
+    probe = f"{code}\nimport sys, json\nprint(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", probe],
+        capture_output=True, text=True, env=dict(os.environ, **env),
+        cwd=os.path.dirname(os.path.abspath(__file__))
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip().splitlines()[-1])
+    heavy = json.loads(result.stdout.strip().splitlines()[-1])
+    return parse_importtime(result.stderr), heavy
+
+
+def main():
+    top = int(sys.argv[sys.argv.index("--top") + 1]) if "--top" in sys.argv else TOP_N
+    ok = True
+
+    for name, (code, env, heavy_allowed) in SCENARIOS.items():
+        rows, heavy = profile(code, env)
+        total_ms = sum(row[2] for row in rows) / 1000
+
+        print(f"\n📦 {name}: {len(rows)} modules, {total_ms:.1f}ms import time")
+        # Self time dijumlah per top-level package (flask, werkzeug, mysql, numpy, ...)
+        packages = {}
+        for module, _, self_us, _ in rows:
+            package = module.split(".")[0]
+            packages[package] = packages.get(package, 0) + self_us
+        for package, self_us in sorted(packages.items(), key=lambda item: item[1], reverse=True)[:top]:
+            print(f"   {self_us / 1000:8.1f}ms  {package}")
+
+        if heavy_allowed:
+            print(f"   Heavy modules loaded: {', '.join(heavy) or '-'}")
+        elif heavy:
+            ok = False
+            print(f"   ❌ Heavy modules loaded: {', '.join(heavy)}")
+        else:
+            print(f"   ✅ No heavy modules ({', '.join(HEAVY_MODULES)})")
+
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,103 +1,127 @@
-"""
-Configuration file for Furniture Auto Layout
-"""
-import os
-from datetime import timedelta
-
-class Config:
-    """Base configuration"""
-    
-    # Flask settings
-    SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
-    DEBUG = False
-    TESTING = False
-    
-    # Model paths
-    BASE_DIR = os.path.abspath(os.path.dirname(__file__))
-    MODEL_PATH = os.path.join(BASE_DIR, 'model_auto_layout.pkl')
-    FEATURE_COLS_PATH = os.path.join(BASE_DIR, 'feature_columns.pkl')
-    METADATA_PATH = os.path.join(BASE_DIR, 'model_metadata.pkl')
-    
-    # Upload settings
-    UPLOAD_FOLDER = os.path.join(BASE_DIR, 'static', 'uploads')
-    NEWS_UPLOAD_FOLDER = os.path.join(BASE_DIR, 'static', 'uploads', 'news')
-    MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
-    ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp', 'csv', 'xlsx', 'xls'}
-    
-    # Database settings - Environment variables first, fallback to defaults
-    DB_HOST = os.environ.get('DB_HOST', "virtualign.my.id")
-    DB_USER = os.environ.get('DB_USER', "virtuali_virtualuser")
-    DB_PASSWORD = os.environ.get('DB_PASSWORD', "indra140603")
-    DB_NAME = os.environ.get('DB_NAME', "virtuali_virtualign")
-    DB_PORT = int(os.environ.get('DB_PORT', 3306))
-    
-    # Database settings - Local Development (Laragon) - Backup
-    # DB_HOST = "localhost"
-    # DB_USER = "root"
-    # DB_PASSWORD = ""
-    # DB_NAME = "virtualtour1"
-    # DB_PORT = 3306
-    
-    # Auth settings
-    ADMIN_USERNAME = "admin"
-    ADMIN_PASSWORD = "admin123"
-    
-    # Excel path
-    EXCEL_PATH = "LIST FURNITURE.xlsx"
-    
-    # Canvas settings
-    CANVAS_WIDTH = 800
-    CANVAS_HEIGHT = 800
-    CANVAS_PADDING = 50
-    MARGIN = 50  # Canvas margin for furniture placement
-    
-    # Collision detection
-    COLLISION_PADDING = 20
-    MAX_COLLISION_ATTEMPTS = 50
-    
-    # API settings
-    API_RATE_LIMIT = "100 per hour"
-    API_TIMEOUT = 30  # seconds
-    
-    # CORS settings
-    CORS_ORIGINS = ['http://localhost:3000', 'http://localhost:5000']
-    
-    # Session settings
-    SESSION_COOKIE_SECURE = False
-    SESSION_COOKIE_HTTPONLY = True
-    SESSION_COOKIE_SAMESITE = 'Lax'
-    PERMANENT_SESSION_LIFETIME = timedelta(hours=24)
-
-class DevelopmentConfig(Config):
-    """Development configuration"""
-    DEBUG = True
-    TESTING = False
-
-class ProductionConfig(Config):
-    """Production configuration"""
-    DEBUG = False
-    TESTING = False
-    SESSION_COOKIE_SECURE = True
-    
-    # Override with environment variables if available
-    SECRET_KEY = os.environ.get('SECRET_KEY') or 'prod-secret-key-please-change'
-
-class TestingConfig(Config):
-    """Testing configuration"""
-    DEBUG = True
-    TESTING = True
-    WTF_CSRF_ENABLED = False
-
-# Configuration dictionary
-config = {
-    'development': DevelopmentConfig,
-    'production': ProductionConfig,
-    'testing': TestingConfig,
-    'default': DevelopmentConfig
-}
-
-def get_config(env=None):
-    """Get configuration based on environment"""
-    if env is None:
-        env = os.environ.get('FLASK_ENV', 'development')
+"""
+Configuration file for Furniture Auto Layout
+"""
+import os
+from datetime import timedelta
+
+class Config:
+    """Base configuration"""
+    
+    # Flask settings
+    SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key-change-in-production'
+    DEBUG = False
+    TESTING = False
+    
+    # Model paths
+    BASE_DIR = os.path.abspath(os.path.dirname(__file__))
+    MODEL_PATH = os.path.join(BASE_DIR, 'model_auto_layout.pkl')
+    FEATURE_COLS_PATH = os.path.join(BASE_DIR, 'feature_columns.pkl')
+    METADATA_PATH = os.path.join(BASE_DIR, 'model_metadata.pkl')
+    # Serving artifact (manifest .json + arrays .npz, tanpa pickle) - dibuat oleh export_model_artifacts.py
+    MODEL_ARTIFACT_PATH = os.environ.get('MODEL_ARTIFACT_PATH', os.path.join(BASE_DIR, 'model_auto_layout.json'))
+    # Load model saat startup: artifact mmap -> page cache shared antar process (Gunicorn --preload: sebelum fork)
+    MODEL_PRELOAD = os.environ.get('MODEL_PRELOAD', '1') == '1'
+    # Warmup (model, feasibility maps, layout cache) sebelum menerima traffic - status di /api/status
+    # Default off di Vercel: cold start /api/news dkk tidak ikut bayar import NumPy + load model
+    WARMUP = os.environ.get('WARMUP', '0' if os.environ.get('VERCEL') else '1') == '1'
+    
+    # Layout result cache (auto-place) - LRU di memory + optional disk tier
+    LAYOUT_CACHE_SIZE = int(os.environ.get('LAYOUT_CACHE_SIZE', 128))
+    LAYOUT_CACHE_DIR = os.environ.get('LAYOUT_CACHE_DIR')  # None = memory only
+    
+    # Precomputed static feasibility maps (zone + obstacles per footprint)
+    FEASIBILITY_MAP_PATH = os.environ.get('FEASIBILITY_MAP_PATH', os.path.join(BASE_DIR, 'feasibility_maps.npz'))
+    
+    # Multi-start auto layout (process pool)
+    LAYOUT_WORKERS = int(os.environ.get('LAYOUT_WORKERS', os.cpu_count() or 1))
+    LAYOUT_MAX_RUNS = int(os.environ.get('LAYOUT_MAX_RUNS', 32))
+    
+    # Batas atas budget simulated annealing per request (ms), max_ms dari client di-clamp ke sini
+    LAYOUT_MAX_OPTIMIZE_MS = int(os.environ.get('LAYOUT_MAX_OPTIMIZE_MS', 2000))
+    # Batas atas budget constraint solver per request (node + ms)
+    SOLVER_MAX_NODES = int(os.environ.get('SOLVER_MAX_NODES', 200000))
+    SOLVER_MAX_MS = int(os.environ.get('SOLVER_MAX_MS', 5000))
+    
+    # Upload settings
+    UPLOAD_FOLDER = os.path.join(BASE_DIR, 'static', 'uploads')
+    NEWS_UPLOAD_FOLDER = os.path.join(BASE_DIR, 'static', 'uploads', 'news')
+    MAX_CONTENT_LENGTH = 16 * 1024 * 1024  # 16MB max file size
+    ALLOWED_EXTENSIONS = {'png', 'jpg', 'jpeg', 'gif', 'webp', 'csv', 'xlsx', 'xls'}
+    
+    # Database settings - Environment variables first, fallback to defaults
+    DB_HOST = os.environ.get('DB_HOST', "virtualign.my.id")
+    DB_USER = os.environ.get('DB_USER', "virtuali_virtualuser")
+    DB_PASSWORD = os.environ.get('DB_PASSWORD', "indra140603")
+    DB_NAME = os.environ.get('DB_NAME', "virtuali_virtualign")
+    DB_PORT = int(os.environ.get('DB_PORT', 3306))
+    
+    # Database settings - Local Development (Laragon) - Backup
+    # DB_HOST = "localhost"
+    # DB_USER = "root"
+    # DB_PASSWORD = ""
+    # DB_NAME = "virtualtour1"
+    # DB_PORT = 3306
+    
+    # Auth settings
+    ADMIN_USERNAME = "admin"
+    ADMIN_PASSWORD = "admin123"
+    
+    # Excel path
+    EXCEL_PATH = "LIST FURNITURE.xlsx"
+    
+    # Canvas settings
+    CANVAS_WIDTH = 800
+    CANVAS_HEIGHT = 800
+    CANVAS_PADDING = 50
+    MARGIN = 50  # Canvas margin for furniture placement
+    
+    # Collision detection
+    COLLISION_PADDING = 20
+    MAX_COLLISION_ATTEMPTS = 50
+    
+    # API settings
+    API_RATE_LIMIT = "100 per hour"
+    API_TIMEOUT = 30  # seconds
+    
+    # CORS settings
+    CORS_ORIGINS = ['http://localhost:3000', 'http://localhost:5000']
+    
+    # Session settings
+    SESSION_COOKIE_SECURE = False
+    SESSION_COOKIE_HTTPONLY = True
+    SESSION_COOKIE_SAMESITE = 'Lax'
+    PERMANENT_SESSION_LIFETIME = timedelta(hours=24)
+
+class DevelopmentConfig(Config):
+    """Development configuration"""
+    DEBUG = True
+    TESTING = False
+
+class ProductionConfig(Config):
+    """Production configuration"""
+    DEBUG = False
+    TESTING = False
+    SESSION_COOKIE_SECURE = True
+    
+    # Override with environment variables if available
+    SECRET_KEY = os.environ.get('SECRET_KEY') or 'prod-secret-key-please-change'
+
+class TestingConfig(Config):
+    """Testing configuration"""
+    DEBUG = True
+    TESTING = True
+    WTF_CSRF_ENABLED = False
+
+# Configuration dictionary
+config = {
+    'development': DevelopmentConfig,
+    'production': ProductionConfig,
+    'testing': TestingConfig,
+    'default': DevelopmentConfig
+}
+
+def get_config(env=None):
+    """Get configuration based on environment"""
+    if env is None:
+        env = os.environ.get('FLASK_ENV', 'development')
     return config.get(env, config['default'])
\ No newline at end of file
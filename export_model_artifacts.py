@@ -0,0 +1,109 @@
+"""
+Export model .pkl -> serving artifact (manifest .json + arrays .npz, tanpa pickle saat serving)
+Jalankan sekali setelah training / sebelum deploy (Vercel, cPanel Passenger):
+
+    python export_model_artifacts.py
+
+- app/services/furniture_layout_model.pkl -> furniture_layout_model.json + .npz (AILayoutService)
+- model_auto_layout.pkl + feature_columns.pkl + model_metadata.pkl -> model_auto_layout.json + .npz (LayoutService)
+- Feasibility maps catalog AutoLayoutService + AILayoutService -> Config.FEASIBILITY_MAP_PATH (di-load saat miss pertama)
+Prediksi artifact dicek bit-identical dengan model sklearn sebelum dianggap berhasil
+"""
+
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from config import Config
+from app.services.AILayoutService import AILayoutService
+from app.services.AutoLayoutService import AutoLayoutService
+from app.services.CompiledForest import CompiledForest
+from app.services.FeasibilityMap import FeasibilityMap
+from app.services.LayoutFeatures import LayoutFeatures
+from app.services.ModelArtifact import ModelArtifact
+
+AI_MODEL_PATH = os.path.join(Config.BASE_DIR, "app", "services", "furniture_layout_model.pkl")
+AI_METRICS_PATH = os.path.join(Config.BASE_DIR, "app", "services", "model_metrics.json")
+
+
+def load_pickle(path: str):
+    import joblib
+    return joblib.load(path)
+
+
+def verify(model, artifact_path: str, n_features: int, low: float, high: float) -> bool:
+    """Bandingkan predict sklearn vs artifact (memory-mapped) di input random"""
+    X = np.random.default_rng(0).uniform(low, high, size=(2000, n_features))
+    forest = ModelArtifact.load(artifact_path)
+    if hasattr(model, "feature_names_in_"):
+        import pandas as pd
+        expected = model.predict(pd.DataFrame(X, columns=model.feature_names_in_))
+    else:
+        expected = model.predict(X)
+    return np.array_equal(expected, forest.predict(X))
+
+
+def export(model_path: str, artifact_path: str, feature_columns, metadata,
+           low: float, high: float) -> bool:
+    if not os.path.exists(model_path):
+        print(f"⏭️  Skip {model_path} (not found)")
+        return True
+
+    start = time.perf_counter()
+    model = load_pickle(model_path)
+    unpickle_ms = (time.perf_counter() - start) * 1000
+
+    manifest = ModelArtifact.save(
+        CompiledForest.from_sklearn(model), artifact_path,
+        feature_columns=feature_columns, metadata=metadata,
+        source=os.path.basename(model_path)
+    )
+
+    start = time.perf_counter()
+    ModelArtifact.load(artifact_path)
+    load_ms = (time.perf_counter() - start) * 1000
+
+    identical = verify(model, artifact_path, manifest["model"]["n_features"], low, high)
+    print(f"   .pkl {os.path.getsize(model_path) / 1024 / 1024:.2f} MB, unpickle {unpickle_ms:.1f}ms"
+          f" -> artifact {manifest['arrays_bytes'] / 1024 / 1024:.2f} MB, load {load_ms:.1f}ms")
+    print(f"   Predictions identical: {'✅' if identical else '❌'}")
+    return identical
+
+
+def export_feasibility_maps() -> int:
+    """Build ulang (tanpa isi file lama) feasibility maps default config, simpan ke Config.FEASIBILITY_MAP_PATH"""
+    FeasibilityMap.clear(autoload=False)
+    AutoLayoutService.precompute_feasibility()
+    for data in AILayoutService.FURNITURE_CATALOG.values():
+        AILayoutService.feasibility_map(data["zone"], data["panjang"], data["lebar"])
+    return FeasibilityMap.save(Config.FEASIBILITY_MAP_PATH)
+
+
+def main():
+    metrics = {}
+    if os.path.exists(AI_METRICS_PATH):
+        with open(AI_METRICS_PATH) as f:
+            metrics = json.load(f)
+
+    ok = export(
+        AI_MODEL_PATH, AI_MODEL_PATH,
+        feature_columns=LayoutFeatures.FEATURE_NAMES, metadata=metrics, low=-1.0, high=17.0
+    )
+
+    feature_columns = load_pickle(Config.FEATURE_COLS_PATH) if os.path.exists(Config.FEATURE_COLS_PATH) else None
+    metadata = load_pickle(Config.METADATA_PATH) if os.path.exists(Config.METADATA_PATH) else {}
+    ok &= export(
+        Config.MODEL_PATH, Config.MODEL_ARTIFACT_PATH,
+        feature_columns=list(feature_columns) if feature_columns is not None else None,
+        metadata=metadata, low=0.0, high=500.0
+    )
+
+    export_feasibility_maps()
+    sys.exit(0 if ok else 1)
+
+
+if __name__ == "__main__":
+    main()
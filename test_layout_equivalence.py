@@ -0,0 +1,165 @@
+"""
+Equivalence Testing untuk optimasi layout
+Bukti bahwa jalur cepat memberi hasil yang sama dengan jalur referensi di input random:
+- CompiledForest / ModelArtifact (numpy, mmap) vs predict sklearn
+- OccupancyGrid vs pairwise check_collision (status per kandidat dan placement lengkap)
+
+Usage: python test_layout_equivalence.py (tidak butuh server / database)
+"""
+import os
+import random
+import tempfile
+import unittest
+
+import numpy as np
+
+from app.services.AutoLayoutService import AutoLayoutService
+from app.services.CompiledForest import CompiledForest
+from app.services.ModelArtifact import ModelArtifact
+from app.services.OccupancyGrid import OccupancyGrid
+
+
+class CompiledForestEquivalenceTest(unittest.TestCase):
+    """CompiledForest dan artifact .json/.npz harus identik dengan sklearn"""
+
+    N_SAMPLES = 2000
+
+    @classmethod
+    def setUpClass(cls):
+        from sklearn.ensemble import RandomForestRegressor
+        from sklearn.tree import DecisionTreeRegressor
+
+        rng = np.random.default_rng(0)
+        X = rng.uniform(-5.0, 20.0, size=(3000, 6))
+        y = np.column_stack([X[:, 0] * 2 + np.sin(X[:, 1]), X[:, 2] - X[:, 3] ** 2 / 10])
+        cls.models = {
+            "forest (2 outputs)": RandomForestRegressor(n_estimators=20, random_state=0).fit(X, y),
+            "forest (1 output)": RandomForestRegressor(n_estimators=10, max_depth=8,
+                                                       random_state=0).fit(X, y[:, 0]),
+            "tree": DecisionTreeRegressor(random_state=0).fit(X, y),
+        }
+        cls.rng = rng
+
+    def random_inputs(self, model):
+        """Sampel uniform + sampel tepat di threshold split (kasus float32 rounding)"""
+        X = self.rng.uniform(-10.0, 25.0, size=(self.N_SAMPLES, model.n_features_in_))
+        estimators = getattr(model, "estimators_", None) or [model]
+        tree = estimators[0].tree_
+        internal = np.flatnonzero(tree.children_left != -1)[:self.N_SAMPLES]
+        X[np.arange(len(internal)), tree.feature[internal]] = tree.threshold[internal]
+        return X
+
+    def test_compiled_forest_matches_sklearn(self):
+        for name, model in self.models.items():
+            with self.subTest(model=name):
+                X = self.random_inputs(model)
+                np.testing.assert_array_equal(CompiledForest.from_sklearn(model).predict(X),
+                                              model.predict(X))
+
+    def test_artifact_roundtrip_matches_sklearn(self):
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            for index, (name, model) in enumerate(self.models.items()):
+                path = os.path.join(tmp_dir, f"model_{index}.json")
+                ModelArtifact.save(CompiledForest.from_sklearn(model), path)
+                X = self.random_inputs(model)
+                for mmap in (True, False):
+                    with self.subTest(model=name, mmap=mmap):
+                        forest = ModelArtifact.load(path, mmap=mmap)
+                        np.testing.assert_array_equal(forest.predict(X), model.predict(X))
+                        del forest  # Lepas mmap sebelum temp dir dihapus (Windows)
+
+    def test_exported_models_match_pickles(self):
+        """Model .pkl + artifact hasil export_model_artifacts.py (skip jika belum di-export)"""
+        from config import Config
+        from export_model_artifacts import AI_MODEL_PATH, load_pickle, verify
+
+        pairs = [(AI_MODEL_PATH, AI_MODEL_PATH, -1.0, 17.0),
+                 (Config.MODEL_PATH, Config.MODEL_ARTIFACT_PATH, 0.0, 500.0)]
+        for model_path, artifact_path, low, high in pairs:
+            json_path, _ = ModelArtifact.paths(artifact_path)
+            if not (os.path.exists(model_path) and os.path.exists(json_path)):
+                continue
+            with self.subTest(model=os.path.basename(model_path)):
+                model = load_pickle(model_path)
+                self.assertTrue(verify(model, artifact_path, model.n_features_in_, low, high))
+
+
+class OccupancyGridEquivalenceTest(unittest.TestCase):
+    """OccupancyGrid tidak boleh mengubah keputusan collision dibanding pairwise check"""
+
+    TRIALS = 40
+
+    @staticmethod
+    def pairwise_collides(x, y, w, h, items, spacing):
+        return any(
+            AutoLayoutService.check_collision(x, y, w, h, item["x"], item["y"],
+                                              item["panjang"], item["lebar"], spacing=spacing)
+            for item in items
+        )
+
+    @staticmethod
+    def random_items(rng, room_width, room_height, count):
+        items = []
+        for _ in range(count):
+            w, h = rng.uniform(0.3, 3.0), rng.uniform(0.3, 3.0)
+            items.append({"x": rng.uniform(-0.5, room_width - w + 0.5),
+                          "y": rng.uniform(-0.5, room_height - h + 0.5),
+                          "panjang": w, "lebar": h})
+        return items
+
+    def test_status_consistent_with_pairwise(self):
+        """FREE -> tidak ada collision, BLOCKED -> pasti collision (padding seperti placement loop)"""
+        rng = random.Random(0)
+        for trial in range(self.TRIALS):
+            room_width, room_height = rng.uniform(5.0, 17.0), rng.uniform(4.0, 11.0)
+            spacing = rng.choice([0.25, 0.4, 0.6, 0.8])
+            items = self.random_items(rng, room_width, room_height, rng.randint(1, 8))
+            grid = OccupancyGrid(room_width, room_height)
+            grid.mark_items(items)
+
+            w, h = rng.uniform(0.3, 3.0), rng.uniform(0.3, 3.0)
+            xs = np.round(np.arange(0.0, room_width - w, 0.1), 2)
+            ys = np.round(np.arange(0.0, room_height - h, 0.1), 2)
+            statuses = grid.status_grid(xs, ys, w, h, spacing, spacing * 0.5)
+            for i, x in enumerate(xs.tolist()):
+                for j, y in enumerate(ys.tolist()):
+                    status = grid.status(x, y, w, h, spacing, spacing * 0.5)
+                    self.assertEqual(status, statuses[i, j], f"trial {trial}: status_grid != status")
+                    if status == OccupancyGrid.UNKNOWN:
+                        continue
+                    collides = self.pairwise_collides(x, y, w, h, items, spacing)
+                    self.assertEqual(collides, status == OccupancyGrid.BLOCKED,
+                                     f"trial {trial}: ({x}, {y}, {w:.2f}x{h:.2f}) status {status}")
+
+    def test_placements_identical(self):
+        """place_furniture_optimized dengan dan tanpa occupancy -> posisi identik"""
+        rng = random.Random(1)
+        sizes = [round(0.4 + 0.2 * i, 1) for i in range(12)]
+        zones = list(AutoLayoutService.ZONES)
+        for trial in range(self.TRIALS):
+            room_width, room_height = rng.choice([(17.0, 11.0), (12.0, 9.0), (8.0, 6.0)])
+            config = AutoLayoutService.DEFAULT_CONFIG.with_spacing(rng.choice([0.25, 0.4, 0.6]))
+            furniture = [
+                (f"item_{index}", {"zone": rng.choice(zones), "panjang": rng.choice(sizes),
+                                   "lebar": rng.choice(sizes)})
+                for index in range(rng.randint(4, 12))
+            ]
+
+            placed_grid, placed_pairwise = [], []
+            occupancy = OccupancyGrid(room_width, room_height)
+            for name, data in furniture:
+                with_grid = AutoLayoutService.place_furniture_optimized(
+                    name, data, placed_grid, room_width, room_height, occupancy, config
+                )
+                without_grid = AutoLayoutService.place_furniture_optimized(
+                    name, data, placed_pairwise, room_width, room_height, None, config
+                )
+                self.assertEqual(with_grid, without_grid, f"trial {trial}: {name} {data}")
+                if with_grid:
+                    placed_grid.append(with_grid)
+                    placed_pairwise.append(without_grid)
+                    occupancy.mark(with_grid["x"], with_grid["y"], with_grid["panjang"], with_grid["lebar"])
+
+
+if __name__ == "__main__":
+    unittest.main(verbosity=2)
@@ -1,354 +1,335 @@
-"""
-Auto Layout AI Training Script - Target 96.3% Success Rate
-Generates optimized model.pkl for production use
-"""
-
-import numpy as np
-import pandas as pd
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
-from sklearn.metrics import accuracy_score, classification_report
-import pickle
-import json
-import os
-from datetime import datetime
-
-class AutoLayoutTrainer:
-    """Training system untuk generate model dengan 96.3% accuracy"""
-    
-    def __init__(self):
-        self.model = None
-        self.scaler = StandardScaler()
-        
-        # Furniture catalog - OPTIMIZED (27 items total)
-        self.FURNITURE_CATALOG = {
-            "SOFA 3 Seat": {"panjang": 2.6, "lebar": 1.0, "quantity": 2, "zone": "living", "priority": 1},
-            "SOFA 1 Seat Besar": {"panjang": 1.15, "lebar": 1.0, "quantity": 2, "zone": "living", "priority": 2},
-            "SOFA 1 Seat Kecil": {"panjang": 0.94, "lebar": 0.8, "quantity": 2, "zone": "living", "priority": 3},
-            "Meja Lingkaran Kecil": {"panjang": 0.5, "lebar": 0.5, "quantity": 2, "zone": "living", "priority": 5},
-            "Pas Bunga Small": {"panjang": 0.36, "lebar": 0.36, "quantity": 3, "zone": "decoration", "priority": 9},
-            "Pas Bunga Medium": {"panjang": 0.43, "lebar": 0.43, "quantity": 2, "zone": "decoration", "priority": 9},
-            "Pas Bunga Large": {"panjang": 0.6, "lebar": 0.6, "quantity": 1, "zone": "decoration", "priority": 9},
-            "Stand Lukisan": {"panjang": 0.82, "lebar": 0.72, "quantity": 2, "zone": "decoration", "priority": 8},
-            "Lukisan Kecil": {"panjang": 0.6, "lebar": 0.8, "quantity": 2, "zone": "decoration", "priority": 10},
-            "Lukisan Besar": {"panjang": 4.25, "lebar": 1.8, "quantity": 1, "zone": "decoration", "priority": 7},
-            "Meja Makan": {"panjang": 2.4, "lebar": 1.0, "quantity": 1, "zone": "dining", "priority": 1},
-            "Kursi Makan": {"panjang": 0.46, "lebar": 0.75, "quantity": 6, "zone": "dining", "priority": 2},
-            "Kursi Pantai": {"panjang": 0.8, "lebar": 2.0, "quantity": 1, "zone": "outdoor", "priority": 7}
-        }
-        
-        # Zone definitions (optimized)
-        self.ZONES = {
-            "living": {"x_min": 1.0, "x_max": 7.5, "y_min": 1.0, "y_max": 5.5},
-            "dining": {"x_min": 9.0, "x_max": 15.5, "y_min": 1.0, "y_max": 5.5},
-            "outdoor": {"x_min": 1.5, "x_max": 15.5, "y_min": 7.0, "y_max": 9.5},
-            "decoration": {"x_min": 1.0, "x_max": 16.0, "y_min": 1.0, "y_max": 10.0}
-        }
-        
-        self.MIN_SPACING = 0.6  # 60cm optimized spacing
-        self.WALL_MARGIN = 0.3  # 30cm from walls
-    
-    def generate_training_data(self, n_samples=10000):
-        """
-        Generate synthetic training data with 96.3% success pattern
-        """
-        print(f"\n{'='*70}")
-        print("GENERATING TRAINING DATA - 96.3% SUCCESS PATTERN")
-        print(f"{'='*70}")
-        print(f"Samples to generate: {n_samples}")
-        
-        data = []
-        labels = []
-        
-        for i in range(n_samples):
-            if (i + 1) % 2000 == 0:
-                print(f"Progress: {i + 1}/{n_samples} samples...")
-            
-            # Random furniture selection
-            furniture_name = np.random.choice(list(self.FURNITURE_CATALOG.keys()))
-            furniture = self.FURNITURE_CATALOG[furniture_name]
-            
-            panjang = furniture["panjang"]
-            lebar = furniture["lebar"]
-            zone = furniture["zone"]
-            priority = furniture["priority"]
-            
-            # Get zone bounds
-            zone_info = self.ZONES[zone]
-            
-            # Random position within zone
-            x = np.random.uniform(
-                zone_info["x_min"] + self.WALL_MARGIN,
-                zone_info["x_max"] - self.WALL_MARGIN - panjang
-            )
-            y = np.random.uniform(
-                zone_info["y_min"] + self.WALL_MARGIN,
-                zone_info["y_max"] - self.WALL_MARGIN - lebar
-            )
-            
-            # Calculate features
-            room_width = 17.0
-            room_height = 11.0
-            
-            # Zone encoding
-            zone_encoding = {
-                "living": 0, "dining": 1, "outdoor": 2, "decoration": 3
-            }
-            zone_code = zone_encoding.get(zone, 0)
-            
-            # Distance to center
-            center_x = room_width / 2
-            center_y = room_height / 2
-            dist_to_center = np.sqrt((x - center_x)**2 + (y - center_y)**2)
-            
-            # Distance to zone center
-            zone_center_x = (zone_info["x_min"] + zone_info["x_max"]) / 2
-            zone_center_y = (zone_info["y_min"] + zone_info["y_max"]) / 2
-            dist_to_zone_center = np.sqrt((x - zone_center_x)**2 + (y - zone_center_y)**2)
-            
-            # Distance to walls
-            dist_to_left = x - zone_info["x_min"]
-            dist_to_right = zone_info["x_max"] - (x + panjang)
-            dist_to_top = y - zone_info["y_min"]
-            dist_to_bottom = zone_info["y_max"] - (y + lebar)
-            min_wall_dist = min(dist_to_left, dist_to_right, dist_to_top, dist_to_bottom)
-            
-            # Area utilization
-            furniture_area = panjang * lebar
-            zone_area = (zone_info["x_max"] - zone_info["x_min"]) * (zone_info["y_max"] - zone_info["y_min"])
-            area_ratio = furniture_area / zone_area
-            
-            # Aspect ratio
-            aspect_ratio = panjang / lebar if lebar > 0 else 1.0
-            
-            # Features vector
-            features = [
-                panjang,                # 0: furniture length
-                lebar,                  # 1: furniture width
-                x,                      # 2: position x
-                y,                      # 3: position y
-                zone_code,              # 4: zone encoding
-                priority,               # 5: placement priority
-                dist_to_center,         # 6: distance to room center
-                dist_to_zone_center,    # 7: distance to zone center
-                min_wall_dist,          # 8: minimum wall distance
-                area_ratio,             # 9: area utilization ratio
-                aspect_ratio,           # 10: furniture aspect ratio
-                furniture_area,         # 11: total furniture area
-                room_width,             # 12: room width
-                room_height             # 13: room height
-            ]
-            
-            # Label: Success or Failure (96.3% success rate pattern)
-            # Success criteria:
-            # 1. Good wall distance (> 0.3m)
-            # 2. Within zone bounds
-            # 3. Not too far from zone center
-            # 4. Reasonable area ratio
-            
-            success_score = 0
-            
-            if min_wall_dist >= self.WALL_MARGIN:
-                success_score += 25
-            
-            if dist_to_zone_center < 3.0:  # Within 3m of zone center
-                success_score += 25
-            
-            if area_ratio < 0.15:  # Not taking too much space
-                success_score += 25
-            
-            if priority <= 5:  # High priority items
-                success_score += 15
-            
-            if aspect_ratio < 3.0:  # Reasonable shape
-                success_score += 10
-            
-            # 96.3% success rate: most placements are successful
-            random_factor = np.random.random() * 100
-            if success_score >= 70 or random_factor < 96.3:
-                label = 1  # Success
-            else:
-                label = 0  # Failure
-            
-            data.append(features)
-            labels.append(label)
-        
-        # Convert to numpy arrays
-        X = np.array(data)
-        y = np.array(labels)
-        
-        success_rate = (np.sum(y) / len(y)) * 100
-        print(f"\nGenerated data success rate: {success_rate:.2f}%")
-        print(f"Total samples: {len(X)}")
-        print(f"Successful placements: {np.sum(y)}")
-        print(f"Failed placements: {len(y) - np.sum(y)}")
-        
-        return X, y
-    
-    def train_model(self, X, y):
-        """
-        Train Random Forest model for optimal 96.3% accuracy
-        """
-        print(f"\n{'='*70}")
-        print("TRAINING MODEL")
-        print(f"{'='*70}")
-        
-        # Split data
-        X_train, X_test, y_train, y_test = train_test_split(
-            X, y, test_size=0.2, random_state=42, stratify=y
-        )
-        
-        print(f"Training samples: {len(X_train)}")
-        print(f"Testing samples: {len(X_test)}")
-        
-        # Scale features
-        print("\nScaling features...")
-        X_train_scaled = self.scaler.fit_transform(X_train)
-        X_test_scaled = self.scaler.transform(X_test)
-        
-        # Train Random Forest with optimized parameters
-        print("\nTraining Random Forest Classifier...")
-        self.model = RandomForestClassifier(
-            n_estimators=200,           # More trees for stability
-            max_depth=20,                # Deep enough for patterns
-            min_samples_split=5,         # Prevent overfitting
-            min_samples_leaf=2,
-            max_features='sqrt',
-            random_state=42,
-            n_jobs=-1,
-            class_weight='balanced'      # Handle any imbalance
-        )
-        
-        self.model.fit(X_train_scaled, y_train)
-        
-        # Predictions
-        print("\nEvaluating model...")
-        y_pred_train = self.model.predict(X_train_scaled)
-        y_pred_test = self.model.predict(X_test_scaled)
-        
-        # Metrics
-        train_accuracy = accuracy_score(y_train, y_pred_train)
-        test_accuracy = accuracy_score(y_test, y_pred_test)
-        
-        print(f"\n{'='*70}")
-        print("MODEL PERFORMANCE")
-        print(f"{'='*70}")
-        print(f"Training Accuracy: {train_accuracy*100:.2f}%")
-        print(f"Testing Accuracy:  {test_accuracy*100:.2f}%")
-        print(f"\nClassification Report (Test Set):")
-        print(classification_report(y_test, y_pred_test, target_names=['Failure', 'Success']))
-        
-        # Feature importance
-        feature_names = [
-            'panjang', 'lebar', 'pos_x', 'pos_y', 'zone', 'priority',
-            'dist_center', 'dist_zone_center', 'min_wall_dist',
-            'area_ratio', 'aspect_ratio', 'furniture_area',
-            'room_width', 'room_height'
-        ]
-        
-        importances = self.model.feature_importances_
-        indices = np.argsort(importances)[::-1]
-        
-        print(f"\nTop 10 Feature Importances:")
-        for i in range(min(10, len(indices))):
-            idx = indices[i]
-            print(f"  {i+1}. {feature_names[idx]}: {importances[idx]:.4f}")
-        
-        return test_accuracy
-    
-    def save_model(self, filename='model_auto_layout_96percent.pkl'):
-        """
-        Save trained model and scaler
-        """
-        print(f"\n{'='*70}")
-        print("SAVING MODEL")
-        print(f"{'='*70}")
-        
-        model_data = {
-            'model': self.model,
-            'scaler': self.scaler,
-            'feature_names': [
-                'panjang', 'lebar', 'pos_x', 'pos_y', 'zone', 'priority',
-                'dist_center', 'dist_zone_center', 'min_wall_dist',
-                'area_ratio', 'aspect_ratio', 'furniture_area',
-                'room_width', 'room_height'
-            ],
-            'furniture_catalog': self.FURNITURE_CATALOG,
-            'zones': self.ZONES,
-            'config': {
-                'min_spacing': self.MIN_SPACING,
-                'wall_margin': self.WALL_MARGIN,
-                'target_accuracy': 96.3,
-                'total_furniture': 27
-            },
-            'metadata': {
-                'trained_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-                'n_estimators': 200,
-                'max_depth': 20,
-                'version': '1.0'
-            }
-        }
-        
-        with open(filename, 'wb') as f:
-            pickle.dump(model_data, f)
-        
-        file_size = os.path.getsize(filename) / (1024 * 1024)  # MB
-        print(f"✅ Model saved: {filename}")
-        print(f"   File size: {file_size:.2f} MB")
-        
-        # Also save metadata as JSON
-        metadata_file = filename.replace('.pkl', '_metadata.json')
-        metadata = {
-            'trained_date': model_data['metadata']['trained_date'],
-            'target_accuracy': 96.3,
-            'total_furniture': 27,
-            'feature_count': len(model_data['feature_names']),
-            'model_type': 'RandomForestClassifier',
-            'n_estimators': 200,
-            'max_depth': 20
-        }
-        
-        with open(metadata_file, 'w') as f:
-            json.dump(metadata, f, indent=2)
-        
-        print(f"✅ Metadata saved: {metadata_file}")
-        
-        return filename
-
-
-def main():
-    """Main training pipeline"""
-    print("="*70)
-    print("AUTO LAYOUT AI TRAINING - 96.3% SUCCESS RATE")
-    print("="*70)
-    print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-    
-    # Initialize trainer
-    trainer = AutoLayoutTrainer()
-    
-    # Generate training data
-    X, y = trainer.generate_training_data(n_samples=10000)
-    
-    # Train model
-    test_accuracy = trainer.train_model(X, y)
-    
-    # Save model
-    model_file = trainer.save_model('model_auto_layout_96percent.pkl')
-    
-    # Final summary
-    print(f"\n{'='*70}")
-    print("TRAINING COMPLETE!")
-    print(f"{'='*70}")
-    print(f"✅ Final Test Accuracy: {test_accuracy*100:.2f}%")
-    print(f"✅ Model saved: {model_file}")
-    print(f"✅ Ready for production use!")
-    print(f"\nTo use in backend:")
-    print(f"  1. Copy {model_file} to app/services/")
-    print(f"  2. Load with: pickle.load(open('{model_file}', 'rb'))")
-    print(f"  3. Use model['model'].predict(features)")
-    print("="*70)
-
-
-if __name__ == "__main__":
-    main()
+"""
+Auto Layout AI Training Script - Target 96.3% Success Rate
+Generates optimized model.pkl for production use
+"""
+
+import numpy as np
+import pickle
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime
+
+from app.services.DatasetShards import DatasetShards
+
+# Maksimal sampel per shard dataset (jumlah shard tidak tergantung jumlah worker)
+SHARD_SIZE = 100000
+
+# Kolom feature matrix generate_shard (urutan sama dengan model yang disimpan)
+FEATURE_NAMES = [
+    'panjang', 'lebar', 'pos_x', 'pos_y', 'zone', 'priority',
+    'dist_center', 'dist_zone_center', 'min_wall_dist',
+    'area_ratio', 'aspect_ratio', 'furniture_area',
+    'room_width', 'room_height'
+]
+
+class AutoLayoutTrainer:
+    """Training system untuk generate model dengan 96.3% accuracy"""
+    
+    def __init__(self):
+        self.model = None
+        self.scaler = None  # StandardScaler, dibuat di train_model
+        
+        # Furniture catalog - OPTIMIZED (27 items total)
+        self.FURNITURE_CATALOG = {
+            "SOFA 3 Seat": {"panjang": 2.6, "lebar": 1.0, "quantity": 2, "zone": "living", "priority": 1},
+            "SOFA 1 Seat Besar": {"panjang": 1.15, "lebar": 1.0, "quantity": 2, "zone": "living", "priority": 2},
+            "SOFA 1 Seat Kecil": {"panjang": 0.94, "lebar": 0.8, "quantity": 2, "zone": "living", "priority": 3},
+            "Meja Lingkaran Kecil": {"panjang": 0.5, "lebar": 0.5, "quantity": 2, "zone": "living", "priority": 5},
+            "Pas Bunga Small": {"panjang": 0.36, "lebar": 0.36, "quantity": 3, "zone": "decoration", "priority": 9},
+            "Pas Bunga Medium": {"panjang": 0.43, "lebar": 0.43, "quantity": 2, "zone": "decoration", "priority": 9},
+            "Pas Bunga Large": {"panjang": 0.6, "lebar": 0.6, "quantity": 1, "zone": "decoration", "priority": 9},
+            "Stand Lukisan": {"panjang": 0.82, "lebar": 0.72, "quantity": 2, "zone": "decoration", "priority": 8},
+            "Lukisan Kecil": {"panjang": 0.6, "lebar": 0.8, "quantity": 2, "zone": "decoration", "priority": 10},
+            "Lukisan Besar": {"panjang": 4.25, "lebar": 1.8, "quantity": 1, "zone": "decoration", "priority": 7},
+            "Meja Makan": {"panjang": 2.4, "lebar": 1.0, "quantity": 1, "zone": "dining", "priority": 1},
+            "Kursi Makan": {"panjang": 0.46, "lebar": 0.75, "quantity": 6, "zone": "dining", "priority": 2},
+            "Kursi Pantai": {"panjang": 0.8, "lebar": 2.0, "quantity": 1, "zone": "outdoor", "priority": 7}
+        }
+        
+        # Zone definitions (optimized)
+        self.ZONES = {
+            "living": {"x_min": 1.0, "x_max": 7.5, "y_min": 1.0, "y_max": 5.5},
+            "dining": {"x_min": 9.0, "x_max": 15.5, "y_min": 1.0, "y_max": 5.5},
+            "outdoor": {"x_min": 1.5, "x_max": 15.5, "y_min": 7.0, "y_max": 9.5},
+            "decoration": {"x_min": 1.0, "x_max": 16.0, "y_min": 1.0, "y_max": 10.0}
+        }
+        
+        self.MIN_SPACING = 0.6  # 60cm optimized spacing
+        self.WALL_MARGIN = 0.3  # 30cm from walls
+    
+    def generate_training_data(self, n_samples=10000, seed=None, workers=None, out_dir=None):
+        """
+        Generate synthetic training data with 96.3% success pattern
+        Sharded (SHARD_SIZE sampel per shard) di process pool, bit-identical untuk seed yang sama
+        berapapun jumlah workers; shard .npz + manifest disimpan di out_dir (None = temporary)
+        """
+        print(f"\n{'='*70}")
+        print("GENERATING TRAINING DATA - 96.3% SUCCESS PATTERN")
+        print(f"{'='*70}")
+        print(f"Samples to generate: {n_samples}")
+        
+        tasks = [{"n_samples": count} for count in DatasetShards.split(n_samples, SHARD_SIZE)]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            directory = out_dir or tmp_dir
+            DatasetShards.generate(
+                self.generate_shard, tasks, directory,
+                seed=seed, workers=workers, name="auto_layout_training"
+            )
+            X, y = DatasetShards.load(directory, name="auto_layout_training", n_features=len(FEATURE_NAMES))
+        
+        success_rate = (np.sum(y) / len(y)) * 100 if len(y) else 0.0
+        print(f"\nGenerated data success rate: {success_rate:.2f}%")
+        print(f"Total samples: {len(X)}")
+        print(f"Successful placements: {np.sum(y)}")
+        print(f"Failed placements: {len(y) - np.sum(y)}")
+        
+        return X, y
+    
+    def generate_shard(self, rng, n_samples):
+        """
+        Satu shard training data (vectorized): random furniture + posisi dalam zone,
+        features dan label success dihitung untuk semua sampel sekaligus
+        """
+        names = list(self.FURNITURE_CATALOG.keys())
+        catalog = [self.FURNITURE_CATALOG[name] for name in names]
+        zone_encoding = {"living": 0, "dining": 1, "outdoor": 2, "decoration": 3}
+        
+        # Random furniture selection
+        index = rng.integers(0, len(names), n_samples)
+        panjang = np.array([f["panjang"] for f in catalog])[index]
+        lebar = np.array([f["lebar"] for f in catalog])[index]
+        priority = np.array([f["priority"] for f in catalog])[index]
+        zone_code = np.array([zone_encoding.get(f["zone"], 0) for f in catalog])[index]
+        
+        # Zone bounds per sampel
+        bounds = np.array([[self.ZONES[f["zone"]][key] for key in ("x_min", "x_max", "y_min", "y_max")]
+                           for f in catalog])[index]
+        x_min, x_max, y_min, y_max = bounds.T
+        
+        # Random position within zone (low + (high - low) * U seperti np.random.uniform:
+        # Kursi Pantai lebih lebar dari zone outdoor, high < low tetap diterima)
+        low_x, high_x = x_min + self.WALL_MARGIN, x_max - self.WALL_MARGIN - panjang
+        low_y, high_y = y_min + self.WALL_MARGIN, y_max - self.WALL_MARGIN - lebar
+        x = low_x + (high_x - low_x) * rng.random(n_samples)
+        y = low_y + (high_y - low_y) * rng.random(n_samples)
+        
+        # Calculate features
+        room_width = 17.0
+        room_height = 11.0
+        
+        # Distance to center
+        center_x = room_width / 2
+        center_y = room_height / 2
+        dist_to_center = np.sqrt((x - center_x)**2 + (y - center_y)**2)
+        
+        # Distance to zone center
+        zone_center_x = (x_min + x_max) / 2
+        zone_center_y = (y_min + y_max) / 2
+        dist_to_zone_center = np.sqrt((x - zone_center_x)**2 + (y - zone_center_y)**2)
+        
+        # Distance to walls
+        min_wall_dist = np.minimum.reduce([
+            x - x_min, x_max - (x + panjang), y - y_min, y_max - (y + lebar)
+        ])
+        
+        # Area utilization
+        furniture_area = panjang * lebar
+        zone_area = (x_max - x_min) * (y_max - y_min)
+        area_ratio = furniture_area / zone_area
+        
+        # Aspect ratio
+        aspect_ratio = np.divide(panjang, lebar, out=np.ones(n_samples), where=lebar > 0)
+        
+        # Features matrix (urutan kolom = FEATURE_NAMES)
+        X = np.column_stack([
+            panjang, lebar, x, y, zone_code, priority,
+            dist_to_center, dist_to_zone_center, min_wall_dist,
+            area_ratio, aspect_ratio, furniture_area,
+            np.full(n_samples, room_width), np.full(n_samples, room_height)
+        ])
+        
+        # Label: Success or Failure (96.3% success rate pattern)
+        # Success criteria: wall distance, dekat zone center, area ratio, priority, shape
+        success_score = (
+            25 * (min_wall_dist >= self.WALL_MARGIN) +
+            25 * (dist_to_zone_center < 3.0) +
+            25 * (area_ratio < 0.15) +
+            15 * (priority <= 5) +
+            10 * (aspect_ratio < 3.0)
+        )
+        
+        # 96.3% success rate: most placements are successful
+        random_factor = rng.random(n_samples) * 100
+        labels = ((success_score >= 70) | (random_factor < 96.3)).astype(int)
+        
+        return X, labels
+    
+    def train_model(self, X, y):
+        """
+        Train Random Forest model for optimal 96.3% accuracy
+        """
+        print(f"\n{'='*70}")
+        print("TRAINING MODEL")
+        print(f"{'='*70}")
+        
+        # sklearn hanya di-import saat training: worker DatasetShards (spawn) meng-import ulang
+        # script ini, generate_shard cukup NumPy
+        from sklearn.ensemble import RandomForestClassifier
+        from sklearn.model_selection import train_test_split
+        from sklearn.preprocessing import StandardScaler
+        from sklearn.metrics import accuracy_score, classification_report
+        
+        # Split data
+        X_train, X_test, y_train, y_test = train_test_split(
+            X, y, test_size=0.2, random_state=42, stratify=y
+        )
+        
+        print(f"Training samples: {len(X_train)}")
+        print(f"Testing samples: {len(X_test)}")
+        
+        # Scale features
+        print("\nScaling features...")
+        self.scaler = StandardScaler()
+        X_train_scaled = self.scaler.fit_transform(X_train)
+        X_test_scaled = self.scaler.transform(X_test)
+        
+        # Train Random Forest with optimized parameters
+        print("\nTraining Random Forest Classifier...")
+        self.model = RandomForestClassifier(
+            n_estimators=200,           # More trees for stability
+            max_depth=20,                # Deep enough for patterns
+            min_samples_split=5,         # Prevent overfitting
+            min_samples_leaf=2,
+            max_features='sqrt',
+            random_state=42,
+            n_jobs=-1,
+            class_weight='balanced'      # Handle any imbalance
+        )
+        
+        self.model.fit(X_train_scaled, y_train)
+        
+        # Predictions
+        print("\nEvaluating model...")
+        y_pred_train = self.model.predict(X_train_scaled)
+        y_pred_test = self.model.predict(X_test_scaled)
+        
+        # Metrics
+        train_accuracy = accuracy_score(y_train, y_pred_train)
+        test_accuracy = accuracy_score(y_test, y_pred_test)
+        
+        print(f"\n{'='*70}")
+        print("MODEL PERFORMANCE")
+        print(f"{'='*70}")
+        print(f"Training Accuracy: {train_accuracy*100:.2f}%")
+        print(f"Testing Accuracy:  {test_accuracy*100:.2f}%")
+        print(f"\nClassification Report (Test Set):")
+        print(classification_report(y_test, y_pred_test, target_names=['Failure', 'Success']))
+        
+        # Feature importance
+        feature_names = FEATURE_NAMES
+        
+        importances = self.model.feature_importances_
+        indices = np.argsort(importances)[::-1]
+        
+        print(f"\nTop 10 Feature Importances:")
+        for i in range(min(10, len(indices))):
+            idx = indices[i]
+            print(f"  {i+1}. {feature_names[idx]}: {importances[idx]:.4f}")
+        
+        return test_accuracy
+    
+    def save_model(self, filename='model_auto_layout_96percent.pkl'):
+        """
+        Save trained model and scaler
+        """
+        print(f"\n{'='*70}")
+        print("SAVING MODEL")
+        print(f"{'='*70}")
+        
+        model_data = {
+            'model': self.model,
+            'scaler': self.scaler,
+            'feature_names': list(FEATURE_NAMES),
+            'furniture_catalog': self.FURNITURE_CATALOG,
+            'zones': self.ZONES,
+            'config': {
+                'min_spacing': self.MIN_SPACING,
+                'wall_margin': self.WALL_MARGIN,
+                'target_accuracy': 96.3,
+                'total_furniture': 27
+            },
+            'metadata': {
+                'trained_date': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                'n_estimators': 200,
+                'max_depth': 20,
+                'version': '1.0'
+            }
+        }
+        
+        with open(filename, 'wb') as f:
+            pickle.dump(model_data, f)
+        
+        file_size = os.path.getsize(filename) / (1024 * 1024)  # MB
+        print(f"✅ Model saved: {filename}")
+        print(f"   File size: {file_size:.2f} MB")
+        
+        # Also save metadata as JSON
+        metadata_file = filename.replace('.pkl', '_metadata.json')
+        metadata = {
+            'trained_date': model_data['metadata']['trained_date'],
+            'target_accuracy': 96.3,
+            'total_furniture': 27,
+            'feature_count': len(model_data['feature_names']),
+            'model_type': 'RandomForestClassifier',
+            'n_estimators': 200,
+            'max_depth': 20
+        }
+        
+        with open(metadata_file, 'w') as f:
+            json.dump(metadata, f, indent=2)
+        
+        print(f"✅ Metadata saved: {metadata_file}")
+        
+        return filename
+
+
+def main():
+    """Main training pipeline"""
+    print("="*70)
+    print("AUTO LAYOUT AI TRAINING - 96.3% SUCCESS RATE")
+    print("="*70)
+    print(f"Started at: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+    
+    # Initialize trainer
+    trainer = AutoLayoutTrainer()
+    
+    # Generate training data: python train_auto_layout_96percent.py [n_samples] [seed] [workers]
+    n_samples = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    seed = int(sys.argv[2]) if len(sys.argv) > 2 else None
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else None
+    X, y = trainer.generate_training_data(n_samples=n_samples, seed=seed, workers=workers)
+    
+    # Train model
+    test_accuracy = trainer.train_model(X, y)
+    
+    # Save model
+    model_file = trainer.save_model('model_auto_layout_96percent.pkl')
+    
+    # Final summary
+    print(f"\n{'='*70}")
+    print("TRAINING COMPLETE!")
+    print(f"{'='*70}")
+    print(f"✅ Final Test Accuracy: {test_accuracy*100:.2f}%")
+    print(f"✅ Model saved: {model_file}")
+    print(f"✅ Ready for production use!")
+    print(f"\nTo use in backend:")
+    print(f"  1. Copy {model_file} to app/services/")
+    print(f"  2. Load with: pickle.load(open('{model_file}', 'rb'))")
+    print(f"  3. Use model['model'].predict(features)")
+    print("="*70)
+
+
+if __name__ == "__main__":
+    main()